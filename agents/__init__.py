@@ -1,62 +1,38 @@
-"""Agent implementations for different LLM providers."""
-from .base_agent import BaseAgent, AgentResponse
+"""
+Agent implementations for different LLM providers.
 
-# Paid APIs (optional - only import if packages are installed)
-try:
-    from .claude_agent import ClaudeAgent
-except ImportError:
-    ClaudeAgent = None
+Provider agents are imported lazily: ``from agents import ClaudeAgent`` only
+imports the Anthropic SDK at that point. A provider whose package is not
+installed resolves to None.
+"""
+from .base_agent import BaseAgent, AgentResponse, StreamEvent
+from .openai_compatible_agent import OpenAICompatibleAgent
+from .registry import AGENT_CLASSES, PROVIDERS, create_agent, load_agent_class
 
-try:
-    from .chatgpt_agent import ChatGPTAgent
-except ImportError:
-    ChatGPTAgent = None
 
-try:
-    from .gemini_agent import GeminiAgent
-except ImportError:
-    GeminiAgent = None
+def __getattr__(name):
+    """Import a provider agent class on first access."""
+    if name not in AGENT_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        agent_class = load_agent_class(AGENT_CLASSES[name])
+    except ImportError:
+        agent_class = None
+    globals()[name] = agent_class
+    return agent_class
 
-try:
-    from .mistral_agent import MistralAgent
-except ImportError:
-    MistralAgent = None
 
-# Free/Open Source Options
-try:
-    from .ollama_agent import OllamaAgent
-except ImportError:
-    OllamaAgent = None
+def __dir__():
+    return sorted(list(globals()) + list(AGENT_CLASSES))
 
-try:
-    from .groq_agent import GroqAgent
-except ImportError:
-    GroqAgent = None
-
-try:
-    from .huggingface_agent import HuggingFaceAgent
-except ImportError:
-    HuggingFaceAgent = None
-
-try:
-    from .deepseek_agent import DeepSeekAgent
-except ImportError:
-    DeepSeekAgent = None
-
-# Advanced Providers (optional)
-try:
-    from .openrouter_agent import OpenRouterAgent
-except ImportError:
-    OpenRouterAgent = None
-
-try:
-    from .comet_agent import CometAgent
-except ImportError:
-    CometAgent = None
 
 __all__ = [
     "BaseAgent",
     "AgentResponse",
+    "StreamEvent",
+    "OpenAICompatibleAgent",
+    "PROVIDERS",
+    "create_agent",
     "ClaudeAgent",
     "ChatGPTAgent",
     "GeminiAgent",
@@ -68,4 +44,3 @@ __all__ = [
     "OpenRouterAgent",
     "CometAgent",
 ]
-
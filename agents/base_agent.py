@@ -1,7 +1,17 @@
 """Base agent class for LLM Council."""
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, AsyncIterator, Set, Tuple
+
+from .retry import classify_error
+from .context_manager import ContextManager, get_default_context_manager
+from .model_info import count_tokens, get_max_output
+from config import Config
+
+
+# Opens a multi-turn user message that switches to new round instructions
+UPDATED_INSTRUCTIONS_HEADER = "Updated instructions:"
 
 
 @dataclass
@@ -12,11 +22,28 @@ class AgentResponse:
     model: str
     tokens_used: Optional[int] = None
     metadata: Optional[Dict] = None
+    round_num: Optional[int] = None
+    error: bool = False  # True when the provider call failed; content is the error message
+
+
+@dataclass
+class StreamEvent:
+    """
+    A chunk of a streamed agent response.
+    
+    Streams yield events carrying text deltas; the last event has ``response``
+    set to the fully assembled AgentResponse (and an empty delta).
+    """
+    delta: str = ""
+    response: Optional[AgentResponse] = None
 
 
 class BaseAgent(ABC):
     """Abstract base class for all LLM agents."""
     
+    # Provider identifier used for response caching and per-provider settings
+    provider: str = "custom"
+    
     def __init__(self, name: str, role: str, temperature: float = 0.7):
         """
         Initialize the agent.
@@ -30,6 +57,21 @@ class BaseAgent(ABC):
         self.role = role
         self.temperature = temperature
         self.conversation_history: List[Dict[str, str]] = []
+        # Overrides the shared, Config-driven context budget when set
+        self.context_manager: Optional[ContextManager] = None
+        # Keep a message history across rounds and send only new responses
+        # (set per debate by the council, see build_messages)
+        self.multi_turn: bool = False
+        # Output-token cap for the next calls; the council lowers it to fit
+        # a spend budget (None = Config.MAX_TOKENS)
+        self.max_tokens: Optional[int] = None
+        self._seen_responses: Set[Tuple[str, str]] = set()
+        # Equivalent backends (the same model through other providers) the
+        # council hedges slow calls to, in order of preference. With hedge
+        # False they form a fallback chain, only called when earlier
+        # backends fail or their circuit breakers are open.
+        self.backups: List["BaseAgent"] = []
+        self.hedge: bool = True
     
     @abstractmethod
     def generate_response(
@@ -50,17 +92,120 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def agenerate_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AgentResponse:
+        """
+        Async counterpart of generate_response.
+        
+        Agents whose SDK ships an async client override this with a native
+        implementation. The default runs the blocking call in a worker thread
+        so every agent can be awaited.
+        """
+        return await asyncio.to_thread(self.generate_response, prompt, context, round_num)
+    
+    def stream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> Iterator[StreamEvent]:
+        """
+        Stream a response as text deltas followed by the final AgentResponse.
+        
+        Agents with streaming APIs override this. The default generates the
+        full response and emits it as a single delta.
+        """
+        response = self.generate_response(prompt, context, round_num)
+        if not response.error:
+            yield StreamEvent(delta=response.content)
+        yield StreamEvent(response=response)
+    
+    async def astream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AsyncIterator[StreamEvent]:
+        """Async counterpart of stream_response."""
+        response = await self.agenerate_response(prompt, context, round_num)
+        if not response.error:
+            yield StreamEvent(delta=response.content)
+        yield StreamEvent(response=response)
+    
+    def request_fingerprint(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> Dict:
+        """Everything that determines this agent's completion for a request."""
+        fingerprint = {
+            "provider": self.provider,
+            "model": getattr(self, "model", None),
+            "temperature": self.temperature,
+            "max_tokens": self.output_token_limit()
+        }
+        if not self.multi_turn:
+            fingerprint["system_prompt"] = self.get_system_prompt(context, round_num)
+            fingerprint["prompt"] = prompt
+            return fingerprint
+        
+        messages = self.build_messages(prompt, context, round_num)
+        fingerprint["system_prompt"] = messages[0]["content"]
+        fingerprint["history"] = messages[1:-1]
+        fingerprint["prompt"] = messages[-1]["content"]
+        return fingerprint
+    
+    def output_token_limit(self) -> int:
+        """Maximum number of tokens to generate per call, within the model's output cap."""
+        return min(self.max_tokens or Config.MAX_TOKENS, get_max_output(getattr(self, "model", None)))
+    
+    def _error_response(self, error: Exception, **metadata) -> AgentResponse:
+        """Build the AgentResponse returned when a provider call fails."""
+        info = classify_error(error)
+        return AgentResponse(
+            agent_name=self.name,
+            content=f"Error generating response: {str(error)}",
+            model=getattr(self, "model", "unknown"),
+            metadata={
+                "error": str(error),
+                "error_type": type(error).__name__,
+                "status_code": info.status_code,
+                "retryable": info.retryable,
+                "retry_after": info.retry_after,
+                **metadata
+            },
+            error=True
+        )
+    
     def format_context(self, context: Optional[List[AgentResponse]]) -> str:
         """Format previous responses as context."""
         if not context:
             return ""
         
+        context = [response for response in context if not response.error]
+        if not context:
+            return ""
+        
         formatted = "\n\n--- Previous Responses ---\n"
         for response in context:
             formatted += f"\n{response.agent_name} ({response.model}):\n{response.content}\n"
         formatted += "\n--- End of Previous Responses ---\n"
         return formatted
     
+    def fit_context(
+        self,
+        context: Optional[List[AgentResponse]],
+        fixed_text: str = ""
+    ) -> Optional[List[AgentResponse]]:
+        """Trim previous responses so the prompt fits this agent's input-token budget."""
+        manager = self.context_manager or get_default_context_manager()
+        return manager.fit(context, getattr(self, "model", None), fixed_text, self.output_token_limit())
+    
     def add_to_history(self, role: str, content: str):
         """Add a message to conversation history."""
         self.conversation_history.append({
@@ -71,15 +216,114 @@ class BaseAgent(ABC):
     def clear_history(self):
         """Clear conversation history."""
         self.conversation_history = []
+        self._seen_responses = set()
     
-    def get_system_prompt(self, context: Optional[List[AgentResponse]] = None, round_num: int = 1) -> str:
-        """Get the system prompt for this agent."""
+    def _response_key(self, response: AgentResponse) -> Tuple[str, str]:
+        """Identify a response across cache copies and context lists."""
+        return response.agent_name, response.content
+    
+    def build_messages(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> List[Dict[str, str]]:
+        """
+        Chat messages for a request: a system message, then user/assistant turns.
+        
+        Single-turn (the default), this is the system prompt with the whole
+        context followed by the user prompt. In multi-turn mode the agent's
+        conversation_history is replayed unchanged and only the responses it
+        has not seen yet are sent, in a new user message ahead of the prompt.
+        The earlier turns then form a stable prefix the provider can serve
+        from its prompt cache. When the history no longer fits the context
+        budget, the conversation restarts from a single-turn prompt.
+        """
+        if not self.multi_turn:
+            return [
+                {"role": "system", "content": self.get_system_prompt(context, round_num)},
+                {"role": "user", "content": prompt}
+            ]
+        
+        instructions = self.get_instructions(round_num)
+        history = self.conversation_history
+        if history and not self._history_fits(history):
+            history = []
+        if not history:
+            context_prompt = self.get_context_prompt(context, instructions)
+            return [
+                {"role": "system", "content": instructions + context_prompt},
+                {"role": "user", "content": prompt}
+            ]
+        
+        # Instructions change once, from the initial round to the review rounds
+        turn = ""
+        if not self._instructions_sent(instructions):
+            turn += f"{UPDATED_INSTRUCTIONS_HEADER}\n\n{instructions}\n\n"
+        
+        new_responses = [
+            response for response in context or []
+            if self._response_key(response) not in self._seen_responses
+        ]
+        history_text = "".join(message["content"] for message in history)
+        turn += self.get_context_prompt(new_responses, history_text + turn).lstrip("\n")
+        if turn:
+            turn += "\n\n"
+        return history + [{"role": "user", "content": turn + prompt}]
+    
+    def record_turn(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        response: AgentResponse
+    ):
+        """
+        Append a completed exchange to the conversation history (multi-turn mode).
+        
+        Called by the council once the final response of a call is known, so
+        failed attempts and retries never enter the history.
+        """
+        if not self.multi_turn or response.error:
+            return
+        messages = self.build_messages(prompt, context, round_num)
+        self.conversation_history = messages + [{"role": "assistant", "content": response.content}]
+        if len(messages) == 2:
+            # A (re)started conversation has seen exactly the current context
+            self._seen_responses = set()
+        self._seen_responses.update(self._response_key(r) for r in context or [])
+        self._seen_responses.add(self._response_key(response))
+    
+    def _instructions_sent(self, instructions: str) -> bool:
+        """Whether the instructions currently in effect in the history are these."""
+        for message in reversed(self.conversation_history):
+            if message["role"] == "user" and message["content"].startswith(UPDATED_INSTRUCTIONS_HEADER):
+                return message["content"].startswith(f"{UPDATED_INSTRUCTIONS_HEADER}\n\n{instructions}")
+        return self.conversation_history[0]["content"].startswith(instructions)
+    
+    def _history_fits(self, history: List[Dict[str, str]]) -> bool:
+        """Whether the history leaves room for another turn within the context budget."""
+        manager = self.context_manager or get_default_context_manager()
+        model = getattr(self, "model", None)
+        history_tokens = sum(count_tokens(message["content"], model) for message in history)
+        # Keep at least a quarter of the budget for the responses of the next turn
+        return manager.budget(model, history_tokens) >= manager.budget(model) // 4
+    
+    def get_instructions(self, round_num: int = 1) -> str:
+        """
+        Static instructions opening the system prompt.
+        
+        Depends only on the agent and on whether this is the first round, so
+        it is byte-identical across calls and providers can serve it from
+        their prompt-prefix cache. Round-specific details belong in the user
+        prompt, after the context.
+        """
         if round_num == 1:
             base_prompt = f"""You are {self.name}, an expert AI participating in a council discussion.
 
 Your role: {self.role}
 
-Instructions for Round {round_num} (Initial Analysis):
+Instructions for Round 1 (Initial Analysis):
 1. Provide a thorough, well-researched analysis with technical depth
 2. **CITE SOURCES**: Include specific references, research papers, documentation links, or authoritative sources
 3. Use proper citations (e.g., "According to [Source], ..." or "Research shows [Reference] that...")
@@ -104,7 +348,7 @@ FORMAT YOUR RESPONSE AS:
 
 Your role: {self.role}
 
-Instructions for Round {round_num} (Critical Review & Cross-Checking):
+Instructions for Review Rounds (Critical Review & Cross-Checking):
 1. **VALIDATE SOURCES**: Review and verify references provided by other council members
 2. **CROSS-CHECK FACTS**: Identify any factual errors, outdated information, or broken logic
 3. **CHALLENGE ASSUMPTIONS**: Question weak arguments with counter-evidence and alternative sources
@@ -137,9 +381,21 @@ FORMAT YOUR RESPONSE AS:
 - [Source 1]: [URL or citation] - [Why this source is credible]
 - [Source 2]: [URL or citation] - [Why this source is credible]
 [Add more as needed]"""
-
-        if context:
-            base_prompt += "\n\n" + self.format_context(context)
-        
         return base_prompt
+    
+    def get_context_prompt(
+        self,
+        context: Optional[List[AgentResponse]],
+        instructions: str = ""
+    ) -> str:
+        """Previous responses appended after the instructions (empty without context)."""
+        if not context:
+            return ""
+        context = self.fit_context(context, instructions)
+        return "\n\n" + self.format_context(context)
+    
+    def get_system_prompt(self, context: Optional[List[AgentResponse]] = None, round_num: int = 1) -> str:
+        """Get the system prompt for this agent: static instructions, then the context."""
+        instructions = self.get_instructions(round_num)
+        return instructions + self.get_context_prompt(context, instructions)
 
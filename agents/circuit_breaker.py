@@ -0,0 +1,169 @@
+"""Per-provider circuit breakers, persisted between runs."""
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from config import Config
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """A provider call was not made because the provider's circuit is open."""
+
+
+@dataclass
+class BreakerState:
+    """Failure record of one provider."""
+    failures: int = 0  # Consecutive transient failures
+    opened_at: Optional[float] = None  # Wall-clock time the breaker (re)opened
+    probe_started: Optional[float] = None  # Half-open probe in flight (not persisted)
+
+
+class CircuitBreakers:
+    """
+    Circuit breakers keyed by provider.
+    
+    After ``threshold`` consecutive transient failures (rate limits, server
+    errors, timeouts, connection errors) a provider's breaker opens and its
+    calls fail fast for ``cooldown`` seconds. The breaker is then half-open:
+    one probe call goes through, which closes it on success or re-opens it
+    for another cooldown. Open breakers are saved to a JSON file on every
+    change, so a provider found dead by one run is skipped by the next
+    instead of being timed out against again. Safe to share between threads.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        threshold: Optional[int] = None,
+        cooldown: Optional[float] = None
+    ):
+        """
+        Load the breakers.
+        
+        Args:
+            path: JSON state file (default: Config.BREAKER_PATH, "" = keep in memory)
+            threshold: Consecutive failures that open a breaker
+                      (default: Config.BREAKER_THRESHOLD, 0 = never open)
+            cooldown: Seconds an open breaker waits before a probe (default: Config.BREAKER_COOLDOWN)
+        """
+        self.path = Config.BREAKER_PATH if path is None else path
+        self.threshold = Config.BREAKER_THRESHOLD if threshold is None else threshold
+        self.cooldown = Config.BREAKER_COOLDOWN if cooldown is None else cooldown
+        self._lock = threading.Lock()
+        self._states: Dict[str, BreakerState] = self._load()
+    
+    def _load(self) -> Dict[str, BreakerState]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {
+                key: BreakerState(failures=value.get("failures", 0), opened_at=value.get("opened_at"))
+                for key, value in data.items()
+            }
+        except (OSError, ValueError, AttributeError):
+            # A corrupt state file only costs us what we learned last run
+            return {}
+    
+    def _save(self):
+        """Write the state file (called with the lock held)."""
+        if not self.path:
+            return
+        data = {
+            key: {"failures": state.failures, "opened_at": state.opened_at}
+            for key, state in self._states.items()
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+    
+    def _state(self, key: str, now: float) -> str:
+        state = self._states.get(key)
+        if state is None or state.opened_at is None:
+            return CLOSED
+        if now - state.opened_at < self.cooldown:
+            return OPEN
+        return HALF_OPEN
+    
+    def state(self, key: str) -> str:
+        """closed, open or half_open."""
+        with self._lock:
+            return self._state(key, time.time())
+    
+    def _probe_in_flight(self, key: str, now: float) -> bool:
+        probe_started = self._states[key].probe_started
+        # A probe that never reported back (e.g. the process was interrupted) expires
+        return probe_started is not None and now - probe_started < self.cooldown
+    
+    def available(self, key: str) -> bool:
+        """Whether a call to the provider could go out now (does not claim the half-open probe)."""
+        with self._lock:
+            now = time.time()
+            state = self._state(key, now)
+            return state == CLOSED or (state == HALF_OPEN and not self._probe_in_flight(key, now))
+    
+    def allow(self, key: str) -> bool:
+        """Whether a call may go out now; when half-open, only the first caller gets to probe."""
+        with self._lock:
+            now = time.time()
+            state = self._state(key, now)
+            if state == CLOSED:
+                return True
+            if state == OPEN or self._probe_in_flight(key, now):
+                return False
+            self._states[key].probe_started = now
+            return True
+    
+    def record_success(self, key: str):
+        """The provider answered: close its breaker."""
+        with self._lock:
+            state = self._states.pop(key, None)
+            if state is not None and state.opened_at is not None:
+                self._save()
+    
+    def record_failure(self, key: str) -> bool:
+        """
+        Count a transient failure.
+        
+        Returns:
+            True if this failure opened (or re-opened) the breaker
+        """
+        with self._lock:
+            state = self._states.setdefault(key, BreakerState())
+            state.failures += 1
+            probing = state.probe_started is not None
+            state.probe_started = None
+            if not self.threshold or (not probing and state.failures < self.threshold):
+                return False
+            state.opened_at = time.time()
+            self._save()
+            return True
+
+
+_circuit_breakers: Optional[CircuitBreakers] = None
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakers:
+    """Process-wide CircuitBreakers shared by all councils."""
+    global _circuit_breakers
+    with _circuit_breakers_lock:
+        if _circuit_breakers is None:
+            _circuit_breakers = CircuitBreakers()
+    return _circuit_breakers
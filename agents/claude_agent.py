@@ -1,13 +1,15 @@
 """Claude (Anthropic) agent implementation."""
-from typing import Optional, List
-from anthropic import Anthropic
-from .base_agent import BaseAgent, AgentResponse
+from typing import Optional, List, Dict, Any, Iterator, AsyncIterator
+from anthropic import Anthropic, AsyncAnthropic, Timeout
+from .base_agent import BaseAgent, AgentResponse, StreamEvent
 from config import Config
 
 
 class ClaudeAgent(BaseAgent):
     """Agent powered by Claude (Anthropic)."""
     
+    provider = "anthropic"
+    
     def __init__(
         self, 
         name: str = "Claude", 
@@ -15,9 +17,83 @@ class ClaudeAgent(BaseAgent):
         temperature: float = 0.7
     ):
         super().__init__(name, role, temperature)
-        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        timeout = Timeout(Config.HTTP_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT)
+        self.client = Anthropic(api_key=Config.ANTHROPIC_API_KEY, timeout=timeout)
+        self.async_client = AsyncAnthropic(api_key=Config.ANTHROPIC_API_KEY, timeout=timeout)
         self.model = Config.ANTHROPIC_MODEL
     
+    def _request_kwargs(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Dict[str, Any]:
+        """Keyword arguments for ``messages.create``."""
+        kwargs = {
+            "model": self.model,
+            "max_tokens": self.output_token_limit(),
+            "temperature": self.temperature
+        }
+        if not self.multi_turn:
+            kwargs["system"] = self._system_blocks(context, round_num)
+            kwargs["messages"] = [{"role": "user", "content": prompt}]
+            return kwargs
+        
+        system, *turns = self.build_messages(prompt, context, round_num)
+        kwargs["system"] = [{"type": "text", "text": system["content"]}]
+        kwargs["messages"] = [dict(message) for message in turns]
+        if Config.PROMPT_CACHING:
+            # The breakpoint on the newest turn caches the whole conversation,
+            # which the next round reads back as its prefix
+            kwargs["system"][0]["cache_control"] = {"type": "ephemeral"}
+            kwargs["messages"][-1]["content"] = [{
+                "type": "text",
+                "text": turns[-1]["content"],
+                "cache_control": {"type": "ephemeral"}
+            }]
+        return kwargs
+    
+    def _system_blocks(
+        self,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> List[Dict[str, Any]]:
+        """
+        System prompt as content blocks with prompt-caching breakpoints.
+        
+        The instructions and the context are separate blocks, each marked
+        with ``cache_control``, so later calls reuse the cached instructions
+        and, within a round, the cached prefix of the growing context.
+        """
+        instructions = self.get_instructions(round_num)
+        blocks = [{"type": "text", "text": instructions}]
+        context_prompt = self.get_context_prompt(context, instructions)
+        if context_prompt:
+            blocks.append({"type": "text", "text": context_prompt})
+        if Config.PROMPT_CACHING:
+            for block in blocks:
+                block["cache_control"] = {"type": "ephemeral"}
+        return blocks
+    
+    def _build_response(self, response) -> AgentResponse:
+        """Convert an Anthropic message into an AgentResponse."""
+        usage = response.usage
+        # input_tokens excludes tokens read from or written to the prompt cache
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_creation = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return AgentResponse(
+            agent_name=self.name,
+            content=response.content[0].text,
+            model=self.model,
+            tokens_used=usage.input_tokens + cache_read + cache_creation + usage.output_tokens,
+            metadata={
+                "input_tokens": usage.input_tokens,
+                "output_tokens": usage.output_tokens,
+                "cached_tokens": cache_read,
+                "cache_creation_tokens": cache_creation
+            }
+        )
+    
     def generate_response(
         self, 
         prompt: str, 
@@ -26,39 +102,60 @@ class ClaudeAgent(BaseAgent):
     ) -> AgentResponse:
         """Generate response using Claude."""
         try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            
-            messages = [
-                {"role": "user", "content": prompt}
-            ]
-            
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=Config.MAX_TOKENS,
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=messages
-            )
-            
-            content = response.content[0].text
-            tokens_used = response.usage.input_tokens + response.usage.output_tokens
-            
-            return AgentResponse(
-                agent_name=self.name,
-                content=content,
-                model=self.model,
-                tokens_used=tokens_used,
-                metadata={
-                    "input_tokens": response.usage.input_tokens,
-                    "output_tokens": response.usage.output_tokens
-                }
+                **self._request_kwargs(prompt, context, round_num)
             )
-            
+            return self._build_response(response)
         except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=self.model,
-                metadata={"error": str(e)}
+            return self._error_response(e)
+    
+    async def agenerate_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AgentResponse:
+        """Generate response using the async Claude client."""
+        try:
+            response = await self.async_client.messages.create(
+                **self._request_kwargs(prompt, context, round_num)
             )
-
+            return self._build_response(response)
+        except Exception as e:
+            return self._error_response(e)
+    
+    def stream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> Iterator[StreamEvent]:
+        """Stream a response using Claude's streaming API."""
+        try:
+            with self.client.messages.stream(
+                **self._request_kwargs(prompt, context, round_num)
+            ) as stream:
+                for text in stream.text_stream:
+                    yield StreamEvent(delta=text)
+                response = self._build_response(stream.get_final_message())
+        except Exception as e:
+            response = self._error_response(e)
+        yield StreamEvent(response=response)
+    
+    async def astream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a response using the async Claude client."""
+        try:
+            async with self.async_client.messages.stream(
+                **self._request_kwargs(prompt, context, round_num)
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield StreamEvent(delta=text)
+                response = self._build_response(await stream.get_final_message())
+        except Exception as e:
+            response = self._error_response(e)
+        yield StreamEvent(response=response)
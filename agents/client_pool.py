@@ -0,0 +1,163 @@
+"""Shared, pooled HTTP clients for SDKs built on httpx (OpenAI, Groq, ...)."""
+import asyncio
+import importlib
+import threading
+import weakref
+from importlib.util import find_spec
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from config import Config
+
+
+def _http_client_class(factory, asynchronous: bool):
+    """
+    The httpx client class an SDK expects for ``http_client``.
+    
+    Stainless-generated SDKs export DefaultHttpxClient/DefaultAsyncHttpxClient,
+    which carry the SDK's own defaults (redirects, limits) and match the httpx
+    version it was built against.
+    """
+    sdk = importlib.import_module(factory.__module__.split(".")[0])
+    if asynchronous:
+        return getattr(sdk, "DefaultAsyncHttpxClient", httpx.AsyncClient)
+    return getattr(sdk, "DefaultHttpxClient", httpx.Client)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class ClientPool:
+    """
+    Hands out one SDK client per (SDK class, base URL, API key).
+    
+    Clients for the same SDK and base URL share a single keep-alive httpx
+    connection pool (HTTP/2 when the ``h2`` package is installed), so a council
+    of several OpenRouter models reuses the same connections instead of
+    opening a pool and doing a TLS handshake per agent. Async clients are
+    scoped to the event loop that created them, since httpx async connections
+    cannot be reused across loops.
+    """
+    
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        http2: Optional[bool] = None
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections or Config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=max_keepalive_connections or Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=keepalive_expiry or Config.HTTP_KEEPALIVE_EXPIRY
+        )
+        self.timeout = httpx.Timeout(
+            timeout or Config.HTTP_TIMEOUT,
+            connect=connect_timeout or Config.HTTP_CONNECT_TIMEOUT
+        )
+        http2 = Config.HTTP2 if http2 is None else http2
+        self.http2 = http2 and find_spec("h2") is not None
+        
+        self._sync_scope: Tuple[Dict, Dict] = ({}, {})
+        self._loopless_scope: Tuple[Dict, Dict] = ({}, {})
+        self._async_scopes = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+    
+    def _scope(self, asynchronous: bool) -> Tuple[Dict, Dict]:
+        """(http clients, SDK clients) for the sync world or the running loop."""
+        if not asynchronous:
+            return self._sync_scope
+        loop = _running_loop()
+        if loop is None:
+            return self._loopless_scope
+        return self._async_scopes.setdefault(loop, ({}, {}))
+    
+    def get(
+        self,
+        factory,
+        api_key: Optional[str],
+        base_url: Optional[str] = None,
+        asynchronous: bool = False
+    ) -> Any:
+        """
+        Return the shared client built by ``factory`` (e.g. OpenAI, AsyncGroq).
+        
+        Args:
+            factory: SDK client class accepting api_key, base_url, timeout
+                    and http_client keyword arguments
+            api_key: API key for the client
+            base_url: Provider endpoint (None for the SDK default)
+            asynchronous: Whether factory is an async client class
+        """
+        key = (factory, base_url, api_key)
+        with self._lock:
+            http_clients, clients = self._scope(asynchronous)
+            client = clients.get(key)
+            if client is not None:
+                return client
+            
+            http_key = (factory.__module__.split(".")[0], base_url)
+            http_client = http_clients.get(http_key)
+            if http_client is None:
+                http_client = _http_client_class(factory, asynchronous)(
+                    limits=self.limits,
+                    timeout=self.timeout,
+                    http2=self.http2
+                )
+                http_clients[http_key] = http_client
+            
+            kwargs = {"api_key": api_key, "timeout": self.timeout, "http_client": http_client}
+            if base_url is not None:
+                kwargs["base_url"] = base_url
+            client = factory(**kwargs)
+            clients[key] = client
+            return client
+    
+    def close(self):
+        """Close the pooled sync connections."""
+        with self._lock:
+            http_clients, clients = self._sync_scope
+            for http_client in http_clients.values():
+                http_client.close()
+            http_clients.clear()
+            clients.clear()
+    
+    async def aclose(self):
+        """Close the pooled async connections of the running event loop."""
+        with self._lock:
+            http_clients, clients = self._scope(asynchronous=True)
+            pending = list(http_clients.values())
+            http_clients.clear()
+            clients.clear()
+        for http_client in pending:
+            await http_client.aclose()
+
+
+_client_pool: Optional[ClientPool] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ClientPool:
+    """Process-wide ClientPool shared by all agents."""
+    global _client_pool
+    with _client_pool_lock:
+        if _client_pool is None:
+            _client_pool = ClientPool()
+    return _client_pool
+
+
+def get_client(factory, api_key: Optional[str], base_url: Optional[str] = None) -> Any:
+    """Shared sync SDK client from the process-wide pool."""
+    return get_client_pool().get(factory, api_key, base_url)
+
+
+def get_async_client(factory, api_key: Optional[str], base_url: Optional[str] = None) -> Any:
+    """Shared async SDK client for the running event loop."""
+    return get_client_pool().get(factory, api_key, base_url, asynchronous=True)
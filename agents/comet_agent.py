@@ -1,15 +1,18 @@
 """Comet API agent implementation."""
-from typing import Optional, List
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
 except ImportError:
     OpenAI = None
+    AsyncOpenAI = None
 
-from .base_agent import BaseAgent, AgentResponse
+from .openai_compatible_agent import OpenAICompatibleAgent
+from .client_pool import get_client, get_async_client
 from config import Config
 
+COMET_BASE_URL = "https://api.comet.ml/api/v1"  # Adjust if needed
 
-class CometAgent(BaseAgent):
+
+class CometAgent(OpenAICompatibleAgent):
     """
     Agent powered by Comet API.
     
@@ -23,6 +26,8 @@ class CometAgent(BaseAgent):
     - 'fast': Ultra-fast models (gpt-3.5-turbo, claude-3-haiku)
     """
     
+    provider = "comet"
+    
     # Model categories for aggregation
     CATEGORIES = {
         'advanced': ['gpt-5.2', 'gpt-4-turbo', 'gpt-4', 'claude-3-opus', 'claude-3-sonnet'],
@@ -68,10 +73,8 @@ class CometAgent(BaseAgent):
         
         # Initialize OpenAI-compatible client with Comet base URL
         # Note: Adjust base_url if Comet uses a different endpoint
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.comet.ml/api/v1"  # Adjust if needed
-        )
+        self.api_key = api_key
+        self.client = get_client(OpenAI, api_key, COMET_BASE_URL)
         
         # Set model (use provided, category-selected, or default)
         self.model = model or getattr(
@@ -83,49 +86,13 @@ class CometAgent(BaseAgent):
         # Store category for metadata
         self.category = category
     
-    def generate_response(
-        self, 
-        prompt: str, 
-        context: Optional[List[AgentResponse]] = None,
-        round_num: int = 1
-    ) -> AgentResponse:
-        """Generate response using Comet API."""
-        try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=getattr(Config, 'MAX_TOKENS', 2000)
-            )
-            
-            content = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens if response.usage else None
-            
-            return AgentResponse(
-                agent_name=self.name,
-                content=content,
-                model=self.model,
-                tokens_used=tokens_used,
-                metadata={
-                    "input_tokens": response.usage.prompt_tokens if response.usage else None,
-                    "output_tokens": response.usage.completion_tokens if response.usage else None,
-                    "provider": "comet",
-                    "category": self.category  # Include category in metadata
-                }
-            )
-            
-        except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=self.model,
-                metadata={"error": str(e)}
-            )
-
+    def _create_async_client(self):
+        return get_async_client(AsyncOpenAI, self.api_key, COMET_BASE_URL)
+    
+    def _response_metadata(self, response):
+        return {
+            "input_tokens": response.usage.prompt_tokens if response.usage else None,
+            "output_tokens": response.usage.completion_tokens if response.usage else None,
+            "provider": "comet",
+            "category": self.category  # Include category in metadata
+        }
@@ -0,0 +1,185 @@
+"""Token-budgeted selection of previous responses for agent prompts."""
+from dataclasses import replace
+from typing import List, Optional, TYPE_CHECKING
+
+from .model_info import count_tokens, get_context_window
+from config import Config
+
+if TYPE_CHECKING:
+    from .base_agent import AgentResponse
+
+
+# Tokens added by format_context around every response and the whole block
+RESPONSE_OVERHEAD_TOKENS = 8
+BLOCK_OVERHEAD_TOKENS = 20
+# Tokens taken by the "[... omitted ...]" marker in a clipped response
+CLIP_MARKER_TOKENS = 12
+
+
+class ContextManager:
+    """
+    Fits previous responses into a per-call input-token budget.
+    
+    The budget is the model's context window minus the output allowance
+    (Config.MAX_TOKENS), the fixed part of the system prompt and a reserve
+    for the user prompt, optionally capped by ``max_input_tokens``. When the
+    context does not fit, one of the following policies is applied:
+    
+    - ``truncate_oldest``: drop the oldest responses first
+    - ``latest_round``: keep only the most recent round, then drop oldest
+    - ``clip``: keep every response but clip each to a share of the budget,
+      preserving its head and tail
+    """
+    
+    POLICIES = ("truncate_oldest", "latest_round", "clip")
+    
+    def __init__(
+        self,
+        policy: Optional[str] = None,
+        max_input_tokens: Optional[int] = None,
+        reserve_tokens: Optional[int] = None,
+        head_ratio: float = 0.7
+    ):
+        """
+        Initialize the context manager.
+        
+        Args:
+            policy: One of POLICIES (default: Config.CONTEXT_POLICY)
+            max_input_tokens: Hard cap on input tokens per call
+                             (default: Config.CONTEXT_MAX_INPUT_TOKENS, 0 = model window only)
+            reserve_tokens: Tokens kept free for the user prompt
+                           (default: Config.CONTEXT_RESERVE_TOKENS)
+            head_ratio: Share of a clipped response kept from its beginning
+        """
+        self.policy = policy or Config.CONTEXT_POLICY
+        if self.policy not in self.POLICIES:
+            raise ValueError(
+                f"Unknown context policy: {self.policy}. "
+                f"Choose from: {', '.join(self.POLICIES)}"
+            )
+        self.max_input_tokens = (
+            Config.CONTEXT_MAX_INPUT_TOKENS if max_input_tokens is None else max_input_tokens
+        )
+        self.reserve_tokens = (
+            Config.CONTEXT_RESERVE_TOKENS if reserve_tokens is None else reserve_tokens
+        )
+        self.head_ratio = head_ratio
+    
+    def budget(self, model: Optional[str], fixed_tokens: int = 0, max_output_tokens: Optional[int] = None) -> int:
+        """Tokens available for previous responses in one call."""
+        if max_output_tokens is None:
+            max_output_tokens = Config.MAX_TOKENS
+        available = get_context_window(model) - max_output_tokens
+        if self.max_input_tokens:
+            available = min(available, self.max_input_tokens)
+        return max(0, available - fixed_tokens - self.reserve_tokens - BLOCK_OVERHEAD_TOKENS)
+    
+    def fit(
+        self,
+        context: Optional[List["AgentResponse"]],
+        model: Optional[str],
+        fixed_text: str = "",
+        max_output_tokens: Optional[int] = None
+    ) -> Optional[List["AgentResponse"]]:
+        """
+        Return the context to send, trimmed to the budget if necessary.
+        
+        Responses are never modified in place; clipped responses are copies.
+        Failed responses are dropped rather than spending budget on them.
+        """
+        if not context:
+            return context
+        context = [response for response in context if not response.error]
+        
+        budget = self.budget(model, count_tokens(fixed_text, model), max_output_tokens)
+        costs = [self._cost(response, model) for response in context]
+        if sum(costs) <= budget:
+            return context
+        
+        if self.policy == "clip":
+            return self._clip(context, costs, budget, model)
+        
+        if self.policy == "latest_round":
+            rounds = [r.round_num for r in context if r.round_num is not None]
+            if rounds:
+                latest = max(rounds)
+                kept = [(r, c) for r, c in zip(context, costs) if r.round_num in (None, latest)]
+                context = [r for r, _ in kept]
+                costs = [c for _, c in kept]
+        
+        return self._truncate_oldest(context, costs, budget, model)
+    
+    def _cost(self, response: "AgentResponse", model: Optional[str] = None) -> int:
+        return count_tokens(response.content, model) + RESPONSE_OVERHEAD_TOKENS
+    
+    def _truncate_oldest(
+        self,
+        context: List["AgentResponse"],
+        costs: List[int],
+        budget: int,
+        model: Optional[str] = None
+    ) -> List["AgentResponse"]:
+        """Drop the oldest responses until the rest fits; clip the newest if needed."""
+        total = sum(costs)
+        start = 0
+        while start < len(context) - 1 and total > budget:
+            total -= costs[start]
+            start += 1
+        kept = context[start:]
+        if total > budget:
+            # Only the newest response is left and it is still too long
+            kept = [self._clip_response(kept[0], budget, model)]
+        return kept
+    
+    def _clip(
+        self,
+        context: List["AgentResponse"],
+        costs: List[int],
+        budget: int,
+        model: Optional[str] = None
+    ) -> List["AgentResponse"]:
+        """Give each response an equal share, redistributing what short ones leave."""
+        allowances = [0] * len(context)
+        remaining = budget
+        pending = sorted(range(len(context)), key=lambda i: costs[i])
+        while pending:
+            share = remaining // len(pending)
+            index = pending.pop(0)
+            allowances[index] = min(costs[index], share)
+            remaining -= allowances[index]
+        
+        return [
+            response if allowances[i] >= costs[i] else self._clip_response(response, allowances[i], model)
+            for i, response in enumerate(context)
+        ]
+    
+    def _clip_response(
+        self,
+        response: "AgentResponse",
+        max_tokens: int,
+        model: Optional[str] = None
+    ) -> "AgentResponse":
+        """Keep the head and tail of a response within max_tokens."""
+        content = response.content
+        content_tokens = max(1, count_tokens(content, model))
+        keep_tokens = max(0, max_tokens - RESPONSE_OVERHEAD_TOKENS - CLIP_MARKER_TOKENS)
+        chars_per_token = len(content) / content_tokens
+        keep_chars = int(keep_tokens * chars_per_token)
+        head_chars = int(keep_chars * self.head_ratio)
+        tail_chars = keep_chars - head_chars
+        
+        omitted = content_tokens - keep_tokens
+        tail = content[len(content) - tail_chars:] if tail_chars > 0 else ""
+        clipped = f"{content[:head_chars]}\n[... ~{omitted} tokens omitted ...]\n{tail}"
+        return replace(response, content=clipped)
+
+
+_default_manager: Optional[ContextManager] = None
+
+
+def get_default_context_manager() -> ContextManager:
+    """Shared ContextManager built from Config, used by agents without their own."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = ContextManager()
+    return _default_manager
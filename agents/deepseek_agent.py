@@ -1,17 +1,22 @@
 """DeepSeek agent implementation."""
-from typing import Optional, List
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
 except ImportError:
     OpenAI = None
+    AsyncOpenAI = None
 
-from .base_agent import BaseAgent, AgentResponse
+from .openai_compatible_agent import OpenAICompatibleAgent
+from .client_pool import get_client, get_async_client
 from config import Config
 
+DEEPSEEK_BASE_URL = "https://api.deepseek.com"
 
-class DeepSeekAgent(BaseAgent):
+
+class DeepSeekAgent(OpenAICompatibleAgent):
     """Agent powered by DeepSeek (Chinese LLM provider with OpenAI-compatible API)."""
     
+    provider = "deepseek"
+    
     def __init__(
         self, 
         name: str = "DeepSeek", 
@@ -32,57 +37,18 @@ class DeepSeekAgent(BaseAgent):
             )
         
         # DeepSeek uses OpenAI-compatible API
-        self.client = OpenAI(
-            api_key=Config.DEEPSEEK_API_KEY,
-            base_url="https://api.deepseek.com"
-        )
+        self.client = get_client(OpenAI, Config.DEEPSEEK_API_KEY, DEEPSEEK_BASE_URL)
         self.model = Config.DEEPSEEK_MODEL
     
-    def generate_response(
-        self, 
-        prompt: str, 
-        context: Optional[List[AgentResponse]] = None,
-        round_num: int = 1
-    ) -> AgentResponse:
-        """Generate response using DeepSeek."""
-        try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=Config.MAX_TOKENS
-            )
-            
-            content = response.choices[0].message.content
-            
-            # DeepSeek provides usage information
-            tokens_used = None
-            if response.usage:
-                tokens_used = response.usage.total_tokens
-            
-            return AgentResponse(
-                agent_name=self.name,
-                content=content,
-                model=self.model,
-                tokens_used=tokens_used,
-                metadata={
-                    "provider": "deepseek",
-                    "finish_reason": response.choices[0].finish_reason
-                }
-            )
-            
-        except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=self.model,
-                metadata={"error": str(e), "provider": "deepseek"}
-            )
-
+    def _create_async_client(self):
+        return get_async_client(AsyncOpenAI, Config.DEEPSEEK_API_KEY, DEEPSEEK_BASE_URL)
+    
+    def _response_metadata(self, response):
+        # DeepSeek provides usage information
+        return {
+            "provider": "deepseek",
+            "finish_reason": response.choices[0].finish_reason
+        }
+    
+    def _error_metadata(self):
+        return {"provider": "deepseek"}
@@ -1,13 +1,15 @@
 """Gemini (Google) agent implementation."""
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Union, Iterator, AsyncIterator
 import google.generativeai as genai
-from .base_agent import BaseAgent, AgentResponse
+from .base_agent import BaseAgent, AgentResponse, StreamEvent
 from config import Config
 
 
 class GeminiAgent(BaseAgent):
     """Agent powered by Gemini (Google)."""
     
+    provider = "google"
+    
     def __init__(
         self, 
         name: str = "Gemini", 
@@ -16,7 +18,70 @@ class GeminiAgent(BaseAgent):
     ):
         super().__init__(name, role, temperature)
         genai.configure(api_key=Config.GOOGLE_API_KEY)
-        self.model = genai.GenerativeModel(Config.GOOGLE_MODEL)
+        self.model = Config.GOOGLE_MODEL
+        self.client = genai.GenerativeModel(self.model)
+    
+    def _build_prompt(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Union[str, List[Dict[str, Any]]]:
+        """
+        Gemini takes the instructions inlined in the first user turn.
+        
+        A single turn is sent as one prompt string; a multi-turn conversation
+        as contents with Gemini's "user" and "model" roles.
+        """
+        system, first, *turns = self.build_messages(prompt, context, round_num)
+        opening = f"{system['content']}\n\nUser Question: {first['content']}"
+        if not turns:
+            return opening
+        return [{"role": "user", "parts": [opening]}] + [
+            {"role": "model" if message["role"] == "assistant" else "user", "parts": [message["content"]]}
+            for message in turns
+        ]
+    
+    def _generation_config(self):
+        return genai.types.GenerationConfig(
+            temperature=self.temperature,
+            max_output_tokens=self.output_token_limit()
+        )
+    
+    def _build_response(self, response) -> AgentResponse:
+        """Convert a Gemini response into an AgentResponse."""
+        content = response.text
+        
+        # Gemini doesn't always provide token counts in the same way
+        tokens_used = None
+        input_tokens = None
+        output_tokens = None
+        cached_tokens = None
+        if hasattr(response, 'usage_metadata'):
+            input_tokens = response.usage_metadata.prompt_token_count
+            output_tokens = response.usage_metadata.candidates_token_count
+            tokens_used = input_tokens + output_tokens
+            # Gemini 2.5 models cache repeated prompt prefixes implicitly
+            cached_tokens = getattr(response.usage_metadata, 'cached_content_token_count', None)
+        
+        return AgentResponse(
+            agent_name=self.name,
+            content=content,
+            model=self.model,
+            tokens_used=tokens_used,
+            metadata={
+                "safety_ratings": [
+                    {
+                        "category": rating.category.name,
+                        "probability": rating.probability.name
+                    }
+                    for rating in response.candidates[0].safety_ratings
+                ] if hasattr(response, 'candidates') else None,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cached_tokens": cached_tokens
+            }
+        )
     
     def generate_response(
         self, 
@@ -26,50 +91,73 @@ class GeminiAgent(BaseAgent):
     ) -> AgentResponse:
         """Generate response using Gemini."""
         try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            full_prompt = f"{system_prompt}\n\nUser Question: {prompt}"
-            
-            generation_config = genai.types.GenerationConfig(
-                temperature=self.temperature,
-                max_output_tokens=Config.MAX_TOKENS
+            response = self.client.generate_content(
+                self._build_prompt(prompt, context, round_num),
+                generation_config=self._generation_config(),
+                request_options={"timeout": Config.HTTP_TIMEOUT}
             )
-            
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config=generation_config
+            return self._build_response(response)
+        except Exception as e:
+            return self._error_response(e)
+    
+    async def agenerate_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AgentResponse:
+        """Generate response using Gemini's async API."""
+        try:
+            response = await self.client.generate_content_async(
+                self._build_prompt(prompt, context, round_num),
+                generation_config=self._generation_config(),
+                request_options={"timeout": Config.HTTP_TIMEOUT}
             )
-            
-            content = response.text
-            
-            # Gemini doesn't always provide token counts in the same way
-            tokens_used = None
-            if hasattr(response, 'usage_metadata'):
-                tokens_used = (
-                    response.usage_metadata.prompt_token_count + 
-                    response.usage_metadata.candidates_token_count
-                )
-            
-            return AgentResponse(
-                agent_name=self.name,
-                content=content,
-                model=Config.GOOGLE_MODEL,
-                tokens_used=tokens_used,
-                metadata={
-                    "safety_ratings": [
-                        {
-                            "category": rating.category.name,
-                            "probability": rating.probability.name
-                        }
-                        for rating in response.candidates[0].safety_ratings
-                    ] if hasattr(response, 'candidates') else None
-                }
+            return self._build_response(response)
+        except Exception as e:
+            return self._error_response(e)
+    
+    def stream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> Iterator[StreamEvent]:
+        """Stream a response using Gemini."""
+        try:
+            response = self.client.generate_content(
+                self._build_prompt(prompt, context, round_num),
+                generation_config=self._generation_config(),
+                request_options={"timeout": Config.HTTP_TIMEOUT},
+                stream=True
             )
-            
+            for chunk in response:
+                if chunk.parts:
+                    yield StreamEvent(delta=chunk.text)
+            # The stream object exposes the aggregated text and usage once consumed
+            final = self._build_response(response)
         except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=Config.GOOGLE_MODEL,
-                metadata={"error": str(e)}
+            final = self._error_response(e)
+        yield StreamEvent(response=final)
+    
+    async def astream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a response using Gemini's async API."""
+        try:
+            response = await self.client.generate_content_async(
+                self._build_prompt(prompt, context, round_num),
+                generation_config=self._generation_config(),
+                request_options={"timeout": Config.HTTP_TIMEOUT},
+                stream=True
             )
-
+            async for chunk in response:
+                if chunk.parts:
+                    yield StreamEvent(delta=chunk.text)
+            final = self._build_response(response)
+        except Exception as e:
+            final = self._error_response(e)
+        yield StreamEvent(response=final)
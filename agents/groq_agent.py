@@ -1,17 +1,20 @@
 """Groq agent implementation for fast, free cloud inference."""
-from typing import Optional, List
 try:
-    from groq import Groq
+    from groq import Groq, AsyncGroq
 except ImportError:
     Groq = None
+    AsyncGroq = None
 
-from .base_agent import BaseAgent, AgentResponse
+from .openai_compatible_agent import OpenAICompatibleAgent
+from .client_pool import get_client, get_async_client
 from config import Config
 
 
-class GroqAgent(BaseAgent):
+class GroqAgent(OpenAICompatibleAgent):
     """Agent powered by Groq (free, ultra-fast inference)."""
     
+    provider = "groq"
+    
     def __init__(
         self, 
         name: str = "Groq", 
@@ -31,51 +34,15 @@ class GroqAgent(BaseAgent):
                 "Get a free API key from https://console.groq.com/"
             )
         
-        self.client = Groq(api_key=Config.GROQ_API_KEY)
+        self.client = get_client(Groq, Config.GROQ_API_KEY)
         self.model = Config.GROQ_MODEL
     
-    def generate_response(
-        self, 
-        prompt: str, 
-        context: Optional[List[AgentResponse]] = None,
-        round_num: int = 1
-    ) -> AgentResponse:
-        """Generate response using Groq."""
-        try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=Config.MAX_TOKENS
-            )
-            
-            content = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            
-            return AgentResponse(
-                agent_name=self.name,
-                content=content,
-                model=self.model,
-                tokens_used=tokens_used,
-                metadata={
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "free_tier": True
-                }
-            )
-            
-        except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=self.model,
-                metadata={"error": str(e)}
-            )
-
+    def _create_async_client(self):
+        return get_async_client(AsyncGroq, Config.GROQ_API_KEY)
+    
+    def _response_metadata(self, response):
+        return {
+            "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
+            "completion_tokens": response.usage.completion_tokens if response.usage else None,
+            "free_tier": True
+        }
@@ -6,12 +6,15 @@ except ImportError:
     InferenceClient = None
 
 from .base_agent import BaseAgent, AgentResponse
+from .model_info import count_tokens
 from config import Config
 
 
 class HuggingFaceAgent(BaseAgent):
     """Agent powered by Hugging Face Inference API (free tier available)."""
     
+    provider = "huggingface"
+    
     def __init__(
         self, 
         name: str = "HuggingFace", 
@@ -28,7 +31,8 @@ class HuggingFaceAgent(BaseAgent):
         self.model = Config.HUGGINGFACE_MODEL
         self.client = InferenceClient(
             model=self.model,
-            token=Config.HUGGINGFACE_API_KEY  # Optional for public models
+            token=Config.HUGGINGFACE_API_KEY,  # Optional for public models
+            timeout=Config.HTTP_TIMEOUT
         )
     
     def generate_response(
@@ -39,38 +43,41 @@ class HuggingFaceAgent(BaseAgent):
     ) -> AgentResponse:
         """Generate response using Hugging Face."""
         try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            full_prompt = f"{system_prompt}\n\nUser: {prompt}\n\nAssistant:"
+            system, *turns = self.build_messages(prompt, context, round_num)
+            full_prompt = system["content"]
+            for message in turns:
+                speaker = "Assistant" if message["role"] == "assistant" else "User"
+                full_prompt += f"\n\n{speaker}: {message['content']}"
+            full_prompt += "\n\nAssistant:"
             
             # Use text generation
             response = self.client.text_generation(
                 full_prompt,
-                max_new_tokens=Config.MAX_TOKENS,
+                max_new_tokens=self.output_token_limit(),
                 temperature=self.temperature,
                 return_full_text=False
             )
             
             content = response.strip()
             
-            # HF doesn't always provide token counts
-            tokens_used = None
+            # HF doesn't provide token counts; estimate them locally
+            input_tokens = count_tokens(full_prompt, self.model)
+            output_tokens = count_tokens(content, self.model)
             
             return AgentResponse(
                 agent_name=self.name,
                 content=content,
                 model=self.model,
-                tokens_used=tokens_used,
+                tokens_used=input_tokens + output_tokens,
                 metadata={
                     "inference_api": "huggingface",
-                    "free_tier": True
+                    "free_tier": True,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "usage_estimated": True
                 }
             )
             
         except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=self.model,
-                metadata={"error": str(e)}
-            )
+            return self._error_response(e)
 
@@ -0,0 +1,67 @@
+"""Per-backend latency statistics used to decide when to hedge a slow call."""
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from config import Config
+
+
+# Latencies kept per backend; older samples are forgotten
+LATENCY_WINDOW = 50
+
+# Samples needed before a percentile is trusted over Config.HEDGE_DELAY
+MIN_LATENCY_SAMPLES = 5
+
+
+class LatencyTracker:
+    """
+    Records how long successful provider calls take, per provider and model.
+    
+    The hedge delay of a backend is a high percentile of its recent
+    latencies: a call that is still running past it is in the backend's
+    tail, and a request to an equivalent backend is likely to finish first.
+    """
+    
+    def __init__(self, percentile: Optional[float] = None, default_delay: Optional[float] = None):
+        """
+        Initialize the tracker.
+        
+        Args:
+            percentile: Latency percentile after which to hedge (default: Config.HEDGE_PERCENTILE)
+            default_delay: Hedge delay in seconds until a backend has enough
+                          samples (default: Config.HEDGE_DELAY)
+        """
+        self.percentile = Config.HEDGE_PERCENTILE if percentile is None else percentile
+        self.default_delay = Config.HEDGE_DELAY if default_delay is None else default_delay
+        self._samples: Dict[Tuple[str, Optional[str]], Deque[float]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, provider: str, model: Optional[str], seconds: float):
+        """Record the latency of a successful call."""
+        with self._lock:
+            samples = self._samples.setdefault((provider, model), deque(maxlen=LATENCY_WINDOW))
+            samples.append(seconds)
+    
+    def hedge_delay(self, provider: str, model: Optional[str]) -> float:
+        """Seconds to wait for a backend before sending the same request to the next one."""
+        with self._lock:
+            samples = sorted(self._samples.get((provider, model), ()))
+        if len(samples) < MIN_LATENCY_SAMPLES:
+            return self.default_delay
+        # Nearest-rank percentile
+        rank = min(len(samples), max(1, math.ceil(len(samples) * self.percentile / 100)))
+        return samples[rank - 1]
+
+
+_latency_tracker: Optional[LatencyTracker] = None
+_latency_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Process-wide LatencyTracker shared by all councils."""
+    global _latency_tracker
+    with _latency_tracker_lock:
+        if _latency_tracker is None:
+            _latency_tracker = LatencyTracker()
+    return _latency_tracker
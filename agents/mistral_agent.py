@@ -9,6 +9,8 @@ from config import Config
 class MistralAgent(BaseAgent):
     """Agent powered by Mistral AI."""
     
+    provider = "mistral"
+    
     def __init__(
         self, 
         name: str = "Mistral", 
@@ -16,7 +18,7 @@ class MistralAgent(BaseAgent):
         temperature: float = 0.7
     ):
         super().__init__(name, role, temperature)
-        self.client = MistralClient(api_key=Config.MISTRAL_API_KEY)
+        self.client = MistralClient(api_key=Config.MISTRAL_API_KEY, timeout=int(Config.HTTP_TIMEOUT))
         self.model = Config.MISTRAL_MODEL
     
     def generate_response(
@@ -27,18 +29,16 @@ class MistralAgent(BaseAgent):
     ) -> AgentResponse:
         """Generate response using Mistral."""
         try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            
             messages = [
-                ChatMessage(role="system", content=system_prompt),
-                ChatMessage(role="user", content=prompt)
+                ChatMessage(role=message["role"], content=message["content"])
+                for message in self.build_messages(prompt, context, round_num)
             ]
             
             response = self.client.chat(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
-                max_tokens=Config.MAX_TOKENS
+                max_tokens=self.output_token_limit()
             )
             
             content = response.choices[0].message.content
@@ -56,10 +56,5 @@ class MistralAgent(BaseAgent):
             )
             
         except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=self.model,
-                metadata={"error": str(e)}
-            )
+            return self._error_response(e)
 
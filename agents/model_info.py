@@ -0,0 +1,185 @@
+"""Model metadata (context window, output limit, tokenizer) and local token counting."""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+@dataclass(frozen=True)
+class ModelInfo:
+    """What the council needs to know to size a request for a model."""
+    context_window: int  # Input + output tokens
+    max_output: Optional[int] = None  # Output cap (None = limited by the window only)
+    encoding: str = "cl100k_base"  # tiktoken encoding used to count tokens
+    # Tokens per encoding token. 1.0 where the encoding is the model's own;
+    # otherwise calibrated against the model's tokenizer on English prose
+    # and code (e.g. SentencePiece 32k vocabularies split ~20% finer).
+    token_ratio: float = 1.0
+
+
+_GPT4O = ModelInfo(128000, 16384, "o200k_base")
+_GPT5 = ModelInfo(400000, 128000, "o200k_base")
+_GPT4_TURBO = ModelInfo(128000, 4096)
+_CLAUDE_3 = ModelInfo(200000, 4096, token_ratio=1.15)
+_CLAUDE_35 = ModelInfo(200000, 8192, token_ratio=1.15)
+_GEMINI_25 = ModelInfo(1048576, 65536, token_ratio=0.95)
+_LLAMA_3 = ModelInfo(8192)
+_LLAMA_31 = ModelInfo(131072)
+_SENTENCEPIECE_32K = 1.2  # Llama 2, Mistral and Mixtral tokenizers
+_DEEPSEEK = ModelInfo(65536, 8192)
+
+# Metadata by model name, covering the defaults in Config and the models of
+# CometAgent.CATEGORIES. Names are matched exactly first, then without a
+# provider prefix ("anthropic/claude-..."), then by the family patterns below.
+MODELS = {
+    # OpenAI
+    "gpt-4-turbo-preview": _GPT4_TURBO,
+    "gpt-4-turbo": _GPT4_TURBO,
+    "gpt-4o": _GPT4O,
+    "gpt-4o-mini": _GPT4O,
+    "gpt-4": ModelInfo(8192, 8192),
+    "gpt-3.5-turbo": ModelInfo(16385, 4096),
+    "gpt-5.2": _GPT5,
+    # Anthropic
+    "claude-3-5-sonnet-20241022": _CLAUDE_35,
+    "claude-3.5-sonnet": _CLAUDE_35,
+    "claude-3-opus": _CLAUDE_3,
+    "claude-3-sonnet": _CLAUDE_3,
+    "claude-3-haiku": _CLAUDE_3,
+    # Google
+    "gemini-2.5-flash": _GEMINI_25,
+    "gemini-2.5-pro": _GEMINI_25,
+    "gemini-1.5-pro": ModelInfo(2097152, 8192, token_ratio=0.95),
+    "gemini-pro": ModelInfo(32760, 8192, token_ratio=0.95),
+    # Mistral
+    "mistral-large-latest": ModelInfo(128000, token_ratio=_SENTENCEPIECE_32K),
+    "mistral-large": ModelInfo(128000, token_ratio=_SENTENCEPIECE_32K),
+    # Groq
+    "llama3-8b-8192": _LLAMA_3,
+    "llama3-70b-8192": _LLAMA_3,
+    "mixtral-8x7b-32768": ModelInfo(32768, token_ratio=_SENTENCEPIECE_32K),
+    # Hugging Face
+    "mistralai/Mistral-7B-Instruct-v0.2": ModelInfo(32768, token_ratio=_SENTENCEPIECE_32K),
+    # DeepSeek
+    "deepseek-chat": _DEEPSEEK,
+    "deepseek-coder": _DEEPSEEK,
+    # Together
+    "meta-llama/Llama-3-70b-chat-hf": _LLAMA_3,
+    # Comet open-source category
+    "llama-3.1-70b": _LLAMA_31,
+    "llama-3-70b": _LLAMA_3,
+    "llama-3-8b": _LLAMA_3,
+    "mixtral-8x7b": ModelInfo(32768, token_ratio=_SENTENCEPIECE_32K),
+    "qwen-72b": ModelInfo(32768),
+    # Ollama defaults
+    "llama2": ModelInfo(4096, token_ratio=_SENTENCEPIECE_32K),
+}
+
+# Substring patterns for model families, checked longest first
+FAMILY_MODELS = {
+    "claude-3-5": _CLAUDE_35,
+    "claude": ModelInfo(200000, 8192, token_ratio=1.15),
+    "gemini-2": _GEMINI_25,
+    "gemini": ModelInfo(1048576, 8192, token_ratio=0.95),
+    "gpt-5": _GPT5,
+    "gpt-4o": _GPT4O,
+    "gpt-4.1": ModelInfo(1047576, 32768, "o200k_base"),
+    "gpt-4-turbo": _GPT4_TURBO,
+    "llama-3.1": _LLAMA_31,
+    "llama3.1": _LLAMA_31,
+    "llama-3.2": _LLAMA_31,
+    "llama3.2": _LLAMA_31,
+    "llama-3.3": _LLAMA_31,
+    "llama3.3": _LLAMA_31,
+    "llama-3": _LLAMA_3,
+    "llama3": _LLAMA_3,
+    "llama2": ModelInfo(4096, token_ratio=_SENTENCEPIECE_32K),
+    "mixtral-8x22b": ModelInfo(65536, token_ratio=_SENTENCEPIECE_32K),
+    "mixtral": ModelInfo(32768, token_ratio=_SENTENCEPIECE_32K),
+    "mistral-large": ModelInfo(128000, token_ratio=_SENTENCEPIECE_32K),
+    "mistral": ModelInfo(32768, token_ratio=_SENTENCEPIECE_32K),
+    "qwen-2.5": ModelInfo(131072),
+    "qwen2.5": ModelInfo(131072),
+    "qwen": ModelInfo(32768),
+    "deepseek": _DEEPSEEK,
+}
+
+DEFAULT_MODEL_INFO = ModelInfo(8192)
+
+
+class ContextWindowExceededError(ValueError):
+    """A prompt leaves no room for a response in the model's context window."""
+
+# Kept for callers that only need windows
+CONTEXT_WINDOWS = {name: info.context_window for name, info in MODELS.items()}
+DEFAULT_CONTEXT_WINDOW = DEFAULT_MODEL_INFO.context_window
+
+
+@lru_cache(maxsize=256)
+def get_model_info(model: Optional[str]) -> ModelInfo:
+    """Return the metadata for a model name (conservative defaults if unknown)."""
+    if not model:
+        return DEFAULT_MODEL_INFO
+    if model in MODELS:
+        return MODELS[model]
+    
+    short_name = model.split("/")[-1]
+    if short_name in MODELS:
+        return MODELS[short_name]
+    
+    lowered = short_name.lower()
+    for pattern in sorted(FAMILY_MODELS, key=len, reverse=True):
+        if pattern in lowered:
+            return FAMILY_MODELS[pattern]
+    return DEFAULT_MODEL_INFO
+
+
+def get_context_window(model: Optional[str]) -> int:
+    """Return the context window for a model name (conservative default if unknown)."""
+    return get_model_info(model).context_window
+
+
+def get_max_output(model: Optional[str]) -> int:
+    """Return the most tokens a model can generate in one response."""
+    info = get_model_info(model)
+    return info.max_output or info.context_window
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(name: str = "cl100k_base"):
+    """Load a tiktoken encoding once (None if unavailable or offline)."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=512)
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count the tokens in a piece of text for a model.
+    
+    Uses the model's tiktoken encoding when installed, exact for OpenAI
+    models and a close proxy elsewhere, scaled by the model family's
+    calibrated ratio. Without tiktoken (or offline, before the encoding is
+    cached) it falls back to ~4 characters per token with the same ratio.
+    Results are memoized, since the council sizes the same prompt for the
+    rate limiter, the budget and the context window.
+    """
+    if not text:
+        return 0
+    info = get_model_info(model)
+    encoding = _get_encoding(info.encoding) or _get_encoding()
+    if encoding is not None:
+        tokens = len(encoding.encode(text, disallowed_special=()))
+    else:
+        tokens = (len(text) + 3) // 4
+    if info.token_ratio == 1.0:
+        return tokens
+    return int(tokens * info.token_ratio + 0.5)
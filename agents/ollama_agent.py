@@ -1,17 +1,21 @@
 """Ollama agent implementation for free local LLM inference."""
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Iterator, AsyncIterator
 try:
+    import httpx
     import ollama
 except ImportError:
     ollama = None
 
-from .base_agent import BaseAgent, AgentResponse
+from .base_agent import BaseAgent, AgentResponse, StreamEvent
+from .ollama_residency import get_local_models
 from config import Config
 
 
 class OllamaAgent(BaseAgent):
     """Agent powered by Ollama (free local LLMs)."""
     
+    provider = "ollama"
+    
     def __init__(
         self, 
         name: str = "Llama", 
@@ -27,11 +31,14 @@ class OllamaAgent(BaseAgent):
             )
         
         self.model = model or Config.OLLAMA_MODEL
-        self.client = ollama.Client()
+        # The ollama client waits forever by default
+        timeout = httpx.Timeout(Config.HTTP_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT)
+        self.client = ollama.Client(timeout=timeout)
+        self.async_client = ollama.AsyncClient(timeout=timeout)
         
-        # Verify model is available
+        # Verify model is available (model list is fetched once per server)
         try:
-            available_models = [m['name'] for m in self.client.list()['models']]
+            available_models = list(get_local_models(self.client))
             if self.model not in available_models:
                 print(f"Warning: Model '{self.model}' not found locally.")
                 print(f"Available models: {', '.join(available_models)}")
@@ -39,6 +46,55 @@ class OllamaAgent(BaseAgent):
         except Exception as e:
             print(f"Warning: Could not verify Ollama models: {e}")
     
+    def _chat_kwargs(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Dict[str, Any]:
+        """Keyword arguments for ``client.chat``."""
+        return {
+            "model": self.model,
+            "messages": self.build_messages(prompt, context, round_num),
+            "options": {
+                "temperature": self.temperature,
+                "num_predict": self.output_token_limit()
+            },
+            # Keep the model loaded between rounds instead of the server's 5m default
+            "keep_alive": Config.OLLAMA_KEEP_ALIVE
+        }
+    
+    def _build_response(self, response) -> AgentResponse:
+        """Convert an Ollama chat response into an AgentResponse."""
+        content = response['message']['content']
+        
+        # Ollama provides some token info
+        tokens_used = None
+        if 'eval_count' in response:
+            tokens_used = response.get('prompt_eval_count', 0) + response.get('eval_count', 0)
+        
+        return AgentResponse(
+            agent_name=self.name,
+            content=content,
+            model=self.model,
+            tokens_used=tokens_used,
+            metadata={
+                "total_duration": response.get('total_duration'),
+                "load_duration": response.get('load_duration'),
+                "eval_count": response.get('eval_count'),
+                "local": True
+            }
+        )
+    
+    def _merge_stream(self, parts: List[str], last_chunk) -> Dict[str, Any]:
+        """Combine streamed chunks into a chat-response-shaped dict."""
+        merged = {"message": {"content": "".join(parts)}}
+        if last_chunk is not None:
+            for key in ("total_duration", "load_duration", "prompt_eval_count", "eval_count"):
+                if last_chunk.get(key) is not None:
+                    merged[key] = last_chunk.get(key)
+        return merged
+    
     def generate_response(
         self, 
         prompt: str, 
@@ -47,45 +103,65 @@ class OllamaAgent(BaseAgent):
     ) -> AgentResponse:
         """Generate response using Ollama."""
         try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            
-            response = self.client.chat(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                options={
-                    "temperature": self.temperature,
-                    "num_predict": Config.MAX_TOKENS
-                }
-            )
-            
-            content = response['message']['content']
-            
-            # Ollama provides some token info
-            tokens_used = None
-            if 'eval_count' in response:
-                tokens_used = response.get('prompt_eval_count', 0) + response.get('eval_count', 0)
-            
-            return AgentResponse(
-                agent_name=self.name,
-                content=content,
-                model=self.model,
-                tokens_used=tokens_used,
-                metadata={
-                    "total_duration": response.get('total_duration'),
-                    "load_duration": response.get('load_duration'),
-                    "eval_count": response.get('eval_count'),
-                    "local": True
-                }
-            )
-            
+            response = self.client.chat(**self._chat_kwargs(prompt, context, round_num))
+            return self._build_response(response)
         except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=self.model,
-                metadata={"error": str(e), "local": True}
+            return self._error_response(e, local=True)
+    
+    async def agenerate_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AgentResponse:
+        """Generate response using the async Ollama client."""
+        try:
+            response = await self.async_client.chat(**self._chat_kwargs(prompt, context, round_num))
+            return self._build_response(response)
+        except Exception as e:
+            return self._error_response(e, local=True)
+    
+    def stream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> Iterator[StreamEvent]:
+        """Stream a response using Ollama."""
+        parts = []
+        last_chunk = None
+        try:
+            for chunk in self.client.chat(**self._chat_kwargs(prompt, context, round_num), stream=True):
+                last_chunk = chunk
+                delta = chunk['message']['content']
+                if delta:
+                    parts.append(delta)
+                    yield StreamEvent(delta=delta)
+            response = self._build_response(self._merge_stream(parts, last_chunk))
+        except Exception as e:
+            response = self._error_response(e, local=True)
+        yield StreamEvent(response=response)
+    
+    async def astream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a response using the async Ollama client."""
+        parts = []
+        last_chunk = None
+        try:
+            stream = await self.async_client.chat(
+                **self._chat_kwargs(prompt, context, round_num), stream=True
             )
-
+            async for chunk in stream:
+                last_chunk = chunk
+                delta = chunk['message']['content']
+                if delta:
+                    parts.append(delta)
+                    yield StreamEvent(delta=delta)
+            response = self._build_response(self._merge_stream(parts, last_chunk))
+        except Exception as e:
+            response = self._error_response(e, local=True)
+        yield StreamEvent(response=response)
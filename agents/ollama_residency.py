@@ -0,0 +1,187 @@
+"""Keep local Ollama models resident: cached model list, warm-up and swap-aware call order."""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from config import Config
+
+if TYPE_CHECKING:
+    from .base_agent import BaseAgent
+
+
+# Resident memory is larger than the model file (KV cache, runtime buffers)
+RESIDENT_OVERHEAD = 1.2
+
+_model_cache: Dict[str, Dict[str, int]] = {}
+_model_cache_lock = threading.Lock()
+
+
+def _host_key(client) -> str:
+    """Identify the Ollama server a client talks to."""
+    return str(getattr(getattr(client, "_client", None), "base_url", "default"))
+
+
+def get_local_models(client, refresh: bool = False) -> Dict[str, int]:
+    """
+    Return {model name: size in bytes} for the models pulled on a server.
+    
+    The list is fetched once per server and shared by every OllamaAgent,
+    instead of calling ``client.list()`` for each agent.
+    """
+    key = _host_key(client)
+    with _model_cache_lock:
+        if refresh or key not in _model_cache:
+            models = {}
+            for entry in client.list()["models"]:
+                # ollama-python >= 0.4 uses "model", older versions "name"
+                name = entry.get("model") or entry.get("name")
+                models[name] = entry.get("size") or 0
+            _model_cache[key] = models
+        return _model_cache[key]
+
+
+def _physical_memory() -> Optional[int]:
+    """Total RAM in bytes, if the platform reports it."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class OllamaResidencyPlanner:
+    """
+    Plans which local models stay loaded and in which order they are called.
+    
+    When every model of the council fits in memory together, all of them are
+    preloaded in parallel with a long keep_alive and call order is left alone.
+    When they do not, models are packed into residency sets that do fit, and
+    the Ollama agents of each round are grouped by set so the server swaps as
+    rarely as possible. Every other round runs the groups in reverse
+    (serpentine order), so the set loaded last is used first in the next round.
+    Agents of other providers keep their positions.
+    """
+    
+    def __init__(
+        self,
+        client=None,
+        memory_budget_gb: Optional[float] = None,
+        keep_alive: Optional[str] = None
+    ):
+        """
+        Initialize the planner.
+        
+        Args:
+            client: ollama.Client to use (default: a new client for OLLAMA_HOST)
+            memory_budget_gb: Memory available for resident models
+                             (default: Config.OLLAMA_MEMORY_GB, or 75% of RAM)
+            keep_alive: How long the server keeps models loaded after use
+                       (default: Config.OLLAMA_KEEP_ALIVE)
+        """
+        self._client = client
+        memory_budget_gb = Config.OLLAMA_MEMORY_GB if memory_budget_gb is None else memory_budget_gb
+        if memory_budget_gb:
+            self.memory_budget = int(memory_budget_gb * 1024 ** 3)
+        else:
+            total = _physical_memory()
+            self.memory_budget = int(total * 0.75) if total else None
+        self.keep_alive = keep_alive or Config.OLLAMA_KEEP_ALIVE
+    
+    @property
+    def client(self):
+        """Ollama client, created on first use so non-local councils never import ollama."""
+        if self._client is None:
+            import ollama
+            self._client = ollama.Client()
+        return self._client
+    
+    def _local_agents(self, agents: List["BaseAgent"]) -> List["BaseAgent"]:
+        return [agent for agent in agents if agent.provider == "ollama"]
+    
+    def models(self, agents: List["BaseAgent"]) -> List[str]:
+        """Distinct local models in order of first use."""
+        return list(dict.fromkeys(agent.model for agent in self._local_agents(agents)))
+    
+    def residency_sets(self, models: List[str]) -> List[List[str]]:
+        """
+        Partition models into groups that fit in memory together.
+        
+        First-fit decreasing by size; groups are returned in order of their
+        earliest model in ``models``.
+        """
+        if len(models) < 2 or self.memory_budget is None:
+            return [list(models)] if models else []
+        
+        try:
+            sizes = get_local_models(self.client)
+        except Exception:
+            return [list(models)]
+        resident = {model: sizes.get(model, 0) * RESIDENT_OVERHEAD for model in models}
+        if sum(resident.values()) <= self.memory_budget:
+            return [list(models)]
+        
+        groups: List[List[str]] = []
+        loads: List[float] = []
+        for model in sorted(models, key=lambda m: resident[m], reverse=True):
+            for index, load in enumerate(loads):
+                if load + resident[model] <= self.memory_budget:
+                    groups[index].append(model)
+                    loads[index] += resident[model]
+                    break
+            else:
+                groups.append([model])
+                loads.append(resident[model])
+        
+        position = {model: index for index, model in enumerate(models)}
+        for group in groups:
+            group.sort(key=position.get)
+        return sorted(groups, key=lambda group: position[group[0]])
+    
+    def order(self, agents: List["BaseAgent"], round_num: int) -> List["BaseAgent"]:
+        """Order a round's agents to minimize model swaps on the Ollama server."""
+        groups = self.residency_sets(self.models(agents))
+        if len(groups) < 2:
+            return list(agents)
+        
+        rank = {
+            model: (group_index, model_index)
+            for group_index, group in enumerate(groups)
+            for model_index, model in enumerate(group)
+        }
+        local = sorted(self._local_agents(agents), key=lambda agent: rank[agent.model])
+        if round_num % 2 == 0:
+            local.reverse()
+        
+        # Fill the Ollama slots with the planned order; other agents stay put
+        planned = iter(local)
+        return [next(planned) if agent.provider == "ollama" else agent for agent in agents]
+    
+    def warm_up(self, agents: List["BaseAgent"]) -> List[str]:
+        """
+        Preload the first residency set in parallel and pin it with keep_alive.
+        
+        Returns:
+            The models that were loaded (already-resident models are skipped)
+        """
+        groups = self.residency_sets(self.models(agents))
+        if not groups:
+            return []
+        
+        try:
+            running = {entry.get("model") or entry.get("name") for entry in self.client.ps()["models"]}
+        except Exception:
+            running = set()
+        to_load = [model for model in groups[0] if model not in running]
+        if not to_load:
+            return []
+        
+        def load(model: str) -> Optional[str]:
+            try:
+                # An empty prompt loads the model without generating anything
+                self.client.generate(model=model, prompt="", keep_alive=self.keep_alive)
+                return model
+            except Exception:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=len(to_load), thread_name_prefix="ollama-warmup") as executor:
+            return [model for model in executor.map(load, to_load) if model]
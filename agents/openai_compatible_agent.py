@@ -0,0 +1,199 @@
+"""Shared implementation for agents backed by OpenAI-compatible chat APIs."""
+from types import SimpleNamespace
+from typing import Optional, List, Dict, Any, Iterator, AsyncIterator
+
+from .base_agent import BaseAgent, AgentResponse, StreamEvent
+
+
+def _cached_prompt_tokens(usage) -> Optional[int]:
+    """Prompt tokens served from the provider's automatic prefix cache."""
+    if usage is None:
+        return None
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details is not None else None
+    if cached is None:
+        # DeepSeek reports cache hits separately
+        cached = getattr(usage, "prompt_cache_hit_tokens", None)
+    return cached
+
+
+class _StreamAccumulator:
+    """Collects streamed chat completion chunks into a completion-shaped object."""
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self.usage = None
+        self.finish_reason = None
+    
+    def add(self, chunk) -> str:
+        """Record a chunk and return its text delta."""
+        # Groq reports usage on the final chunk under x_groq
+        usage = getattr(chunk, "usage", None) or getattr(getattr(chunk, "x_groq", None), "usage", None)
+        if usage:
+            self.usage = usage
+        if not chunk.choices:
+            return ""
+        
+        choice = chunk.choices[0]
+        if choice.finish_reason:
+            self.finish_reason = choice.finish_reason
+        delta = choice.delta.content or ""
+        if delta:
+            self.parts.append(delta)
+        return delta
+    
+    def completion(self):
+        """Return an object shaped like a non-streamed chat completion."""
+        message = SimpleNamespace(content="".join(self.parts))
+        choice = SimpleNamespace(message=message, finish_reason=self.finish_reason)
+        return SimpleNamespace(choices=[choice], usage=self.usage)
+
+
+class OpenAICompatibleAgent(BaseAgent):
+    """
+    Base class for agents whose SDK exposes ``client.chat.completions.create``.
+    
+    Used by ChatGPT, DeepSeek, OpenRouter, Comet and Groq. Subclasses take
+    ``self.client`` from the shared client pool and set ``self.model`` in
+    ``__init__``, implement ``_create_async_client`` to enable native async
+    calls, and override
+    ``_response_metadata`` to record provider-specific details.
+    """
+    
+    # Extra HTTP headers sent with every request (e.g. OpenRouter attribution)
+    extra_headers: Optional[Dict[str, str]] = None
+    
+    def _create_async_client(self):
+        """Return the async SDK client, or None if unsupported."""
+        return None
+    
+    @property
+    def async_client(self):
+        """
+        Async client for the running event loop (None if the provider has none).
+        
+        Not cached on the agent: async connections are bound to an event loop,
+        and the client pool already keeps one client per loop.
+        """
+        return self._create_async_client()
+    
+    def _completion_kwargs(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Keyword arguments for ``chat.completions.create``."""
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.output_token_limit()
+        }
+        if self.extra_headers:
+            kwargs["extra_headers"] = self.extra_headers
+        return kwargs
+    
+    def _stream_kwargs(self) -> Dict[str, Any]:
+        """Extra keyword arguments that turn a request into a stream."""
+        return {"stream": True, "stream_options": {"include_usage": True}}
+    
+    def _response_metadata(self, response) -> Dict[str, Any]:
+        """Provider-specific metadata recorded on the AgentResponse."""
+        return {
+            "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
+            "completion_tokens": response.usage.completion_tokens if response.usage else None
+        }
+    
+    def _error_metadata(self) -> Dict[str, Any]:
+        """Extra metadata recorded on error responses."""
+        return {}
+    
+    def _build_response(self, response) -> AgentResponse:
+        """Convert a chat completion into an AgentResponse."""
+        metadata = self._response_metadata(response)
+        metadata["cached_tokens"] = _cached_prompt_tokens(response.usage)
+        return AgentResponse(
+            agent_name=self.name,
+            content=response.choices[0].message.content,
+            model=self.model,
+            tokens_used=response.usage.total_tokens if response.usage else None,
+            metadata=metadata
+        )
+    
+    def generate_response(
+        self, 
+        prompt: str, 
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AgentResponse:
+        """Generate a response through the chat completions API."""
+        try:
+            messages = self.build_messages(prompt, context, round_num)
+            response = self.client.chat.completions.create(**self._completion_kwargs(messages))
+            return self._build_response(response)
+        except Exception as e:
+            return self._error_response(e, **self._error_metadata())
+    
+    async def agenerate_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AgentResponse:
+        """Generate a response with the provider's async client."""
+        if self.async_client is None:
+            return await super().agenerate_response(prompt, context, round_num)
+        
+        try:
+            messages = self.build_messages(prompt, context, round_num)
+            response = await self.async_client.chat.completions.create(
+                **self._completion_kwargs(messages)
+            )
+            return self._build_response(response)
+        except Exception as e:
+            return self._error_response(e, **self._error_metadata())
+    
+    def stream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> Iterator[StreamEvent]:
+        """Stream a response through the chat completions API."""
+        accumulator = _StreamAccumulator()
+        try:
+            messages = self.build_messages(prompt, context, round_num)
+            stream = self.client.chat.completions.create(
+                **self._completion_kwargs(messages), **self._stream_kwargs()
+            )
+            for chunk in stream:
+                delta = accumulator.add(chunk)
+                if delta:
+                    yield StreamEvent(delta=delta)
+            response = self._build_response(accumulator.completion())
+        except Exception as e:
+            response = self._error_response(e, **self._error_metadata())
+        yield StreamEvent(response=response)
+    
+    async def astream_response(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]] = None,
+        round_num: int = 1
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a response with the provider's async client."""
+        if self.async_client is None:
+            async for event in super().astream_response(prompt, context, round_num):
+                yield event
+            return
+        
+        accumulator = _StreamAccumulator()
+        try:
+            messages = self.build_messages(prompt, context, round_num)
+            stream = await self.async_client.chat.completions.create(
+                **self._completion_kwargs(messages), **self._stream_kwargs()
+            )
+            async for chunk in stream:
+                delta = accumulator.add(chunk)
+                if delta:
+                    yield StreamEvent(delta=delta)
+            response = self._build_response(accumulator.completion())
+        except Exception as e:
+            response = self._error_response(e, **self._error_metadata())
+        yield StreamEvent(response=response)
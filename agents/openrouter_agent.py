@@ -1,15 +1,18 @@
 """OpenRouter agent implementation - Access to 100+ advanced models."""
-from typing import Optional, List
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
 except ImportError:
     OpenAI = None
+    AsyncOpenAI = None
 
-from .base_agent import BaseAgent, AgentResponse
+from .openai_compatible_agent import OpenAICompatibleAgent
+from .client_pool import get_client, get_async_client
 from config import Config
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
-class OpenRouterAgent(BaseAgent):
+
+class OpenRouterAgent(OpenAICompatibleAgent):
     """
     Agent powered by OpenRouter - Access to 100+ models.
     
@@ -27,6 +30,13 @@ class OpenRouterAgent(BaseAgent):
     Get API key: https://openrouter.ai/keys
     """
     
+    provider = "openrouter"
+    
+    extra_headers = {
+        "HTTP-Referer": "https://github.com/jaafar-benabderrazak/llm-council",
+        "X-Title": "LLM Council"
+    }
+    
     def __init__(
         self, 
         name: str = "OpenRouter",
@@ -50,11 +60,10 @@ class OpenRouterAgent(BaseAgent):
                 "and add to your .env file"
             )
         
-        # Initialize OpenAI client with OpenRouter base URL
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1"
-        )
+        # Shared OpenAI client for the OpenRouter base URL (one connection pool
+        # for every OpenRouter model in the process)
+        self.api_key = api_key
+        self.client = get_client(OpenAI, api_key, OPENROUTER_BASE_URL)
         
         # Set model (default to Claude 3.5 Sonnet)
         self.model = model or getattr(
@@ -63,52 +72,12 @@ class OpenRouterAgent(BaseAgent):
             'anthropic/claude-3.5-sonnet'
         )
     
-    def generate_response(
-        self, 
-        prompt: str, 
-        context: Optional[List[AgentResponse]] = None,
-        round_num: int = 1
-    ) -> AgentResponse:
-        """Generate response using OpenRouter."""
-        try:
-            system_prompt = self.get_system_prompt(context, round_num)
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=getattr(Config, 'MAX_TOKENS', 2000),
-                extra_headers={
-                    "HTTP-Referer": "https://github.com/jaafar-benabderrazak/llm-council",
-                    "X-Title": "LLM Council"
-                }
-            )
-            
-            content = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens if response.usage else None
-            
-            return AgentResponse(
-                agent_name=self.name,
-                content=content,
-                model=self.model,
-                tokens_used=tokens_used,
-                metadata={
-                    "input_tokens": response.usage.prompt_tokens if response.usage else None,
-                    "output_tokens": response.usage.completion_tokens if response.usage else None,
-                    "provider": "openrouter"
-                }
-            )
-            
-        except Exception as e:
-            return AgentResponse(
-                agent_name=self.name,
-                content=f"Error generating response: {str(e)}",
-                model=self.model,
-                metadata={"error": str(e)}
-            )
-
+    def _create_async_client(self):
+        return get_async_client(AsyncOpenAI, self.api_key, OPENROUTER_BASE_URL)
+    
+    def _response_metadata(self, response):
+        return {
+            "input_tokens": response.usage.prompt_tokens if response.usage else None,
+            "output_tokens": response.usage.completion_tokens if response.usage else None,
+            "provider": "openrouter"
+        }
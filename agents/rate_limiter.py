@@ -0,0 +1,174 @@
+"""Process-wide request and token rate limiting per provider (and model)."""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from .registry import AGENT_PROVIDERS, PROVIDERS
+from config import Config
+
+
+@dataclass
+class RateLimit:
+    """Requests-per-minute and tokens-per-minute budget (0 = unlimited)."""
+    rpm: float = 0
+    tpm: float = 0
+
+
+def parse_rate_limits(spec: str) -> Dict[str, RateLimit]:
+    """
+    Parse a rate limit specification.
+    
+    Format: ``key=rpm[/tpm]`` entries separated by ``;`` where key is a
+    provider (``groq``) or provider and model (``groq:llama3-70b-8192``).
+    Providers are --models names (``gemini``) or the agent's provider name
+    (``google``); limits are keyed by the latter, which calls are made under.
+    Entries for an unknown provider are ignored with a warning.
+    Example: ``groq=30/6000;gemini=60;openrouter=20``
+    """
+    known = {AGENT_PROVIDERS.get(provider, provider) for provider in PROVIDERS}
+    limits = {}
+    for entry in spec.split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        key, _, values = entry.partition("=")
+        rpm, _, tpm = values.partition("/")
+        try:
+            limit = RateLimit(rpm=float(rpm or 0), tpm=float(tpm or 0))
+        except ValueError:
+            raise ValueError(f"Invalid rate limit entry '{entry}'. Expected key=rpm[/tpm]")
+        provider, separator, model = key.strip().partition(":")
+        provider = AGENT_PROVIDERS.get(provider, provider)
+        if provider not in known:
+            print(f"Warning: Ignoring rate limit for unknown provider '{key.strip()}'")
+            continue
+        limits[provider + separator + model] = limit
+    return limits
+
+
+class TokenBucket:
+    """
+    Token bucket that lets callers go into debt instead of failing.
+    
+    A reservation is always granted and returns how long the caller must
+    wait before using it, so bursts are spread out at the sustained rate.
+    """
+    
+    def __init__(self, per_minute: float, burst_seconds: float = 6.0):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+    
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` and return the seconds to wait until it is covered."""
+        self._refill(now)
+        self.level -= amount
+        return max(0.0, -self.level / self.rate)
+    
+    def adjust(self, amount: float, now: float):
+        """Give back (positive) or take (negative) tokens after the fact."""
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass
+class Reservation:
+    """A granted slot; settle it with the actual token usage once known."""
+    key: Optional[str]
+    reserved_tokens: int
+    wait: float
+
+
+class RateLimiter:
+    """
+    Shared rate limiter keyed by provider, or by provider and model.
+    
+    Limits come from Config.RATE_LIMITS. Every agent call acquires a
+    reservation first; concurrent debates in the same process share the
+    same buckets. Token budgets are reserved from an estimate and corrected
+    with the provider-reported usage when the call completes.
+    """
+    
+    def __init__(self, limits: Optional[Dict[str, RateLimit]] = None):
+        self.limits = parse_rate_limits(Config.RATE_LIMITS) if limits is None else limits
+        self._buckets: Dict[str, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+        self._lock = threading.Lock()
+    
+    def limit_for(self, provider: str, model: Optional[str] = None) -> Tuple[Optional[str], Optional[RateLimit]]:
+        """Return the most specific (key, limit) for a provider and model."""
+        if model:
+            key = f"{provider}:{model}"
+            if key in self.limits:
+                return key, self.limits[key]
+        if provider in self.limits:
+            return provider, self.limits[provider]
+        return None, None
+    
+    def _reserve(self, provider: str, model: Optional[str], tokens: int) -> Reservation:
+        key, limit = self.limit_for(provider, model)
+        if limit is None:
+            return Reservation(key=None, reserved_tokens=0, wait=0.0)
+        
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = (
+                    TokenBucket(limit.rpm) if limit.rpm else None,
+                    TokenBucket(limit.tpm) if limit.tpm else None
+                )
+            request_bucket, token_bucket = self._buckets[key]
+            now = time.monotonic()
+            wait = 0.0
+            if request_bucket is not None:
+                wait = request_bucket.reserve(1, now)
+            if token_bucket is not None and tokens:
+                wait = max(wait, token_bucket.reserve(tokens, now))
+            else:
+                tokens = 0
+        return Reservation(key=key, reserved_tokens=tokens, wait=wait)
+    
+    def acquire(self, provider: str, model: Optional[str] = None, tokens: int = 0) -> Reservation:
+        """Block until a request of about ``tokens`` tokens may be sent."""
+        reservation = self._reserve(provider, model, tokens)
+        if reservation.wait:
+            time.sleep(reservation.wait)
+        return reservation
+    
+    async def aacquire(self, provider: str, model: Optional[str] = None, tokens: int = 0) -> Reservation:
+        """Async counterpart of acquire."""
+        reservation = self._reserve(provider, model, tokens)
+        if reservation.wait:
+            await asyncio.sleep(reservation.wait)
+        return reservation
+    
+    def needs_tokens(self, provider: str, model: Optional[str] = None) -> bool:
+        """Whether a tokens-per-minute budget applies (so an estimate is needed)."""
+        _, limit = self.limit_for(provider, model)
+        return bool(limit and limit.tpm)
+    
+    def settle(self, reservation: Reservation, actual_tokens: Optional[int]):
+        """Correct the token reservation with the usage the provider reported."""
+        if reservation.key is None or not reservation.reserved_tokens or actual_tokens is None:
+            return
+        with self._lock:
+            _, token_bucket = self._buckets[reservation.key]
+            token_bucket.adjust(reservation.reserved_tokens - actual_tokens, time.monotonic())
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide RateLimiter shared by all councils."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+    return _rate_limiter
@@ -0,0 +1,205 @@
+"""
+Lazy registry of agent providers.
+
+Agent modules, and the provider SDKs they import, are only imported when a
+provider is actually used. Installation checks use importlib.util.find_spec,
+which locates a package without executing it.
+"""
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .base_agent import BaseAgent
+from config import Config
+
+
+@dataclass(frozen=True)
+class ProviderInfo:
+    """How to find, load and instantiate one provider's agent."""
+    label: str  # Human-readable provider name used in messages
+    module: str  # Agent module inside the agents package
+    class_name: str
+    packages: Tuple[str, ...]  # Import names of the SDKs the agent needs
+    install: str  # pip requirement that provides the SDKs
+    name: str  # Default agent name
+    role: str  # Default agent role
+    multi_model: bool = False  # Accepts "provider:model" specs
+
+
+# Registry order is the order agents join a council
+PROVIDERS: Dict[str, ProviderInfo] = {
+    # Paid models
+    "claude": ProviderInfo(
+        "Claude", "claude_agent", "ClaudeAgent", ("anthropic",), "anthropic",
+        "Claude", "Critical Analyst - Questions assumptions and explores edge cases"
+    ),
+    "chatgpt": ProviderInfo(
+        "ChatGPT", "chatgpt_agent", "ChatGPTAgent", ("openai",), "openai",
+        "ChatGPT", "Pragmatic Problem Solver - Focuses on practical solutions"
+    ),
+    "gemini": ProviderInfo(
+        "Gemini", "gemini_agent", "GeminiAgent", ("google.generativeai",), "google-generativeai",
+        "Gemini", "Research Synthesizer - Integrates diverse perspectives"
+    ),
+    "mistral": ProviderInfo(
+        "Mistral", "mistral_agent", "MistralAgent", ("mistralai",), "mistralai",
+        "Mistral", "Devil's Advocate - Challenges consensus and explores alternatives"
+    ),
+    # Free/Open source models
+    "ollama": ProviderInfo(
+        "Ollama", "ollama_agent", "OllamaAgent", ("ollama",), "ollama",
+        "Llama", "Local Reasoning Expert - Free local inference", multi_model=True
+    ),
+    "groq": ProviderInfo(
+        "Groq", "groq_agent", "GroqAgent", ("groq",), "groq",
+        "Groq", "Fast Inference Specialist - Ultra-fast free API"
+    ),
+    "huggingface": ProviderInfo(
+        "HuggingFace", "huggingface_agent", "HuggingFaceAgent", ("huggingface_hub",), "huggingface-hub",
+        "HuggingFace", "Open Source Specialist - Community-driven models"
+    ),
+    "deepseek": ProviderInfo(
+        "DeepSeek", "deepseek_agent", "DeepSeekAgent", ("openai",), "openai",
+        "DeepSeek", "Technical Innovator - Cutting-edge Chinese LLM"
+    ),
+    # Advanced Providers
+    "openrouter": ProviderInfo(
+        "OpenRouter", "openrouter_agent", "OpenRouterAgent", ("openai",), "openai",
+        "OpenRouter", "Versatile AI - Access to 100+ models", multi_model=True
+    ),
+    "comet": ProviderInfo(
+        "Comet", "comet_agent", "CometAgent", ("openai",), "openai",
+        "Comet", "Comet AI Analysis - Versatile and powerful models", multi_model=True
+    ),
+}
+
+# Agent class name -> provider key, for ``from agents import ClaudeAgent``
+AGENT_CLASSES: Dict[str, str] = {info.class_name: key for key, info in PROVIDERS.items()}
+
+# agent.provider of the providers whose agents report another name than their
+# registry key (usage, prices and rate limits are recorded under agent.provider)
+AGENT_PROVIDERS: Dict[str, str] = {"claude": "anthropic", "chatgpt": "openai", "gemini": "google"}
+
+# Comet model categories (mirrors CometAgent.CATEGORIES without importing it)
+COMET_CATEGORIES = ("advanced", "opensource", "free", "fast")
+
+
+def is_installed(provider: str) -> bool:
+    """Whether the SDKs a provider's agent needs are installed."""
+    return all(Config.is_package_installed(package) for package in PROVIDERS[provider].packages)
+
+
+@lru_cache(maxsize=None)
+def load_agent_class(provider: str) -> type:
+    """
+    Import and return a provider's agent class.
+    
+    Raises:
+        ImportError: If the provider's SDK is not installed
+    """
+    info = PROVIDERS[provider]
+    try:
+        module = importlib.import_module(f".{info.module}", __package__)
+    except ImportError as e:
+        raise ImportError(
+            f"{info.label} requested but {info.install} package not installed "
+            f"({e}). Install with: pip install {info.install}"
+        ) from e
+    return getattr(module, info.class_name)
+
+
+def parse_spec(spec: str) -> Tuple[str, Optional[str]]:
+    """Split "provider" or "provider:model" into (provider, model or None)."""
+    provider, _, model = spec.partition(":")
+    return provider, model or None
+
+
+# Separators of an agent slot's backends: hedged, or a fallback chain
+HEDGE_SEPARATOR = "|"
+FALLBACK_SEPARATOR = "->"
+
+
+def split_slot(slot: str) -> Tuple[List[str], bool]:
+    """
+    Split an agent slot into its backends and whether to hedge between them.
+    
+    The first spec is the primary backend; the others serve the same model.
+    "groq|openrouter:meta-llama/llama-3-70b-instruct" hedges slow calls to
+    the backups; "groq->openrouter:meta-llama/llama-3-70b-instruct" only
+    falls back to them when the primary fails or its circuit is open.
+    """
+    hedge = FALLBACK_SEPARATOR not in slot
+    separator = HEDGE_SEPARATOR if hedge else FALLBACK_SEPARATOR
+    return [spec.strip() for spec in slot.split(separator) if spec.strip()], hedge
+
+
+def order_specs(specs: List[str]) -> List[str]:
+    """
+    Order agent specs by provider and drop duplicates.
+    
+    Agents join the council in registry order whatever order they were
+    requested in. A bare multi-model provider ("ollama") is dropped when
+    specific models of it ("ollama:llama3.1:8b") are also requested.
+    """
+    ordered = []
+    for provider, info in PROVIDERS.items():
+        matching = [spec for spec in specs if parse_spec(spec)[0] == provider]
+        if info.multi_model and any(parse_spec(spec)[1] for spec in matching):
+            matching = [spec for spec in matching if parse_spec(spec)[1]]
+        for spec in matching:
+            if spec not in ordered:
+                ordered.append(spec)
+    return ordered
+
+
+def create_agent(spec: str) -> BaseAgent:
+    """
+    Create the agent for a model spec, importing its provider on demand.
+    
+    Args:
+        spec: Provider name ("gemini") or, for multi-model providers,
+              "provider:model" ("ollama:llama3.1:8b", "openrouter:openai/gpt-4o",
+              "comet:advanced")
+    
+    Raises:
+        ValueError: If the provider is unknown
+        ImportError: If the provider's SDK is not installed
+    """
+    provider, model = parse_spec(spec)
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown provider '{provider}'. Choose from: {', '.join(PROVIDERS)}")
+    
+    info = PROVIDERS[provider]
+    agent_class = load_agent_class(provider)
+    
+    if not model or not info.multi_model:
+        return agent_class(name=info.name, role=info.role)
+    
+    if provider == "ollama":
+        # Derive friendly name from model
+        return agent_class(
+            name=model.split(":")[0].title(),
+            role=f"Local Expert ({model})",
+            model=model
+        )
+    
+    if provider == "openrouter":
+        return agent_class(
+            name=f"OpenRouter-{model.split('/')[-1]}",
+            role=f"OpenRouter Expert ({model})",
+            model=model
+        )
+    
+    # Comet: a category or a specific model
+    if model.lower() in COMET_CATEGORIES:
+        return agent_class(
+            name=f"Comet-{model.title()}",
+            category=model.lower(),
+            role=f"Comet {model.title()} Analysis"
+        )
+    return agent_class(
+        name=f"Comet-{model}",
+        model=model,
+        role=f"Comet Analysis ({model})"
+    )
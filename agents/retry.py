@@ -0,0 +1,130 @@
+"""Provider error classification and retry backoff policy."""
+import asyncio
+import random
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from config import Config
+
+
+# Status codes worth retrying: timeouts, conflicts, rate limits, server errors
+# and Anthropic's 529 "overloaded"
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# Exception class names (from any provider SDK) that signal a transient failure
+# even without an HTTP status, e.g. openai.APITimeoutError, httpx.ConnectError,
+# google.api_core.exceptions.DeadlineExceeded
+TRANSIENT_ERROR_NAMES = ("Timeout", "Connection", "Connect", "DeadlineExceeded", "ServiceUnavailable")
+
+# Groq and OpenAI put the wait in the message: "Please try again in 29m17.376s"
+_TRY_AGAIN_PATTERN = re.compile(r"try again in\s+(?:(\d+)h)?\s*(?:(\d+)m(?!s))?\s*(?:([\d.]+)s)?", re.IGNORECASE)
+_TRY_AGAIN_MS_PATTERN = re.compile(r"try again in\s+([\d.]+)ms", re.IGNORECASE)
+
+
+@dataclass
+class ErrorInfo:
+    """What the council needs to know about a failed provider call."""
+    retryable: bool
+    status_code: Optional[int] = None
+    retry_after: Optional[float] = None
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Best-effort HTTP status code from an SDK exception."""
+    for attr in ("status_code", "status", "code", "http_status"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None)
+    if isinstance(value, int):
+        return value
+    return None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the provider asked us to wait, from headers or the message."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        for header in ("retry-after-ms", "retry-after"):
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                seconds = float(value)
+            except ValueError:
+                continue
+            return seconds / 1000 if header == "retry-after-ms" else seconds
+    
+    message = str(error)
+    match = _TRY_AGAIN_MS_PATTERN.search(message)
+    if match:
+        return float(match.group(1)) / 1000
+    match = _TRY_AGAIN_PATTERN.search(message)
+    if match and any(match.groups()):
+        hours, minutes, seconds = (float(group or 0) for group in match.groups())
+        return hours * 3600 + minutes * 60 + seconds
+    return None
+
+
+def classify_error(error: Exception) -> ErrorInfo:
+    """
+    Decide whether a provider error is worth retrying.
+    
+    Rate limits (429), server errors (5xx), timeouts and connection failures
+    are retryable; authentication, validation and other client errors are
+    fatal and retrying them would only burn quota.
+    """
+    status_code = _status_code(error)
+    if status_code is not None:
+        retryable = status_code in RETRYABLE_STATUS_CODES
+    else:
+        retryable = isinstance(error, (TimeoutError, ConnectionError, asyncio.TimeoutError)) or any(
+            name in type(error).__name__ for name in TRANSIENT_ERROR_NAMES
+        )
+    return ErrorInfo(
+        retryable=retryable,
+        status_code=status_code,
+        retry_after=_retry_after(error) if retryable else None
+    )
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, honoring provider Retry-After hints.
+    
+    A retry is skipped when the provider asks for a longer wait than
+    max_delay (e.g. a daily token quota), since blocking the debate for
+    minutes is worse than moving on without that agent.
+    """
+    
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        self.max_attempts = max(1, max_attempts if max_attempts is not None else Config.RETRY_MAX_ATTEMPTS)
+        self.base_delay = base_delay if base_delay is not None else Config.RETRY_BASE_DELAY
+        self.max_delay = max_delay if max_delay is not None else Config.RETRY_MAX_DELAY
+    
+    def next_delay(self, attempt: int, metadata: Optional[dict]) -> Optional[float]:
+        """
+        Seconds to wait before retrying a failed attempt, or None to give up.
+        
+        Args:
+            attempt: Number of attempts made so far (1 after the first call)
+            metadata: Metadata of the error response (see BaseAgent._error_response)
+        """
+        metadata = metadata or {}
+        if attempt >= self.max_attempts or not metadata.get("retryable"):
+            return None
+        
+        retry_after = metadata.get("retry_after")
+        if retry_after is not None and retry_after > self.max_delay:
+            return None
+        
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        return max(delay, retry_after or 0)
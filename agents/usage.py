@@ -0,0 +1,305 @@
+"""Token usage normalization, per-model pricing and spend budgets."""
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
+
+from config import Config
+
+if TYPE_CHECKING:
+    from .base_agent import AgentResponse
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when a provider call would take spend past the configured budget."""
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """USD per million tokens."""
+    input: float
+    output: float
+    cached_input: Optional[float] = None  # Prompt-cache reads (default: input price)
+    cache_write: Optional[float] = None  # Prompt-cache writes (default: input price)
+
+
+FREE = ModelPrice(0.0, 0.0)
+
+# List prices in USD per million tokens. Names are matched exactly first, then
+# without a provider prefix ("anthropic/claude-..."), then by the family
+# patterns below. Override or extend with Config.MODEL_PRICES.
+MODEL_PRICES: Dict[str, ModelPrice] = {
+    # OpenAI
+    "gpt-4-turbo-preview": ModelPrice(10.0, 30.0),
+    "gpt-4-turbo": ModelPrice(10.0, 30.0),
+    "gpt-4o-mini": ModelPrice(0.15, 0.60, 0.075),
+    "gpt-4o": ModelPrice(2.50, 10.0, 1.25),
+    "gpt-4": ModelPrice(30.0, 60.0),
+    "gpt-3.5-turbo": ModelPrice(0.50, 1.50),
+    # Anthropic
+    "claude-3-5-sonnet-20241022": ModelPrice(3.0, 15.0, 0.30, 3.75),
+    "claude-3.5-sonnet": ModelPrice(3.0, 15.0, 0.30, 3.75),
+    # Google
+    "gemini-2.5-flash": ModelPrice(0.30, 2.50, 0.075),
+    "gemini-2.5-pro": ModelPrice(1.25, 10.0, 0.31),
+    "gemini-1.5-pro": ModelPrice(1.25, 5.0),
+    # Mistral
+    "mistral-large-latest": ModelPrice(2.0, 6.0),
+    # Groq
+    "llama3-8b-8192": ModelPrice(0.05, 0.08),
+    "llama3-70b-8192": ModelPrice(0.59, 0.79),
+    "mixtral-8x7b-32768": ModelPrice(0.24, 0.24),
+    # DeepSeek (cache hits are billed separately)
+    "deepseek-chat": ModelPrice(0.27, 1.10, 0.07),
+    "deepseek-coder": ModelPrice(0.27, 1.10, 0.07),
+}
+
+# Substring patterns for model families, checked longest first
+FAMILY_PRICES: Dict[str, ModelPrice] = {
+    "gpt-5-mini": ModelPrice(0.25, 2.0, 0.025),
+    "gpt-5": ModelPrice(1.25, 10.0, 0.125),
+    "gpt-4o-mini": ModelPrice(0.15, 0.60, 0.075),
+    "gpt-4o": ModelPrice(2.50, 10.0, 1.25),
+    "gpt-4": ModelPrice(30.0, 60.0),
+    "claude-3-haiku": ModelPrice(0.25, 1.25, 0.03, 0.30),
+    "haiku": ModelPrice(0.80, 4.0, 0.08, 1.0),
+    "sonnet": ModelPrice(3.0, 15.0, 0.30, 3.75),
+    "opus": ModelPrice(15.0, 75.0, 1.50, 18.75),
+    "gemini": ModelPrice(0.30, 2.50, 0.075),
+    "mistral-large": ModelPrice(2.0, 6.0),
+    "deepseek": ModelPrice(0.27, 1.10, 0.07),
+}
+
+# Providers that never bill per token
+FREE_PROVIDERS = ("ollama", "huggingface")
+
+# Unknown paid models are priced high so a budget is never undercounted
+DEFAULT_PRICE = ModelPrice(10.0, 30.0)
+
+BUDGET_POLICIES = ("abort", "skip_rounds", "shrink")
+
+# Below this many output tokens a shrunk call is not worth making
+MIN_OUTPUT_TOKENS = 256
+
+
+def parse_model_prices(spec: str) -> Dict[str, ModelPrice]:
+    """
+    Parse price overrides: "model=input/output[/cached];..." in USD per million tokens.
+    
+    Example: "gpt-4o=2.5/10/1.25;openrouter:meta-llama/llama-3-70b=0.5/0.7"
+    """
+    prices = {}
+    for entry in filter(None, (part.strip() for part in (spec or "").split(";"))):
+        model, _, values = entry.rpartition("=")
+        numbers = [float(value) for value in values.split("/")]
+        if not model or len(numbers) < 2:
+            raise ValueError(f"Invalid MODEL_PRICES entry: '{entry}' (expected model=input/output[/cached])")
+        prices[model.strip()] = ModelPrice(*numbers[:4])
+    return prices
+
+
+def get_model_price(provider: str, model: Optional[str]) -> ModelPrice:
+    """Price of a model: Config overrides, then the built-in table, then its family."""
+    if provider in FREE_PROVIDERS:
+        return FREE
+    if not model:
+        return DEFAULT_PRICE
+    
+    overrides = parse_model_prices(Config.MODEL_PRICES)
+    for key in (f"{provider}:{model}", model):
+        if key in overrides:
+            return overrides[key]
+    
+    if model in MODEL_PRICES:
+        return MODEL_PRICES[model]
+    short_name = model.split("/")[-1]
+    if short_name in MODEL_PRICES:
+        return MODEL_PRICES[short_name]
+    
+    lowered = model.lower()
+    for pattern in sorted(FAMILY_PRICES, key=len, reverse=True):
+        if pattern in lowered:
+            return FAMILY_PRICES[pattern]
+    if model.endswith(":free"):
+        # OpenRouter's free model variants
+        return FREE
+    return DEFAULT_PRICE
+
+
+@dataclass
+class Usage:
+    """Token usage of one call, normalized across providers."""
+    input_tokens: int = 0  # All prompt tokens, including cached ones
+    output_tokens: int = 0
+    cached_tokens: int = 0  # Prompt tokens read from the provider's cache
+    cache_write_tokens: int = 0  # Prompt tokens written to the provider's cache
+    estimated: bool = False  # Counted locally because the provider reported nothing
+    
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+    
+    def cost(self, price: ModelPrice) -> float:
+        """Cost in USD."""
+        cached_price = price.input if price.cached_input is None else price.cached_input
+        write_price = price.input if price.cache_write is None else price.cache_write
+        uncached = max(0, self.input_tokens - self.cached_tokens - self.cache_write_tokens)
+        return (
+            uncached * price.input
+            + self.cached_tokens * cached_price
+            + self.cache_write_tokens * write_price
+            + self.output_tokens * price.output
+        ) / 1_000_000
+
+
+def _first(metadata: Dict, *keys: str) -> Optional[int]:
+    for key in keys:
+        value = metadata.get(key)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def normalize_usage(
+    response: "AgentResponse",
+    estimated_input_tokens: Optional[int] = None,
+    count: Optional[Callable[[str], int]] = None
+) -> Usage:
+    """
+    Read a response's token usage, whatever keys its provider reports.
+    
+    Output tokens come from the agent's metadata (output_tokens,
+    completion_tokens or Ollama's eval_count); input tokens are the rest of
+    tokens_used, which includes prompt-cache reads and writes, or the
+    reported prompt count. When a provider reports nothing, the input is the
+    caller's estimate and the output is counted from the content with
+    ``count``.
+    """
+    metadata = response.metadata or {}
+    output_tokens = _first(metadata, "output_tokens", "completion_tokens", "eval_count")
+    input_tokens = _first(metadata, "input_tokens", "prompt_tokens", "prompt_eval_count")
+    if response.tokens_used is not None:
+        if output_tokens is not None:
+            input_tokens = max(0, response.tokens_used - output_tokens)
+        elif input_tokens is not None:
+            output_tokens = max(0, response.tokens_used - input_tokens)
+    
+    estimated = bool(metadata.get("usage_estimated"))
+    if output_tokens is None:
+        output_tokens = count(response.content) if count is not None else 0
+        estimated = True
+    if input_tokens is None:
+        input_tokens = estimated_input_tokens or 0
+        estimated = True
+    return Usage(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cached_tokens=_first(metadata, "cached_tokens") or 0,
+        cache_write_tokens=_first(metadata, "cache_creation_tokens") or 0,
+        estimated=estimated
+    )
+
+
+@dataclass
+class LedgerEntry:
+    """One recorded provider call."""
+    agent_name: str
+    provider: str
+    model: Optional[str]
+    round_num: Optional[int]
+    usage: Usage
+    cost: float
+
+
+class UsageLedger:
+    """
+    Records token usage and spend, and enforces a USD budget before calls.
+    
+    Calls reserve their worst-case cost (estimated input plus the full output
+    allowance) before they are made and settle to the actual cost afterwards,
+    so concurrent calls cannot overshoot the budget together. A debate's
+    ledger can have a parent, e.g. the ledger of a nightly batch; spend and
+    reservations count against both budgets.
+    """
+    
+    def __init__(
+        self,
+        budget_usd: Optional[float] = None,
+        parent: Optional["UsageLedger"] = None
+    ):
+        """
+        Initialize the ledger.
+        
+        Args:
+            budget_usd: Maximum spend in USD (None or 0 = unlimited)
+            parent: Ledger that also receives every reservation and record
+        """
+        self.budget_usd = budget_usd or None
+        self.parent = parent
+        self.entries: List[LedgerEntry] = []
+        self.spent = 0.0
+        self._reserved = 0.0
+        self._lock = threading.Lock()
+    
+    def remaining(self) -> Optional[float]:
+        """USD left to reserve, across this ledger and its parents (None = unlimited)."""
+        with self._lock:
+            own = None if self.budget_usd is None else self.budget_usd - self.spent - self._reserved
+        inherited = self.parent.remaining() if self.parent is not None else None
+        if own is None:
+            return inherited
+        return own if inherited is None else min(own, inherited)
+    
+    def reserve(self, cost: float) -> bool:
+        """Reserve a call's worst-case cost; False (nothing reserved) if it doesn't fit."""
+        with self._lock:
+            if self.budget_usd is not None and self.spent + self._reserved + cost > self.budget_usd + 1e-12:
+                return False
+            self._reserved += cost
+        if self.parent is not None and not self.parent.reserve(cost):
+            with self._lock:
+                self._reserved -= cost
+            return False
+        return True
+    
+    def release(self, cost: float):
+        """Give back a reservation whose call was not made."""
+        with self._lock:
+            self._reserved = max(0.0, self._reserved - cost)
+        if self.parent is not None:
+            self.parent.release(cost)
+    
+    def record(self, entry: LedgerEntry, reserved: float = 0.0):
+        """Record a completed call and settle its reservation."""
+        with self._lock:
+            self.entries.append(entry)
+            self.spent += entry.cost
+            self._reserved = max(0.0, self._reserved - reserved)
+        if self.parent is not None:
+            self.parent.record(entry, reserved)
+    
+    def summary(self) -> Dict:
+        """Totals overall and per model, for results files and reports."""
+        with self._lock:
+            entries = list(self.entries)
+        by_model: Dict[str, Dict] = {}
+        for entry in entries:
+            key = f"{entry.provider}:{entry.model}"
+            totals = by_model.setdefault(key, {
+                "calls": 0, "input_tokens": 0, "output_tokens": 0,
+                "cached_tokens": 0, "estimated_calls": 0, "cost_usd": 0.0
+            })
+            totals["calls"] += 1
+            totals["input_tokens"] += entry.usage.input_tokens
+            totals["output_tokens"] += entry.usage.output_tokens
+            totals["cached_tokens"] += entry.usage.cached_tokens
+            totals["estimated_calls"] += int(entry.usage.estimated)
+            totals["cost_usd"] += entry.cost
+        return {
+            "calls": len(entries),
+            "input_tokens": sum(e.usage.input_tokens for e in entries),
+            "output_tokens": sum(e.usage.output_tokens for e in entries),
+            "cached_tokens": sum(e.usage.cached_tokens for e in entries),
+            "cost_usd": round(sum(e.cost for e in entries), 6),
+            "budget_usd": self.budget_usd,
+            "by_model": by_model
+        }
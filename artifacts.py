@@ -0,0 +1,133 @@
+"""Collision-free names, atomic writes and a background writer for debate files."""
+import itertools
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, List, Optional, Union
+
+
+# Process-wide debate counter: the monotonic part of artifact_stem()
+_ids = itertools.count(1)
+_ids_lock = threading.Lock()
+
+# Process umask, read once by _file_mode()
+_umask: Optional[int] = None
+_umask_lock = threading.Lock()
+
+
+def topic_slug(topic: str, max_length: int = 40) -> str:
+    """Lower-case, dash-separated start of a topic, usable in a file name."""
+    slug = re.sub(r"[^a-z0-9]+", "-", topic.lower()).strip("-")
+    return slug[:max_length].rstrip("-") or "debate"
+
+
+def artifact_stem(topic: str) -> str:
+    """
+    Name shared by the files of one debate: <timestamp>_<topic slug>_<id>.
+    
+    The id counts the debates of this process, so debates started in the
+    same microsecond still get different names; files are named
+    debate_<stem>.json, results_<stem>.md, transcript_<stem>.md, etc.
+    """
+    with _ids_lock:
+        debate_id = next(_ids)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return f"{timestamp}_{topic_slug(topic)}_{debate_id}"
+
+
+def _file_mode(path: str) -> int:
+    """Permissions for a file written at path: the existing file's, else what open() would give."""
+    global _umask
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        pass
+    with _umask_lock:
+        if _umask is None:
+            # os.umask() can only be read by setting it; done once, under the lock
+            _umask = os.umask(0o022)
+            os.umask(_umask)
+    return 0o666 & ~_umask
+
+
+def atomic_write(path: str, data: Union[str, bytes]):
+    """
+    Write a file through a temporary file renamed over it.
+    
+    Readers (and a crash) see the previous file or the complete new one,
+    never a truncated one. The temporary file is unique, so concurrent
+    writers of the same path don't clobber each other's halves. The file
+    keeps the permissions of the one it replaces; a new file gets the
+    umask's defaults (mkstemp alone would leave it readable by its owner only).
+    """
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data.encode("utf-8") if isinstance(data, str) else data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, _file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ArtifactWriter:
+    """
+    One background thread writing debate files in submission order.
+    
+    A council hands over the rendering and writing of a finished debate's
+    files and moves on to its next debate; wait() blocks until everything
+    submitted is on disk. Pending writes finish before the interpreter exits.
+    """
+    
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+    
+    def submit(self, write: Callable[[], None]) -> Future:
+        """Queue a write; its Future raises what the write raised."""
+        future = self._executor.submit(write)
+        with self._lock:
+            # Finished writes are forgotten unless wait() has to raise their error
+            self._pending = [
+                pending for pending in self._pending if not pending.done() or pending.exception() is not None
+            ]
+            self._pending.append(future)
+        return future
+    
+    def wait(self):
+        """
+        Block until every queued write finished.
+        
+        Raises:
+            The exception of the first write that failed, once all finished
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        errors = [future.exception() for future in pending]
+        for error in errors:
+            if error is not None:
+                raise error
+
+
+_artifact_writer: Optional[ArtifactWriter] = None
+_artifact_writer_lock = threading.Lock()
+
+
+def get_artifact_writer() -> ArtifactWriter:
+    """Process-wide ArtifactWriter shared by all councils."""
+    global _artifact_writer
+    with _artifact_writer_lock:
+        if _artifact_writer is None:
+            _artifact_writer = ArtifactWriter()
+    return _artifact_writer
@@ -0,0 +1,142 @@
+"""Run batches of debates concurrently under global and per-provider caps."""
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from agents.registry import parse_spec, split_slot
+from config import Config
+
+
+def parse_provider_limits(spec: str) -> Dict[str, int]:
+    """
+    Parse per-provider concurrency caps.
+    
+    Format: ``provider=count`` entries separated by ``;`` where provider is
+    a --models provider name (0 = unlimited). Example: ``ollama=1;gemini=2``
+    """
+    limits = {}
+    for entry in spec.split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        provider, _, count = entry.partition("=")
+        try:
+            limits[provider.strip()] = int(count)
+        except ValueError:
+            raise ValueError(f"Invalid provider limit entry '{entry}'. Expected provider=count")
+    return limits
+
+
+def slot_providers(models: Iterable[str]) -> Set[str]:
+    """Providers a list of agent slots may call, hedged and fallback backends included."""
+    return {parse_spec(spec)[0] for slot in models for spec in split_slot(slot)[0]}
+
+
+@dataclass
+class BatchJob:
+    """One debate of a batch."""
+    name: str
+    providers: Set[str]  # Providers the job's agents call (see slot_providers)
+    run: Callable[[], Any]
+
+
+@dataclass
+class BatchProgress:
+    """State of a batch when one of its jobs starts or finishes."""
+    total: int
+    started: int
+    finished: int
+    running: List[str] = field(default_factory=list)  # Names of the running jobs
+    
+    @property
+    def queued(self) -> int:
+        return self.total - self.started
+
+
+class BatchScheduler:
+    """
+    Runs the jobs of a batch in worker threads, as many at once as the caps allow.
+    
+    A job starts once fewer than ``concurrency`` jobs are running and each
+    provider it uses runs fewer jobs than its cap. Jobs start in order, but
+    one waiting for a busy provider doesn't hold back later jobs that don't
+    use it. Agent calls of concurrent jobs still share the process-wide rate
+    limiter, circuit breakers and ledgers passed to their councils.
+    Interrupting a batch starts no further jobs; running ones finish first.
+    """
+    
+    def __init__(self, concurrency: Optional[int] = None, provider_limits: Optional[Dict[str, int]] = None):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            concurrency: Jobs running at once (default: Config.TECH_WATCH_CONCURRENCY)
+            provider_limits: Jobs running at once per provider, 0 = unlimited
+                            (default: Config.TECH_WATCH_PROVIDER_LIMITS)
+        """
+        self.concurrency = max(1, Config.TECH_WATCH_CONCURRENCY if concurrency is None else concurrency)
+        self.provider_limits = (
+            parse_provider_limits(Config.TECH_WATCH_PROVIDER_LIMITS) if provider_limits is None else provider_limits
+        )
+    
+    def _fits(self, job: BatchJob, busy: Counter) -> bool:
+        return all(
+            not self.provider_limits.get(provider) or busy[provider] < self.provider_limits[provider]
+            for provider in job.providers
+        )
+    
+    def run(
+        self,
+        jobs: List[BatchJob],
+        on_start: Optional[Callable[[BatchJob, BatchProgress], None]] = None,
+        on_finish: Optional[Callable[[BatchJob, Any, float, BatchProgress], None]] = None
+    ) -> List[Any]:
+        """
+        Run every job and return their results in job order.
+        
+        Args:
+            jobs: Jobs to run
+            on_start: Called with a job and the batch's progress when it starts
+            on_finish: Called with a job, its result, its duration in seconds and
+                      the batch's progress when it finishes
+        
+        An exception raised by a job is raised here once the running jobs finished.
+        """
+        results: List[Any] = [None] * len(jobs)
+        pending = list(range(len(jobs)))
+        running: Dict[Future, int] = {}
+        started_at: Dict[int, float] = {}
+        busy: Counter = Counter()
+        progress = BatchProgress(total=len(jobs), started=0, finished=0)
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch") as executor:
+            while pending or running:
+                for index in list(pending):
+                    if len(running) >= self.concurrency:
+                        break
+                    job = jobs[index]
+                    if not self._fits(job, busy):
+                        continue
+                    pending.remove(index)
+                    busy.update(job.providers)
+                    progress.started += 1
+                    progress.running.append(job.name)
+                    if on_start:
+                        on_start(job, progress)
+                    started_at[index] = time.monotonic()
+                    running[executor.submit(job.run)] = index
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    job = jobs[index]
+                    busy.subtract(job.providers)
+                    progress.finished += 1
+                    progress.running.remove(job.name)
+                    results[index] = future.result()
+                    if on_finish:
+                        on_finish(job, results[index], time.monotonic() - started_at[index], progress)
+        
+        return results
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark of the Markdown section index and the builders using it.
+
+Generates syntheses of increasing size and times indexing them and the three
+renderers that read sections (results document, results extract, key
+points). Throughput should stay flat as documents grow: each renderer scans
+its input once. Checks first that code fences left open by truncated
+responses don't hide the sections after them, and that the synthesis title
+is not a section of the results document (exits with 1 otherwise).
+
+Usage:
+    python benchmark_markdown_sections.py
+    python benchmark_markdown_sections.py --sizes 1 4 16 --repeat 5
+"""
+
+import sys
+import time
+import random
+import argparse
+
+from markdown_sections import SectionIndex
+from agents import AgentResponse
+from council import DebateResult
+from extract_results import extract_results_from_markdown
+from generate_results_article import extract_key_points
+
+# Fix Windows console encoding
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+HEADERS = [
+    "## Executive Summary", "## Introduction", "## Detailed Analysis", "### Security Model",
+    "## Source Validation", "## Common Misconceptions", "**Technical Deep Dive**", "## Best Practices",
+    "### Performance Notes", "## Implementation", "## Round 2 Discussion", "## Conclusion",
+]
+
+WORDS = (
+    "agents protocol latency design pattern architecture cache retry quality consensus source "
+    "evidence throughput deployment https://example.org/paper scaling failure review"
+).split()
+
+
+def make_synthesis(size_mb: float, seed: int = 0) -> str:
+    """Synthetic synthesis of about ``size_mb`` megabytes with repeated section headers."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts = []
+    length = 0
+    while length < target:
+        block = [rng.choice(HEADERS), ""]
+        for _ in range(rng.randint(5, 30)):
+            line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 20)))
+            block.append(f"- {line}" if rng.random() < 0.3 else line)
+        if rng.random() < 0.1:
+            block += ["```python", "## not a header", "print('code')", "```"]
+        block.append("")
+        text = "\n".join(block)
+        parts.append(text)
+        length += len(text) + 1
+    return "\n".join(parts)
+
+
+def check_sections() -> list:
+    """Failed section checks (empty when all pass)."""
+    failures = []
+    
+    # A response cut inside a code block must not swallow the rest of the article
+    response = AgentResponse("Agent", "## Analysis\n```python\n" + "x = 1\n" * 500, "model", tokens_used=1)
+    result = DebateResult(
+        topic="Check", rounds=[[response]], synthesis="## Conclusion\ndone", timestamp="",
+        total_tokens=1, participating_agents=["Agent"]
+    )
+    article = result._build_markdown_article()
+    if not SectionIndex(article).get("COMPREHENSIVE SYNTHESIS ARTICLE"):
+        failures.append("closed fence: synthesis hidden after a truncated response")
+    unclosed = article.replace("x = 1...\n```\n", "x = 1...\n")
+    if not SectionIndex(unclosed).get("COMPREHENSIVE SYNTHESIS ARTICLE"):
+        failures.append("unclosed fence: synthesis hidden after a truncated response (older articles)")
+    
+    # "# Title" lines are not sections of the results document: its intro text
+    # must not show up as security content
+    result.synthesis = "# Security Title\nintro text\n## Performance\nfast"
+    document = result._build_results_document()
+    if "intro text" in document:
+        failures.append("results document: the '# Title' line was read as a section")
+    return failures
+
+
+def best_time(func, repeat: int) -> float:
+    """Fastest of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Markdown section index")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 2, 4, 8], help="Document sizes in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (fastest is kept)")
+    args = parser.parse_args()
+    
+    failures = check_sections()
+    for failure in failures:
+        print(f"[X] {failure}")
+    if failures:
+        return 1
+    
+    print(f"{'Size':>8} {'Sections':>9} {'Index':>20} {'Results doc':>20} {'Extract':>20} {'Key points':>20}")
+    for size in args.sizes:
+        synthesis = make_synthesis(size)
+        megabytes = len(synthesis.encode("utf-8")) / (1024 * 1024)
+        result = DebateResult(
+            topic="Benchmark", rounds=[[]], synthesis=synthesis, timestamp="",
+            total_tokens=0, participating_agents=[]
+        )
+        timings = [
+            best_time(lambda: SectionIndex(synthesis), args.repeat),
+            best_time(result._build_results_document, args.repeat),
+            best_time(lambda: extract_results_from_markdown(synthesis), args.repeat),
+            best_time(lambda: extract_key_points(synthesis), args.repeat),
+        ]
+        columns = " ".join(f"{f'{seconds * 1000:.0f} ms ({megabytes / seconds:.1f} MB/s)':>20}" for seconds in timings)
+        print(f"{megabytes:>6.1f}MB {len(SectionIndex(synthesis).sections):>9} {columns}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Startup benchmark and lazy-import check of the CLI.
+
+Times ``python -c "import main"`` and ``python main.py --help`` in fresh
+interpreters, then checks that importing ``agents`` and ``main`` loads no
+provider SDK: agent modules and their SDKs are imported only when a
+provider is used (see agents.registry). Exits with 1 when an SDK is
+imported eagerly or a command is slower than --max-seconds.
+
+Usage:
+    python benchmark_startup.py
+    python benchmark_startup.py --repeat 10 --max-seconds 1
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+from agents.registry import PROVIDERS
+
+# Fix Windows console encoding
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+COMMANDS = {
+    "import main": [sys.executable, "-c", "import main"],
+    "main.py --help": [sys.executable, "main.py", "--help"],
+}
+
+# SDKs that must not be imported at startup: every provider's, plus the big ones by name
+SDK_MODULES = sorted(
+    {package for provider in PROVIDERS.values() for package in provider.packages}
+    | {"anthropic", "google.generativeai", "openai", "ollama"}
+)
+
+CHECK_IMPORTS = (
+    "import sys, json\n"
+    "import agents, main\n"
+    "print(json.dumps([name for name in {modules!r} if name in sys.modules]))\n"
+)
+
+
+def best_time(command, repeat: int) -> float:
+    """Fastest of ``repeat`` runs of a command, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=HERE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def eager_sdks() -> list:
+    """Provider SDKs in sys.modules after importing agents and main in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", CHECK_IMPORTS.format(modules=SDK_MODULES)],
+        cwd=HERE, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup and check lazy provider imports")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command (fastest is kept)")
+    parser.add_argument("--max-seconds", type=float, default=0, help="Fail when a command is slower (0 = no limit)")
+    args = parser.parse_args()
+    
+    failed = False
+    for name, command in COMMANDS.items():
+        seconds = best_time(command, args.repeat)
+        slow = args.max_seconds and seconds > args.max_seconds
+        failed = failed or slow
+        print(f"{name:<16} {seconds * 1000:>7.0f} ms{'  [SLOW]' if slow else ''}")
+    
+    loaded = eager_sdks()
+    if loaded:
+        failed = True
+        print(f"[X] Provider SDKs imported at startup: {', '.join(loaded)}")
+    else:
+        print(f"[OK] No provider SDK imported at startup ({len(SDK_MODULES)} checked)")
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""Crash-safe checkpoints of debates in progress."""
+import json
+import os
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from agents import AgentResponse
+from config import Config
+
+
+# Bumped when the file layout changes; older checkpoints are refused
+CHECKPOINT_VERSION = 1
+
+
+class DebateCheckpoint:
+    """
+    Every successful response of a debate, saved to a JSON file as it lands.
+    
+    Responses are keyed by round and agent name (the synthesis is round 999).
+    Resuming a debate from its checkpoint runs it again from the start, but
+    each agent call that already succeeded is answered from the checkpoint
+    instead of the provider, so a debate that died in round 3 or during
+    synthesis only pays for the calls it had not finished. The file is
+    rewritten atomically (temp file + rename) so a crash mid-write leaves
+    the previous version intact. Safe to share between threads.
+    """
+    
+    def __init__(self, path: str, topic: str, rounds: int, agents: List[str]):
+        """
+        Start an empty checkpoint (see create() and load()).
+        
+        Args:
+            path: JSON file the checkpoint is saved to
+            topic: Topic of the debate
+            rounds: Rounds the debate was started with
+            agents: Names of the participating agents
+        """
+        self.path = path
+        self.topic = topic
+        self.rounds = rounds
+        self.agents = agents
+        self.completed_rounds = 0
+        self.created = datetime.now().isoformat()
+        self._responses: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def create(
+        cls,
+        topic: str,
+        rounds: int,
+        agents: List[str],
+        directory: Optional[str] = None
+    ) -> "DebateCheckpoint":
+        """New checkpoint file in ``directory`` (default: Config.CHECKPOINT_DIR)."""
+        directory = Config.CHECKPOINT_DIR if directory is None else directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        checkpoint = cls(os.path.join(directory, f"checkpoint_{timestamp}.json"), topic, rounds, agents)
+        checkpoint.save()
+        return checkpoint
+    
+    @classmethod
+    def load(cls, path: str) -> "DebateCheckpoint":
+        """
+        Load a checkpoint to resume its debate.
+        
+        Raises:
+            ValueError: If the file is missing or not a checkpoint this version can resume
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot read checkpoint {path}: {e}") from e
+        if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Not a version {CHECKPOINT_VERSION} debate checkpoint: {path}")
+        
+        checkpoint = cls(path, data["topic"], data["rounds"], data["agents"])
+        checkpoint.completed_rounds = data.get("completed_rounds", 0)
+        checkpoint.created = data.get("created", checkpoint.created)
+        checkpoint._responses = data.get("responses", {})
+        return checkpoint
+    
+    @staticmethod
+    def _key(round_num: int, agent_name: str) -> str:
+        return f"{round_num}:{agent_name}"
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._responses)
+    
+    def get(self, round_num: int, agent_name: str) -> Optional[AgentResponse]:
+        """The saved response of an agent in a round, marked as resumed, or None."""
+        with self._lock:
+            payload = self._responses.get(self._key(round_num, agent_name))
+        if payload is None:
+            return None
+        response = AgentResponse(**payload)
+        response.metadata = {**(response.metadata or {}), "resumed": True}
+        return response
+    
+    def record(self, round_num: int, agent_name: str, response: AgentResponse):
+        """Save an agent's response; failed calls are not saved, so a resumed debate calls them again."""
+        if response.error:
+            return
+        payload = json.loads(json.dumps(asdict(response), ensure_ascii=False, default=str))
+        with self._lock:
+            self._responses[self._key(round_num, agent_name)] = payload
+            self._save()
+    
+    def complete_round(self, round_num: int):
+        """Note that a round finished."""
+        with self._lock:
+            self.completed_rounds = max(self.completed_rounds, round_num)
+            self._save()
+    
+    def save(self):
+        """Write the checkpoint file."""
+        with self._lock:
+            self._save()
+    
+    def _save(self):
+        """Write the checkpoint file (called with the lock held)."""
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "topic": self.topic,
+            "rounds": self.rounds,
+            "agents": self.agents,
+            "created": self.created,
+            "updated": datetime.now().isoformat(),
+            "completed_rounds": self.completed_rounds,
+            "responses": self._responses
+        }
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except OSError:
+            # A checkpoint that can't be written must not fail the debate itself
+            pass
+    
+    def remove(self):
+        """Delete the checkpoint file once its debate's results are saved."""
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
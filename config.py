@@ -1,5 +1,6 @@
 """Configuration module for LLM Council."""
 import os
+from importlib.util import find_spec
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -34,6 +35,9 @@ class Config:
     
     # Free/Open Source Model Names
     OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "llama2")
+    OLLAMA_KEEP_ALIVE: str = os.getenv("OLLAMA_KEEP_ALIVE", "30m")  # How long models stay loaded after a call
+    OLLAMA_MEMORY_GB: float = float(os.getenv("OLLAMA_MEMORY_GB", "0"))  # Memory for resident models; 0 = 75% of RAM
+    OLLAMA_RESIDENCY: bool = os.getenv("OLLAMA_RESIDENCY", "true").lower() == "true"  # Preload and order calls to avoid swaps
     GROQ_MODEL: str = os.getenv("GROQ_MODEL", "llama3-8b-8192")  # Smaller model, less likely to hit limits
     HUGGINGFACE_MODEL: str = os.getenv("HUGGINGFACE_MODEL", "mistralai/Mistral-7B-Instruct-v0.2")
     DEEPSEEK_MODEL: str = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")  # deepseek-chat or deepseek-coder
@@ -56,6 +60,113 @@ class Config:
     TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
     MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "2000"))
     
+    # Parallel round settings (0 = one worker per agent)
+    PARALLEL_ROUNDS: bool = os.getenv("PARALLEL_ROUNDS", "false").lower() == "true"
+    MAX_CONCURRENCY: int = int(os.getenv("MAX_CONCURRENCY", "0"))
+    
+    # Context budget: how previous responses are trimmed when a prompt would
+    # overflow the model's context window (truncate_oldest, latest_round, clip)
+    CONTEXT_POLICY: str = os.getenv("CONTEXT_POLICY", "clip")
+    CONTEXT_MAX_INPUT_TOKENS: int = int(os.getenv("CONTEXT_MAX_INPUT_TOKENS", "0"))  # 0 = model window
+    CONTEXT_RESERVE_TOKENS: int = int(os.getenv("CONTEXT_RESERVE_TOKENS", "1024"))  # Room for the user prompt
+    
+    # Mark stable prompt prefixes for provider caching (Anthropic cache_control;
+    # OpenAI, DeepSeek and Gemini cache repeated prefixes automatically)
+    PROMPT_CACHING: bool = os.getenv("PROMPT_CACHING", "true").lower() == "true"
+    
+    # Multi-turn debates: each agent keeps its conversation across rounds and
+    # is sent only the responses that are new since its last turn
+    MULTI_TURN: bool = os.getenv("MULTI_TURN", "false").lower() == "true"
+    
+    # Rate limits per provider or provider:model, as key=rpm[/tpm] separated by ';'
+    # Provider keys are --models names (claude, chatgpt, gemini, mistral, ollama,
+    # groq, huggingface, deepseek, openrouter, comet); anthropic, openai and
+    # google work too. See RATE_LIMIT_GUIDE.md.
+    RATE_LIMITS: str = os.getenv("RATE_LIMITS", "groq=30;gemini=60;openrouter=20")
+    
+    # Shared HTTP connection pool for OpenAI-compatible providers; the timeouts
+    # apply to every provider's calls
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))  # Seconds
+    HTTP_TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", "120"))  # Read/write timeout in seconds
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+    HTTP2: bool = os.getenv("HTTP2", "true").lower() == "true"  # Needs the h2 package (httpx[http2])
+    
+    # Early stop: end a debate once a round converged, i.e. agents' answers
+    # are at least CONVERGENCE_THRESHOLD similar to their previous ones
+    # (lexical cosine, 0-1) with at most CONVERGENCE_MAX_NEW_CITATIONS new
+    # sources. At least CONVERGENCE_MIN_ROUNDS rounds always run
+    EARLY_STOP: bool = os.getenv("EARLY_STOP", "false").lower() == "true"
+    CONVERGENCE_THRESHOLD: float = float(os.getenv("CONVERGENCE_THRESHOLD", "0.5"))
+    CONVERGENCE_MAX_NEW_CITATIONS: int = int(os.getenv("CONVERGENCE_MAX_NEW_CITATIONS", "1"))
+    CONVERGENCE_MIN_ROUNDS: int = int(os.getenv("CONVERGENCE_MIN_ROUNDS", "2"))
+    
+    # Hedged calls to agents with equivalent backends ("groq|openrouter:..."):
+    # the next backend is called once a call runs past HEDGE_PERCENTILE of
+    # its backend's recent latencies, or HEDGE_DELAY seconds until known
+    HEDGE_PERCENTILE: float = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    HEDGE_DELAY: float = float(os.getenv("HEDGE_DELAY", "10"))
+    
+    # Circuit breakers: after BREAKER_THRESHOLD consecutive transient failures
+    # a provider is skipped (or its fallback used) for BREAKER_COOLDOWN
+    # seconds, then probed with one call. State persists in BREAKER_PATH
+    BREAKER_THRESHOLD: int = int(os.getenv("BREAKER_THRESHOLD", "3"))  # 0 = disabled
+    BREAKER_COOLDOWN: float = float(os.getenv("BREAKER_COOLDOWN", "120"))
+    BREAKER_PATH: str = os.getenv("BREAKER_PATH", ".llm_council_breakers.json")
+    
+    # Round deadlines: stop waiting for stragglers after ROUND_DEADLINE seconds
+    # (0 = wait for every agent) or, in parallel rounds, once ROUND_QUORUM
+    # agents answered (0 = all). LATE_RESPONSES: next_round folds answers that
+    # arrive later into the next round's context, drop discards them
+    ROUND_DEADLINE: float = float(os.getenv("ROUND_DEADLINE", "0"))
+    ROUND_QUORUM: int = int(os.getenv("ROUND_QUORUM", "0"))
+    LATE_RESPONSES: str = os.getenv("LATE_RESPONSES", "next_round")
+    
+    # Retries of failed provider calls (429/5xx/timeouts; auth and validation errors fail fast)
+    RETRY_MAX_ATTEMPTS: int = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))  # Total attempts per call
+    RETRY_BASE_DELAY: float = float(os.getenv("RETRY_BASE_DELAY", "1.0"))  # Seconds, doubled per attempt
+    RETRY_MAX_DELAY: float = float(os.getenv("RETRY_MAX_DELAY", "60"))  # Longer Retry-After hints give up
+    RETRY_FAILED_AGENTS: bool = os.getenv("RETRY_FAILED_AGENTS", "false").lower() == "true"
+    
+    # Spend budgets in USD (0 = unlimited). BUDGET_USD caps each debate,
+    # BATCH_BUDGET_USD a whole tech-watch run. When a call would not fit:
+    # abort (raise), skip_rounds (stop debating, go to synthesis) or shrink
+    # (lower max_tokens to what the budget still covers)
+    BUDGET_USD: float = float(os.getenv("BUDGET_USD", "0"))
+    BATCH_BUDGET_USD: float = float(os.getenv("BATCH_BUDGET_USD", "0"))
+    BUDGET_POLICY: str = os.getenv("BUDGET_POLICY", "skip_rounds")
+    # Price overrides in USD per million tokens: model=input/output[/cached];...
+    MODEL_PRICES: str = os.getenv("MODEL_PRICES", "")
+    
+    # Tech-watch batches: topics debated at once, and per --models provider
+    # caps on the topics using it at once, as provider=count separated by ';'
+    # (0 = unlimited). A local Ollama server serves one topic at a time
+    TECH_WATCH_CONCURRENCY: int = int(os.getenv("TECH_WATCH_CONCURRENCY", "1"))
+    TECH_WATCH_PROVIDER_LIMITS: str = os.getenv("TECH_WATCH_PROVIDER_LIMITS", "ollama=1")
+    # Topics unchanged since a debate less than TECH_WATCH_TTL_DAYS ago (0 =
+    # always debate) are not debated again: skip keeps their results,
+    # resynthesize only writes a new synthesis of their saved rounds
+    TECH_WATCH_TTL_DAYS: float = float(os.getenv("TECH_WATCH_TTL_DAYS", "0"))
+    TECH_WATCH_REUSE: str = os.getenv("TECH_WATCH_REUSE", "skip")
+    
+    # How debate results are saved: json (one document at the end), jsonl
+    # (appended to as each response lands) or jsonl.zst (zstd-compressed;
+    # needs the zstandard package). orjson is used when installed
+    RESULTS_FORMAT: str = os.getenv("RESULTS_FORMAT", "json")
+    # Write finished debates' results and documents in a background thread
+    # so the next debate of a batch starts right away
+    BACKGROUND_WRITES: bool = os.getenv("BACKGROUND_WRITES", "false").lower() == "true"
+    
+    # Checkpoints of debates in progress (resume with --resume); each is
+    # deleted once its debate's results are saved. Empty = no checkpoints
+    CHECKPOINT_DIR: str = os.getenv("CHECKPOINT_DIR", ".llm_council_checkpoints")
+    
+    # Response cache (used with --cache / --replay)
+    CACHE_PATH: str = os.getenv("CACHE_PATH", ".llm_council_cache.sqlite3")
+    CACHE_MAX_AGE_DAYS: float = float(os.getenv("CACHE_MAX_AGE_DAYS", "30"))  # 0 = never expire
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))  # 0 = unlimited
+    
     @classmethod
     def validate(cls) -> bool:
         """Validate that at least some models are available (API keys OR installed packages)."""
@@ -72,24 +183,14 @@ class Config:
         
         # Check for installed free packages
         free_packages = []
-        try:
-            import ollama
+        if cls.is_package_installed("ollama"):
             free_packages.append("ollama")
-        except ImportError:
-            pass
         
-        try:
-            import groq
-            if cls.GROQ_API_KEY:  # Groq needs an API key
-                free_packages.append("groq")
-        except ImportError:
-            pass
+        if cls.GROQ_API_KEY and cls.is_package_installed("groq"):  # Groq needs an API key
+            free_packages.append("groq")
         
-        try:
-            import huggingface_hub
+        if cls.is_package_installed("huggingface_hub"):
             free_packages.append("huggingface")
-        except ImportError:
-            pass
         
         total_available = len(available_keys) + len(free_packages)
         
@@ -107,6 +208,15 @@ class Config:
             )
         return True
     
+    @staticmethod
+    def is_package_installed(package: str) -> bool:
+        """Whether a package is importable, checked without importing it."""
+        try:
+            return find_spec(package) is not None
+        except (ImportError, ValueError):
+            # Missing parent package, e.g. "google" for google.generativeai
+            return False
+    
     @classmethod
     def get_available_models(cls) -> list[str]:
         """Return list of available models based on API keys and installed packages."""
@@ -127,24 +237,14 @@ class Config:
             models.append("deepseek")
         
         # Free/Open source models
-        try:
-            import ollama
+        if cls.is_package_installed("ollama"):
             models.append("ollama")
-        except ImportError:
-            pass
         
-        if cls.GROQ_API_KEY:
-            try:
-                import groq
-                models.append("groq")
-            except ImportError:
-                pass
+        if cls.GROQ_API_KEY and cls.is_package_installed("groq"):
+            models.append("groq")
         
-        try:
-            import huggingface_hub
+        if cls.is_package_installed("huggingface_hub"):
             models.append("huggingface")
-        except ImportError:
-            pass
         
         # Advanced Providers
         if cls.OPENROUTER_API_KEY:
@@ -0,0 +1,140 @@
+"""Detect when successive debate rounds stop adding information."""
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from agents import AgentResponse
+from config import Config
+
+
+_WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9'+#.-]*[a-z0-9+#]|[a-z0-9]")
+
+# URLs, DOIs and arXiv identifiers, the citation forms the round prompts ask for
+_CITATION_PATTERN = re.compile(
+    r"https?://[^\s<>()\[\]\"'`]+|\b10\.\d{4,9}/[^\s<>()\[\]\"'`]+|\barxiv:\s?\d{4}\.\d{4,5}",
+    re.IGNORECASE
+)
+
+# Words too common to say anything about a response's content
+STOP_WORDS = frozenset("""
+a an and are as at be been but by can could do does for from has have how if in into is it its
+may more most not of on or our should so such than that the their them then there these they
+this to was we were what when which while who will with would you your also other each both
+""".split())
+
+
+def _terms(text: str) -> Counter:
+    """Content words and word pairs of a text."""
+    words = [word for word in _WORD_PATTERN.findall(text.lower()) if word not in STOP_WORDS]
+    return Counter(words + [f"{first} {second}" for first, second in zip(words, words[1:])])
+
+
+def similarity(first: str, second: str) -> float:
+    """Cosine similarity of two texts' word and word-pair counts (0 = unrelated, 1 = same)."""
+    a, b = _terms(first), _terms(second)
+    if not a or not b:
+        return 0.0
+    dot = sum(count * b[term] for term, count in a.items() if term in b)
+    return dot / (math.sqrt(sum(c * c for c in a.values())) * math.sqrt(sum(c * c for c in b.values())))
+
+
+def extract_citations(text: str) -> Set[str]:
+    """Normalized URLs, DOIs and arXiv ids cited in a text."""
+    citations = set()
+    for match in _CITATION_PATTERN.findall(text):
+        citation = match.rstrip(".,;:!?*_").lower().replace("arxiv: ", "arxiv:")
+        if citation.startswith(("http://", "https://")):
+            citation = citation.split("://", 1)[1].removeprefix("www.").rstrip("/")
+        citations.add(citation)
+    return citations
+
+
+@dataclass
+class RoundComparison:
+    """How much a round changed from the one before it."""
+    round_num: int
+    similarity: float  # Mean similarity of each agent's response to its previous one
+    new_citations: int  # Citations no earlier round had
+    agents_compared: int
+    converged: bool
+    
+    def to_dict(self) -> Dict:
+        return {**asdict(self), "similarity": round(self.similarity, 3)}
+    
+    def describe(self) -> str:
+        citations = "no new citations" if not self.new_citations else f"{self.new_citations} new citations"
+        return f"similarity {self.similarity:.2f} to round {self.round_num - 1}, {citations}"
+
+
+class ConvergenceDetector:
+    """
+    Compares successive debate rounds to stop a debate that has converged.
+    
+    Each agent's response is compared with its own response in the previous
+    round by lexical similarity, and the round's citations with those of all
+    earlier rounds. A round has converged when agents mostly repeat
+    themselves (mean similarity at least ``threshold``) and brought at most
+    ``max_new_citations`` new sources; further rounds would only rephrase.
+    """
+    
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        max_new_citations: Optional[int] = None,
+        min_rounds: Optional[int] = None
+    ):
+        """
+        Initialize the detector.
+        
+        Args:
+            threshold: Mean similarity at which a round counts as converged
+                      (default: Config.CONVERGENCE_THRESHOLD)
+            max_new_citations: New citations a converged round may still add
+                              (default: Config.CONVERGENCE_MAX_NEW_CITATIONS)
+            min_rounds: Rounds always run before stopping early
+                       (default: Config.CONVERGENCE_MIN_ROUNDS, at least 2)
+        """
+        self.threshold = Config.CONVERGENCE_THRESHOLD if threshold is None else threshold
+        self.max_new_citations = (
+            Config.CONVERGENCE_MAX_NEW_CITATIONS if max_new_citations is None else max_new_citations
+        )
+        self.min_rounds = max(2, Config.CONVERGENCE_MIN_ROUNDS if min_rounds is None else min_rounds)
+    
+    def _successful(self, responses: Iterable[AgentResponse]) -> List[AgentResponse]:
+        return [response for response in responses if not response.error]
+    
+    def compare(self, all_rounds: List[List[AgentResponse]]) -> Optional[RoundComparison]:
+        """Compare the last round with the one before it (None before the second round)."""
+        if len(all_rounds) < 2:
+            return None
+        previous = {response.agent_name: response for response in self._successful(all_rounds[-2])}
+        current = self._successful(all_rounds[-1])
+        
+        scores = [
+            similarity(previous[response.agent_name].content, response.content)
+            for response in current if response.agent_name in previous
+        ]
+        earlier_citations = set()
+        for responses in all_rounds[:-1]:
+            for response in self._successful(responses):
+                earlier_citations |= extract_citations(response.content)
+        new_citations = set()
+        for response in current:
+            new_citations |= extract_citations(response.content) - earlier_citations
+        
+        mean_similarity = sum(scores) / len(scores) if scores else 0.0
+        return RoundComparison(
+            round_num=len(all_rounds),
+            similarity=mean_similarity,
+            new_citations=len(new_citations),
+            agents_compared=len(scores),
+            # Half the agents must have answered both rounds for the comparison to mean anything
+            converged=(
+                len(all_rounds) >= self.min_rounds
+                and len(scores) * 2 >= len(all_rounds[-1])
+                and mean_similarity >= self.threshold
+                and len(new_citations) <= self.max_new_citations
+            )
+        )
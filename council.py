@@ -1,10 +1,15 @@
 """Main LLM Council orchestrator."""
 import sys
 import os
-from typing import List, Optional, Dict
-from dataclasses import dataclass, asdict
+from typing import Any, List, Optional, Dict
+from dataclasses import dataclass, asdict, field
 import json
+import asyncio
+import threading
+import time
 from datetime import datetime
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Fix Windows console encoding issues with Rich
 if sys.platform == "win32":
@@ -16,7 +21,31 @@ from rich.markdown import Markdown
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from agents import BaseAgent, AgentResponse
+from agents.circuit_breaker import CircuitBreakers, CircuitOpenError, get_circuit_breakers
+from agents.latency import LatencyTracker, get_latency_tracker
+from agents.model_info import ContextWindowExceededError, count_tokens, get_context_window
+from agents.rate_limiter import RateLimiter, Reservation, get_rate_limiter
+from agents.retry import RetryPolicy
+from agents.ollama_residency import OllamaResidencyPlanner
+from agents.usage import (
+    BUDGET_POLICIES, MIN_OUTPUT_TOKENS, BudgetExceededError, LedgerEntry, Usage, UsageLedger,
+    get_model_price, normalize_usage
+)
+from artifacts import artifact_stem, atomic_write, get_artifact_writer
+from checkpoint import DebateCheckpoint
 from config import Config
+from convergence import ConvergenceDetector
+from debate_log import RESULTS_FORMATS, DebateLog, load_debate
+from markdown_sections import RESPONSE_TRUNCATED, SectionIndex, open_fence
+from response_cache import ResponseCache, CacheMissError
+
+
+# What happens to answers that arrive after their round was cut off
+LATE_RESPONSE_POLICIES = ("next_round", "drop")
+
+
+class RoundDeadlineExceeded(TimeoutError):
+    """An agent had not answered when its round's deadline passed or its quorum was reached."""
 
 
 @dataclass
@@ -28,6 +57,13 @@ class DebateResult:
     timestamp: str
     total_tokens: int
     participating_agents: List[str]
+    cached_tokens: int = 0  # Input tokens served from provider prompt caches
+    cost_usd: float = 0.0
+    usage: Optional[Dict] = None  # UsageLedger.summary() of the debate
+    stop_reason: Optional[str] = None  # Why the debate ended before its last round, if it did
+    convergence: Optional[List[Dict]] = None  # RoundComparison of each round with the previous one
+    # Files the debate was saved to by kind (results, markdown, transcript); not serialized
+    artifacts: Dict[str, str] = field(default_factory=dict)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
@@ -35,6 +71,11 @@ class DebateResult:
             "topic": self.topic,
             "timestamp": self.timestamp,
             "total_tokens": self.total_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cost_usd": self.cost_usd,
+            "usage": self.usage,
+            "stop_reason": self.stop_reason,
+            "convergence": self.convergence,
             "participating_agents": self.participating_agents,
             "rounds": [
                 [
@@ -52,32 +93,72 @@ class DebateResult:
             "synthesis": self.synthesis
         }
     
-    def save_to_file(self, filename: Optional[str] = None):
-        """Save debate results to JSON file."""
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DebateResult":
+        """Rebuild a result from to_dict() output (responses keep only the fields saved)."""
+        return cls(
+            topic=data["topic"],
+            rounds=[
+                [
+                    AgentResponse(
+                        agent_name=resp["agent_name"],
+                        content=resp["content"],
+                        model=resp["model"],
+                        tokens_used=resp.get("tokens_used"),
+                        metadata=resp.get("metadata")
+                    )
+                    for resp in round_responses
+                ]
+                for round_responses in data.get("rounds", [])
+            ],
+            synthesis=data.get("synthesis", ""),
+            timestamp=data.get("timestamp", ""),
+            total_tokens=data.get("total_tokens", 0),
+            participating_agents=data.get("participating_agents", []),
+            cached_tokens=data.get("cached_tokens", 0),
+            cost_usd=data.get("cost_usd", 0.0),
+            usage=data.get("usage"),
+            stop_reason=data.get("stop_reason"),
+            convergence=data.get("convergence")
+        )
+    
+    @classmethod
+    def load(cls, filename: str) -> "DebateResult":
+        """Load results saved by save_to_file() or a debate log (.jsonl, .jsonl.zst)."""
+        if ".jsonl" in os.path.basename(filename):
+            return load_debate(filename)
+        with open(filename, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+    
+    def save_to_file(self, filename: Optional[str] = None, directory: str = ""):
+        """
+        Save debate results to JSON file, atomically (see artifacts.atomic_write).
+        
+        The default name, debate_<artifact_stem>.json in ``directory``, is
+        unique even for debates saved at the same time.
+        """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"debate_{timestamp}.json"
+            filename = os.path.join(directory, f"debate_{artifact_stem(self.topic)}.json")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        atomic_write(filename, json.dumps(self.to_dict(), indent=2, ensure_ascii=False))
         
         return filename
     
-    def save_to_markdown(self, filename: Optional[str] = None, results_only: bool = False) -> str:
+    def save_to_markdown(self, filename: Optional[str] = None, results_only: bool = False, directory: str = "") -> str:
         """
         Save debate results as a comprehensive Markdown article.
         
         Args:
             filename: Optional custom filename (without extension)
             results_only: If True, generate results-focused document without discussions
+            directory: Where the default filename (see save_to_file) is created
             
         Returns:
             Path to the saved Markdown file
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             prefix = "results_" if results_only else "article_"
-            filename = f"{prefix}{timestamp}.md"
+            filename = os.path.join(directory, f"{prefix}{artifact_stem(self.topic)}.md")
         elif not filename.endswith('.md'):
             filename = f"{filename}.md"
         
@@ -87,8 +168,7 @@ class DebateResult:
         else:
             markdown_content = self._build_markdown_article()
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        atomic_write(filename, markdown_content)
         
         return filename
     
@@ -181,8 +261,12 @@ class DebateResult:
                 content = response.content
                 if len(content) > 2000:
                     lines.append(f"{content[:2000]}...")
+                    # Close a code block the cut went through
+                    fence = open_fence(content[:2000])
+                    if fence:
+                        lines.append(fence)
                     lines.append("")
-                    lines.append(f"*[Response truncated - see full content in JSON file]*")
+                    lines.append(RESPONSE_TRUNCATED)
                 else:
                     lines.append(content)
                 
@@ -246,6 +330,17 @@ class DebateResult:
         
         return "\n".join(lines)
     
+    def _cost_text(self, free_note: str) -> str:
+        """What the debate cost, with the ledger's token totals (``free_note`` when nothing was charged)."""
+        if not self.cost_usd:
+            return f"$0.00 ({free_note})"
+        if not self.usage or not self.usage.get("calls"):
+            return f"${self.cost_usd:.4f}"
+        return (
+            f"${self.cost_usd:.4f} ({self.usage['input_tokens']:,} input, "
+            f"{self.usage['output_tokens']:,} output tokens)"
+        )
+    
     def _truncate(self, text: str, max_length: int) -> str:
         """Truncate text for diagram labels."""
         text = text.strip().replace("\n", " ")
@@ -268,8 +363,10 @@ class DebateResult:
         lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         lines.append(f"**Analysis by**: {', '.join(self.participating_agents)}")
         lines.append(f"**Research Depth**: {len(self.rounds)} rounds of multi-agent analysis")
+        if self.stop_reason:
+            lines.append(f"**Stopped Early**: {self.stop_reason}")
         lines.append(f"**Total Analysis**: {self.total_tokens:,} tokens")
-        lines.append("**Cost**: $0.00 (100% FREE with open-source models)")
+        lines.append(f"**Cost**: {self._cost_text('100% FREE with open-source models')}")
         lines.append("")
         lines.append("---")
         lines.append("")
@@ -290,54 +387,42 @@ class DebateResult:
         lines.append("---")
         lines.append("")
         
-        # Parse synthesis into structured sections
-        synthesis_text = self.synthesis
-        
-        # Extract sections based on keywords
-        sections = self._parse_synthesis_sections(synthesis_text)
+        # Index the synthesis sections ("##" and deeper, as before) once; every lookup below uses the index
+        sections = SectionIndex(self.synthesis, min_level=2)
         
         # Add Executive Summary
-        if "EXECUTIVE SUMMARY" in sections or "SUMMARY" in sections:
+        if sections.get("EXECUTIVE SUMMARY", "SUMMARY"):
             lines.append("## 📊 Executive Summary")
             lines.append("")
-            content = sections.get("EXECUTIVE SUMMARY", sections.get("SUMMARY", ""))
-            lines.append(content.strip())
+            lines.append(sections.content("EXECUTIVE SUMMARY", "SUMMARY").strip())
             lines.append("")
             lines.append("---")
             lines.append("")
         
         # Add Introduction/Context
-        if "INTRODUCTION" in sections:
+        if sections.get("INTRODUCTION"):
             lines.append("## 📖 Introduction & Context")
             lines.append("")
-            lines.append(sections["INTRODUCTION"].strip())
+            lines.append(sections.content("INTRODUCTION").strip())
             lines.append("")
             lines.append("---")
             lines.append("")
         
         # Add Design Patterns (key section)
-        if any(keyword in synthesis_text.upper() for keyword in ["PATTERN", "ARCHITECTURE", "DESIGN"]):
+        if sections.mentions("PATTERN", "ARCHITECTURE", "DESIGN"):
             lines.append("## 🏗️ Design Patterns & Architecture")
             lines.append("")
             
             # Extract pattern-related content
-            if "TECHNICAL" in sections:
-                lines.append(sections["TECHNICAL"].strip())
-            elif "ANALYSIS" in sections or "DETAILED ANALYSIS" in sections:
-                content = sections.get("DETAILED ANALYSIS", sections.get("ANALYSIS", ""))
-                lines.append(content.strip())
+            if sections.get("TECHNICAL"):
+                lines.append(sections.content("TECHNICAL").strip())
+            elif sections.get("DETAILED ANALYSIS", "ANALYSIS"):
+                lines.append(sections.content("DETAILED ANALYSIS", "ANALYSIS").strip())
             else:
-                # Extract from synthesis
-                pattern_lines = []
-                in_pattern_section = False
-                for line in synthesis_text.split('\n'):
-                    if any(keyword in line.upper() for keyword in ["PATTERN", "ARCHITECTURE", "DESIGN", "IMPLEMENTATION"]):
-                        in_pattern_section = True
-                    if in_pattern_section:
-                        pattern_lines.append(line)
-                        if len(pattern_lines) > 50:  # Reasonable limit
-                            break
-                if pattern_lines:
+                # Extract from synthesis, from the first line about patterns on
+                start = sections.first_line("PATTERN", "ARCHITECTURE", "DESIGN", "IMPLEMENTATION")
+                if start is not None:
+                    pattern_lines = sections.lines[start:start + 51]  # Reasonable limit
                     lines.append('\n'.join(pattern_lines).strip())
             
             lines.append("")
@@ -345,64 +430,59 @@ class DebateResult:
             lines.append("")
         
         # Add Technical Specifications
-        if "TECHNICAL" in sections or "DEEP DIVE" in sections:
+        if sections.get("TECHNICAL", "DEEP DIVE"):
             lines.append("## 🔧 Technical Specifications")
             lines.append("")
-            content = sections.get("TECHNICAL", sections.get("DEEP DIVE", ""))
-            lines.append(content.strip())
+            lines.append(sections.content("TECHNICAL", "DEEP DIVE").strip())
             lines.append("")
             lines.append("---")
             lines.append("")
         
         # Add Best Practices & Recommendations
-        if "BEST PRACTICES" in sections or "RECOMMENDATIONS" in sections:
+        if sections.get("BEST PRACTICES", "RECOMMENDATIONS"):
             lines.append("## 💡 Best Practices & Recommendations")
             lines.append("")
-            content = sections.get("BEST PRACTICES", sections.get("RECOMMENDATIONS", ""))
-            lines.append(content.strip())
+            lines.append(sections.content("BEST PRACTICES", "RECOMMENDATIONS").strip())
             lines.append("")
             lines.append("---")
             lines.append("")
         
         # Add Verified Sources
-        if "SOURCE VALIDATION" in sections or "REFERENCES" in sections:
+        if sections.get("SOURCE VALIDATION", "REFERENCES"):
             lines.append("## 📚 Verified Sources & References")
             lines.append("")
-            content = sections.get("SOURCE VALIDATION", sections.get("REFERENCES", ""))
-            lines.append(content.strip())
+            lines.append(sections.content("SOURCE VALIDATION", "REFERENCES").strip())
             lines.append("")
             lines.append("---")
             lines.append("")
         
         # Add Common Misconceptions
-        if "MISCONCEPTIONS" in sections or "COMMON MISCONCEPTIONS" in sections:
+        if sections.get("COMMON MISCONCEPTIONS", "MISCONCEPTIONS"):
             lines.append("## ⚠️ Common Pitfalls & Misconceptions")
             lines.append("")
-            content = sections.get("COMMON MISCONCEPTIONS", sections.get("MISCONCEPTIONS", ""))
-            lines.append(content.strip())
+            lines.append(sections.content("COMMON MISCONCEPTIONS", "MISCONCEPTIONS").strip())
             lines.append("")
             lines.append("---")
             lines.append("")
         
         # Add Implementation Guide
-        if "IMPLEMENTATION" in sections or "PRACTICAL" in sections:
+        if sections.get("IMPLEMENTATION", "PRACTICAL"):
             lines.append("## 🚀 Implementation Guide")
             lines.append("")
-            content = sections.get("IMPLEMENTATION", sections.get("PRACTICAL", ""))
-            lines.append(content.strip())
+            lines.append(sections.content("IMPLEMENTATION", "PRACTICAL").strip())
             lines.append("")
             lines.append("---")
             lines.append("")
         
         # Add Security/Quality Considerations
-        if any(keyword in synthesis_text.upper() for keyword in ["SECURITY", "QUALITY", "PERFORMANCE"]):
+        if sections.mentions("SECURITY", "QUALITY", "PERFORMANCE"):
             lines.append("## 🔒 Security & Quality Considerations")
             lines.append("")
             # Extract security-related content
-            security_content = []
-            for section_name, content in sections.items():
-                if any(keyword in section_name.upper() for keyword in ["SECURITY", "QUALITY", "PERFORMANCE"]):
-                    security_content.append(content.strip())
+            security_content = [
+                section.content.strip()
+                for section in sections.tagged("SECURITY", "QUALITY", "PERFORMANCE", unique=True)
+            ]
             if security_content:
                 lines.append('\n\n'.join(security_content))
             lines.append("")
@@ -410,10 +490,10 @@ class DebateResult:
             lines.append("")
         
         # Add Conclusion
-        if "CONCLUSION" in sections:
+        if sections.get("CONCLUSION"):
             lines.append("## 🎓 Conclusion & Next Steps")
             lines.append("")
-            lines.append(sections["CONCLUSION"].strip())
+            lines.append(sections.content("CONCLUSION").strip())
             lines.append("")
             lines.append("---")
             lines.append("")
@@ -470,7 +550,7 @@ class DebateResult:
         lines.append(f"| **Total Perspectives** | {len(self.participating_agents)} independent AI models |")
         lines.append(f"| **Analysis Rounds** | {len(self.rounds)} rounds of refinement |")
         lines.append(f"| **Total Tokens** | {self.total_tokens:,} |")
-        lines.append(f"| **Cost** | $0.00 (FREE with open-source models) |")
+        lines.append(f"| **Cost** | {self._cost_text('FREE with open-source models')} |")
         lines.append(f"| **Generated** | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} |")
         lines.append("")
         
@@ -511,35 +591,13 @@ class DebateResult:
         lines.append("")
         lines.append("---")
         lines.append("")
-        lines.append("*Research conducted with FREE open-source AI models | Zero cost | Multi-perspective validation*")
+        if self.cost_usd:
+            lines.append(f"*Research conducted with multiple AI models | Cost: ${self.cost_usd:.4f} | Multi-perspective validation*")
+        else:
+            lines.append("*Research conducted with FREE open-source AI models | Zero cost | Multi-perspective validation*")
         
         return "\n".join(lines)
     
-    def _parse_synthesis_sections(self, text: str) -> dict:
-        """Parse synthesis text into sections based on headers."""
-        sections = {}
-        current_section = None
-        current_content = []
-        
-        for line in text.split('\n'):
-            # Detect section headers (## or **SECTION**)
-            if line.startswith('##') or (line.startswith('**') and line.endswith('**') and len(line) > 4):
-                # Save previous section
-                if current_section:
-                    sections[current_section] = '\n'.join(current_content)
-                
-                # Start new section
-                current_section = line.strip('#').strip('*').strip().upper()
-                current_content = []
-            else:
-                current_content.append(line)
-        
-        # Save last section
-        if current_section:
-            sections[current_section] = '\n'.join(current_content)
-        
-        return sections
-    
     def _get_round_title(self, round_num: int) -> str:
         """Get descriptive title for round."""
         if round_num == 1:
@@ -552,19 +610,249 @@ class DebateResult:
             return f"Continued Analysis (Round {round_num})"
 
 
+class LiveTranscript:
+    """
+    Markdown transcript that streamed responses are appended to as they arrive.
+    
+    Each response gets its own section. Writes are flushed immediately so the
+    file can be followed (e.g. ``tail -f``) while the debate is running.
+    """
+    
+    def __init__(self, topic: str, filename: Optional[str] = None, directory: str = ""):
+        if filename is None:
+            filename = os.path.join(directory, f"transcript_{artifact_stem(topic)}.md")
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._file = open(filename, 'w', encoding='utf-8')
+        self.write(f"# {topic}\n\n")
+    
+    def begin(self, title: str):
+        """Start a new response section."""
+        self.write(f"\n## {title}\n\n")
+    
+    def write(self, text: str):
+        """Append text and flush it to disk."""
+        with self._lock:
+            self._file.write(text)
+            self._file.flush()
+    
+    def add_response(self, title: str, response: AgentResponse):
+        """Append a complete (non-streamed) response as one section."""
+        self.write(f"\n## {title}\n\n{response.content}\n")
+    
+    def close(self):
+        """Close the transcript file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+@dataclass
+class DebateOptions:
+    """Per-debate execution settings threaded through rounds and synthesis."""
+    parallel: bool = False
+    max_concurrency: Optional[int] = None
+    stream: bool = False
+    retry_failed: bool = False
+    multi_turn: bool = False
+    transcript: Optional[LiveTranscript] = None
+    checkpoint: Optional[DebateCheckpoint] = None
+    log: Optional[DebateLog] = None
+    ledger: Optional[UsageLedger] = None
+    round_deadline: Optional[float] = None
+    quorum: Optional[int] = None
+    late_responses: str = "next_round"
+    deadline_at: Optional[float] = None  # time.monotonic() deadline of the current round
+    late_calls: List["LateCall"] = field(default_factory=list)
+    early_stop: bool = False
+    stop_reason: Optional[str] = None
+    round_comparisons: List[Dict] = field(default_factory=list)
+    artifact_stem: str = ""  # Shared by the names of the debate's files (see artifacts.artifact_stem)
+
+
+@dataclass
+class LateCall:
+    """A call still running after its round moved on; its answer replaces the placeholder."""
+    agent: BaseAgent
+    round_num: int
+    index: int  # Slot of the agent's placeholder in the round's responses
+    call: Any  # concurrent.futures.Future or asyncio.Task
+
+
 class LLMCouncil:
     """Orchestrates multi-agent debates between different LLMs."""
     
-    def __init__(self, agents: List[BaseAgent], verbose: bool = True):
+    def __init__(
+        self,
+        agents: List[BaseAgent],
+        verbose: bool = True,
+        parallel: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        stream: bool = False,
+        cache: Optional[ResponseCache] = None,
+        replay: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_failed: Optional[bool] = None,
+        residency: Optional[OllamaResidencyPlanner] = None,
+        multi_turn: Optional[bool] = None,
+        budget_usd: Optional[float] = None,
+        budget_policy: Optional[str] = None,
+        ledger: Optional[UsageLedger] = None,
+        round_deadline: Optional[float] = None,
+        quorum: Optional[int] = None,
+        late_responses: Optional[str] = None,
+        latency_tracker: Optional[LatencyTracker] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        early_stop: Optional[bool] = None,
+        convergence: Optional[ConvergenceDetector] = None,
+        results_format: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        background_writes: Optional[bool] = None
+    ):
         """
         Initialize the LLM Council.
         
         Args:
             agents: List of agents to participate in debates
             verbose: Whether to print progress information
+            parallel: Whether to dispatch all agents of a round concurrently
+                     (default: Config.PARALLEL_ROUNDS). In parallel mode every
+                     agent answers against the previous round's context instead
+                     of also seeing earlier answers from the same round.
+            max_concurrency: Maximum number of agents called at the same time
+                            in parallel mode (default: Config.MAX_CONCURRENCY,
+                            or one worker per agent if unset)
+            stream: Whether to stream responses token by token, rendering them
+                   live and appending them to a transcript file as they arrive
+            cache: Response cache consulted before every agent call. Identical
+                  requests (same provider, model, settings and prompts) are
+                  served from it instead of calling the provider.
+            replay: Serve the debate entirely from the cache; a request that
+                   is not cached raises CacheMissError instead of calling out
+            rate_limiter: Limiter consulted before every provider call
+                         (default: the process-wide limiter built from
+                         Config.RATE_LIMITS, shared by all councils)
+            retry_policy: Backoff policy for failed provider calls. Rate limits,
+                         server errors and timeouts are retried; auth and
+                         validation errors are not (default: Config.RETRY_*)
+            retry_failed: At the end of each round, give agents that still
+                         failed with a transient error one more attempt
+                         (default: Config.RETRY_FAILED_AGENTS)
+            residency: Planner that preloads local Ollama models before a
+                      debate and orders Ollama calls within each round to
+                      avoid model swaps (default: created when the council
+                      has Ollama agents and Config.OLLAMA_RESIDENCY is set)
+            multi_turn: Let each agent keep its own conversation across rounds
+                       and send it only the responses that are new since its
+                       last turn, instead of re-sending the whole context in a
+                       fresh prompt (default: Config.MULTI_TURN)
+            budget_usd: Spend cap per debate in USD, checked before every
+                       paid call (default: Config.BUDGET_USD, 0 = unlimited)
+            budget_policy: What to do when a call would exceed the budget:
+                          "abort" raises BudgetExceededError, "skip_rounds"
+                          stops starting rounds the budget can't cover and
+                          goes to synthesis, "shrink" lowers max_tokens to
+                          what is left (default: Config.BUDGET_POLICY).
+                          skip_rounds also shrinks calls as a last resort.
+            ledger: Ledger shared by several debates (e.g. a nightly batch);
+                   each debate's usage is recorded in it and counts
+                   against its budget as well
+            round_deadline: Wall-clock seconds a round may take; agents that
+                           haven't answered by then are cut off with a
+                           placeholder (default: Config.ROUND_DEADLINE,
+                           0 = wait for every agent). Sequential streaming
+                           rounds only check it between agents.
+            quorum: In parallel rounds, move on as soon as this many agents
+                   answered successfully (default: Config.ROUND_QUORUM, 0 = all)
+            late_responses: What to do with answers of cut-off agents:
+                           "next_round" puts them back into their round and
+                           the next round's context, "drop" discards them
+                           (default: Config.LATE_RESPONSES). Before each
+                           round and the synthesis, cut-off calls get one more
+                           round deadline to finish; an agent still answering
+                           then sits out the round (the debate stops when every
+                           agent does), and the synthesizer is only called once
+                           its own earlier call returned.
+            latency_tracker: Latency statistics that decide when a call to an
+                            agent with backups (agent.backups) is hedged to
+                            the next backend (default: the process-wide
+                            tracker, see Config.HEDGE_*). Agents whose
+                            backups are a fallback chain (agent.hedge False)
+                            only call the next backend when one fails.
+                            Streamed calls use one backend, without hedging.
+            circuit_breakers: Per-provider breakers; calls to a provider whose
+                             breaker is open fail fast and agents switch to
+                             their first backup with a closed breaker
+                             (default: the process-wide breakers persisted
+                             in Config.BREAKER_PATH)
+            early_stop: End a debate before its last round once a round has
+                       converged: agents mostly repeat their previous answer
+                       and bring no new citations (default: Config.EARLY_STOP)
+            convergence: Detector that compares successive rounds; every
+                        comparison is recorded in the DebateResult either way
+                        (default: thresholds from Config.CONVERGENCE_*)
+            results_format: How saved results are written: "json" (one
+                           document once the debate is over), "jsonl" (a
+                           log appended to as each response lands, see
+                           debate_log.load_debate) or "jsonl.zst" (the same,
+                           zstd-compressed) (default: Config.RESULTS_FORMAT)
+            output_dir: Directory results, documents and transcripts are
+                       written to, created if needed (default: the
+                       current directory)
+            background_writes: Render and write the JSON results and the
+                              Markdown document of finished debates in the
+                              process-wide artifacts.ArtifactWriter thread,
+                              so the next debate starts right away; wait for
+                              them with get_artifact_writer().wait()
+                              (default: Config.BACKGROUND_WRITES)
         """
         self.agents = agents
         self.verbose = verbose
+        self.parallel = Config.PARALLEL_ROUNDS if parallel is None else parallel
+        self.max_concurrency = max_concurrency or Config.MAX_CONCURRENCY or None
+        self.stream = stream
+        if replay and cache is None:
+            cache = ResponseCache()
+        self.cache = cache
+        self.replay = replay
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_failed = Config.RETRY_FAILED_AGENTS if retry_failed is None else retry_failed
+        if residency is None and Config.OLLAMA_RESIDENCY and any(a.provider == "ollama" for a in agents):
+            residency = OllamaResidencyPlanner()
+        self.residency = residency
+        self.multi_turn = Config.MULTI_TURN if multi_turn is None else multi_turn
+        self.budget_usd = Config.BUDGET_USD if budget_usd is None else budget_usd
+        self.budget_policy = budget_policy or Config.BUDGET_POLICY
+        if self.budget_policy not in BUDGET_POLICIES:
+            raise ValueError(
+                f"Unknown budget policy: {self.budget_policy}. "
+                f"Choose from: {', '.join(BUDGET_POLICIES)}"
+            )
+        self.ledger = ledger
+        self.round_deadline = Config.ROUND_DEADLINE if round_deadline is None else round_deadline
+        self.quorum = Config.ROUND_QUORUM if quorum is None else quorum
+        self.late_responses = late_responses or Config.LATE_RESPONSES
+        if self.late_responses not in LATE_RESPONSE_POLICIES:
+            raise ValueError(
+                f"Unknown late response policy: {self.late_responses}. "
+                f"Choose from: {', '.join(LATE_RESPONSE_POLICIES)}"
+            )
+        self.latency = latency_tracker or get_latency_tracker()
+        self.breakers = circuit_breakers or get_circuit_breakers()
+        self.early_stop = Config.EARLY_STOP if early_stop is None else early_stop
+        self.convergence = convergence or ConvergenceDetector()
+        self.results_format = results_format or Config.RESULTS_FORMAT
+        if self.results_format not in RESULTS_FORMATS:
+            raise ValueError(
+                f"Unknown results format: {self.results_format}. "
+                f"Choose from: {', '.join(RESULTS_FORMATS)}"
+            )
+        self.output_dir = output_dir or ""
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+        self.background_writes = Config.BACKGROUND_WRITES if background_writes is None else background_writes
         if verbose:
             # Use legacy_windows=False to avoid encoding issues on Windows
             self.console = Console(legacy_windows=False) if sys.platform == "win32" else Console()
@@ -577,7 +865,16 @@ class LLMCouncil:
         rounds: int = 3,
         save_results: bool = True,
         save_markdown: bool = True,
-        results_only: bool = True  # NEW: Default to results-only format
+        results_only: bool = True,  # NEW: Default to results-only format
+        parallel: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        stream: Optional[bool] = None,
+        retry_failed: Optional[bool] = None,
+        multi_turn: Optional[bool] = None,
+        round_deadline: Optional[float] = None,
+        quorum: Optional[int] = None,
+        early_stop: Optional[bool] = None,
+        resume: Optional[str] = None
     ) -> DebateResult:
         """
         Conduct a multi-round debate on a topic.
@@ -590,42 +887,456 @@ class LLMCouncil:
             results_only: If True, generate results-focused document (design patterns, 
                          recommendations, best practices) without discussions.
                          Default: True (automatic results document)
+            parallel: Override the council's parallel round mode for this debate
+            max_concurrency: Override the council's max concurrency for this debate
+            stream: Override the council's streaming mode for this debate. When
+                   streaming and save_results is set, responses are appended to
+                   a transcript_*.md file as they arrive.
+            retry_failed: Override the council's end-of-round retry of failed agents
+            multi_turn: Override the council's multi-turn conversation mode
+            round_deadline: Override the council's per-round deadline in seconds
+            quorum: Override the council's parallel round quorum
+            early_stop: Override whether the debate ends early once it converges
+            resume: Checkpoint file of an interrupted debate on the same topic.
+                   The debate runs again, but calls that succeeded before are
+                   answered from the checkpoint instead of the provider (and
+                   are not charged again). When save_results is set, every
+                   successful response is checkpointed in
+                   Config.CHECKPOINT_DIR as it lands; the checkpoint is
+                   deleted once the results are saved.
             
         Returns:
             DebateResult containing all responses and synthesis
         """
+        checkpoint = self._open_checkpoint(topic, rounds, save_results, resume)
+        options = self._resolve_options(
+            topic, parallel, max_concurrency, stream, save_results, retry_failed, multi_turn,
+            round_deadline, quorum, early_stop, checkpoint
+        )
+        self._print_debate_header(topic, rounds, options)
+        self._warm_up_local_models()
+        
+        try:
+            all_rounds = []
+            context = None
+            
+            # Conduct debate rounds
+            for round_num in range(rounds):
+                if round_num:
+                    self._wait_for_late_calls(options, options.round_deadline or 0)
+                    context = self._fold_late_responses(context, all_rounds, options)
+                    if not self._round_fits_budget(topic, context, all_rounds, round_num + 1, options):
+                        options.stop_reason = f"budget exhausted after round {round_num}"
+                        break
+                    if self._every_agent_busy(round_num, options):
+                        break
+                self._print_round_header(round_num + 1, rounds)
+                
+                round_responses = self._conduct_round(topic, context, round_num + 1, options)
+                all_rounds.append(round_responses)
+                context = round_responses
+                self._complete_round(round_num + 1, round_responses, options)
+                if self._debate_converged(all_rounds, rounds, options):
+                    break
+            
+            # Generate synthesis
+            self._wait_for_late_calls(options, options.round_deadline or 0)
+            self._fold_late_responses(context, all_rounds, options)
+            if self.verbose:
+                self.console.print("\n[bold magenta]=== Generating Synthesis ===[/bold magenta]\n")
+            
+            synthesis = self._generate_synthesis(topic, all_rounds, options)
+        except BaseException:
+            self._save_interrupted(options)
+            raise
+        finally:
+            self._abandon_late_calls(options)
+            self._close_transcript(options)
+        
+        return self._finalize_debate(
+            topic, all_rounds, synthesis, options,
+            save_results=save_results,
+            save_markdown=save_markdown,
+            results_only=results_only
+        )
+    
+    async def adebate(
+        self,
+        topic: str,
+        rounds: int = 3,
+        save_results: bool = True,
+        save_markdown: bool = True,
+        results_only: bool = True,
+        parallel: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        stream: Optional[bool] = None,
+        retry_failed: Optional[bool] = None,
+        multi_turn: Optional[bool] = None,
+        round_deadline: Optional[float] = None,
+        quorum: Optional[int] = None,
+        early_stop: Optional[bool] = None,
+        resume: Optional[str] = None
+    ) -> DebateResult:
+        """
+        Async counterpart of debate().
+        
+        Agents are awaited through agenerate_response, so a single event loop
+        can drive many debates and agent calls without a thread per call.
+        Takes the same arguments and returns the same DebateResult as debate().
+        """
+        checkpoint = self._open_checkpoint(topic, rounds, save_results, resume)
+        options = self._resolve_options(
+            topic, parallel, max_concurrency, stream, save_results, retry_failed, multi_turn,
+            round_deadline, quorum, early_stop, checkpoint
+        )
+        self._print_debate_header(topic, rounds, options)
+        await asyncio.to_thread(self._warm_up_local_models)
+        
+        try:
+            all_rounds = []
+            context = None
+            
+            for round_num in range(rounds):
+                if round_num:
+                    await self._await_late_calls(options, options.round_deadline or 0)
+                    context = self._fold_late_responses(context, all_rounds, options)
+                    if not self._round_fits_budget(topic, context, all_rounds, round_num + 1, options):
+                        options.stop_reason = f"budget exhausted after round {round_num}"
+                        break
+                    if self._every_agent_busy(round_num, options):
+                        break
+                self._print_round_header(round_num + 1, rounds)
+                
+                round_responses = await self._aconduct_round(topic, context, round_num + 1, options)
+                all_rounds.append(round_responses)
+                context = round_responses
+                self._complete_round(round_num + 1, round_responses, options)
+                if self._debate_converged(all_rounds, rounds, options):
+                    break
+            
+            await self._await_late_calls(options, options.round_deadline or 0)
+            self._fold_late_responses(context, all_rounds, options)
+            if self.verbose:
+                self.console.print("\n[bold magenta]=== Generating Synthesis ===[/bold magenta]\n")
+            
+            synthesis = await self._agenerate_synthesis(topic, all_rounds, options)
+        except BaseException:
+            self._save_interrupted(options)
+            raise
+        finally:
+            self._abandon_late_calls(options)
+            self._close_transcript(options)
+        
+        return self._finalize_debate(
+            topic, all_rounds, synthesis, options,
+            save_results=save_results,
+            save_markdown=save_markdown,
+            results_only=results_only
+        )
+    
+    def resynthesize(
+        self,
+        previous: DebateResult,
+        save_results: bool = True,
+        save_markdown: bool = True,
+        results_only: bool = True
+    ) -> DebateResult:
+        """
+        Write a new synthesis of a saved debate without debating again.
+        
+        The previous debate's rounds are given to this council's synthesizer
+        as they are, so only the synthesis call is made and charged.
+        
+        Args:
+            previous: The debate to synthesize again (see DebateResult.load)
+            save_results: Whether to save the new result (rounds included)
+            save_markdown: Whether to save the new article as Markdown
+            results_only: Results-focused document instead of the full article
+            
+        Returns:
+            DebateResult with the previous rounds and the new synthesis
+        """
+        topic = previous.topic
+        all_rounds = previous.rounds
+        options = self._resolve_options(topic, save_results=save_results)
+        options.stop_reason = previous.stop_reason
+        options.round_comparisons = list(previous.convergence or [])
+        if options.log is not None:
+            for round_num, responses in enumerate(all_rounds, 1):
+                agent_names = [response.agent_name for response in responses]
+                for agent_name, response in zip(agent_names, responses):
+                    options.log.add_response(round_num, agent_name, response)
+                options.log.end_round(round_num, agent_names, responses)
         if self.verbose:
             self.console.print(Panel.fit(
-                f"[bold cyan]LLM Council Debate[/bold cyan]\n\n"
+                f"[bold cyan]LLM Council Synthesis[/bold cyan]\n\n"
                 f"[yellow]Topic:[/yellow] {topic}\n"
-                f"[yellow]Rounds:[/yellow] {rounds}\n"
-                f"[yellow]Participants:[/yellow] {', '.join([a.name for a in self.agents])}",
+                f"[yellow]Rounds:[/yellow] {len(all_rounds)} saved ({previous.timestamp or 'earlier debate'})\n"
+                f"[yellow]Synthesizer:[/yellow] {self.agents[0].name}",
                 border_style="cyan"
             ))
+            self.console.print("\n[bold magenta]=== Generating Synthesis ===[/bold magenta]\n")
         
-        all_rounds = []
-        context = None
-        total_tokens = 0
-        
-        # Conduct debate rounds
-        for round_num in range(rounds):
+        try:
+            synthesis = self._generate_synthesis(topic, all_rounds, options)
+        except BaseException:
+            self._save_interrupted(options)
+            raise
+        finally:
+            self._close_transcript(options)
+        
+        return self._finalize_debate(
+            topic, all_rounds, synthesis, options,
+            save_results=save_results,
+            save_markdown=save_markdown,
+            results_only=results_only
+        )
+    
+    def _resolve_options(
+        self,
+        topic: str,
+        parallel: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        stream: Optional[bool] = None,
+        save_results: bool = False,
+        retry_failed: Optional[bool] = None,
+        multi_turn: Optional[bool] = None,
+        round_deadline: Optional[float] = None,
+        quorum: Optional[int] = None,
+        early_stop: Optional[bool] = None,
+        checkpoint: Optional[DebateCheckpoint] = None
+    ) -> DebateOptions:
+        """Merge per-debate overrides with the council defaults and start fresh conversations."""
+        options = DebateOptions(
+            parallel=self.parallel if parallel is None else parallel,
+            max_concurrency=self.max_concurrency if max_concurrency is None else max_concurrency,
+            stream=self.stream if stream is None else stream,
+            retry_failed=self.retry_failed if retry_failed is None else retry_failed,
+            multi_turn=self.multi_turn if multi_turn is None else multi_turn,
+            ledger=UsageLedger(self.budget_usd, parent=self.ledger),
+            round_deadline=(self.round_deadline if round_deadline is None else round_deadline) or None,
+            quorum=(self.quorum if quorum is None else quorum) or None,
+            late_responses=self.late_responses,
+            early_stop=self.early_stop if early_stop is None else early_stop,
+            checkpoint=checkpoint,
+            artifact_stem=artifact_stem(topic)
+        )
+        if options.stream and save_results:
+            options.transcript = LiveTranscript(topic, self._artifact_path(options, "transcript", "md"))
+        if save_results and self.results_format != "json":
+            options.log = DebateLog(
+                self._artifact_path(options, "debate", self.results_format),
+                topic,
+                [agent.name for agent in self.agents]
+            )
+        for agent in self.agents:
+            for backend in [agent] + agent.backups:
+                backend.multi_turn = options.multi_turn
+                backend.clear_history()
+        return options
+    
+    def _artifact_path(self, options: DebateOptions, prefix: str, extension: str) -> str:
+        """Path of one of a debate's files: <output_dir>/<prefix>_<stem>.<extension>."""
+        return os.path.join(self.output_dir, f"{prefix}_{options.artifact_stem}.{extension}")
+    
+    def _open_checkpoint(
+        self,
+        topic: str,
+        rounds: int,
+        save_results: bool,
+        resume: Optional[str]
+    ) -> Optional[DebateCheckpoint]:
+        """The checkpoint being resumed, or a new one when results are saved (and Config.CHECKPOINT_DIR is set)."""
+        if resume:
+            checkpoint = DebateCheckpoint.load(resume)
+            if checkpoint.topic != topic:
+                raise ValueError(f"Checkpoint {resume} is for another topic: {checkpoint.topic}")
+            return checkpoint
+        if save_results and Config.CHECKPOINT_DIR:
+            return DebateCheckpoint.create(topic, rounds, [agent.name for agent in self.agents])
+        return None
+    
+    def _save_interrupted(self, options: DebateOptions):
+        """Close the log of an interrupted debate and tell where its progress was saved."""
+        if options.log is not None:
+            options.log.close()
             if self.verbose:
-                self.console.print(f"\n[bold green]=== Round {round_num + 1}/{rounds} ===[/bold green]\n")
-            
-            round_responses = self._conduct_round(topic, context, round_num + 1)
-            all_rounds.append(round_responses)
-            context = round_responses
-            
-            # Calculate tokens
-            for response in round_responses:
-                if response.tokens_used:
-                    total_tokens += response.tokens_used
+                self.console.print(f"\n[dim]Partial results saved to: {options.log.path}[/dim]")
+        if self.verbose and options.checkpoint is not None and len(options.checkpoint):
+            self.console.print(
+                f"\n[yellow]Debate interrupted; {len(options.checkpoint)} responses saved to "
+                f"{options.checkpoint.path} (continue with --resume {options.checkpoint.path})[/yellow]"
+            )
+    
+    def _close_transcript(self, options: DebateOptions):
+        """Close the live transcript, if any, and report where it was written."""
+        if options.transcript is None:
+            return
+        options.transcript.close()
+        if self.verbose:
+            self.console.print(f"\n[dim]Live transcript saved to: {options.transcript.filename}[/dim]")
+    
+    def _print_debate_header(self, topic: str, rounds: int, options: DebateOptions):
+        """Print the debate banner."""
+        if not self.verbose:
+            return
+        
+        modes = [
+            name for name, enabled in (
+                ("parallel", options.parallel),
+                ("streaming", options.stream),
+                ("multi-turn", options.multi_turn),
+                ("early stop", options.early_stop),
+                (f"{options.round_deadline or 0:g}s deadline", options.round_deadline),
+                (f"quorum {options.quorum}", options.quorum and options.parallel)
+            ) if enabled
+        ]
+        self.console.print(Panel.fit(
+            f"[bold cyan]LLM Council Debate[/bold cyan]\n\n"
+            f"[yellow]Topic:[/yellow] {topic}\n"
+            f"[yellow]Rounds:[/yellow] {rounds}"
+            f"{' (' + ', '.join(modes) + ')' if modes else ''}\n"
+            f"[yellow]Participants:[/yellow] {', '.join([a.name for a in self.agents])}",
+            border_style="cyan"
+        ))
         
-        # Generate synthesis
+        checkpoint = options.checkpoint
+        if checkpoint is not None and len(checkpoint):
+            self.console.print(
+                f"[dim]Resuming {checkpoint.path}: {len(checkpoint)} saved responses, "
+                f"{checkpoint.completed_rounds} of {checkpoint.rounds} rounds completed[/dim]"
+            )
+            missing = [name for name in checkpoint.agents if name not in {a.name for a in self.agents}]
+            if missing:
+                self.console.print(
+                    f"[yellow]Not in this council, saved responses ignored: {', '.join(missing)}[/yellow]"
+                )
+    
+    def _warm_up_local_models(self):
+        """Preload the council's Ollama models so the first round doesn't pay for loading them."""
+        if self.residency is None or self.replay:
+            return
+        groups = self.residency.residency_sets(self.residency.models(self.agents))
+        if self.verbose and len(groups) > 1:
+            self.console.print(
+                "[dim]Ollama models don't fit in memory together; grouping calls as "
+                f"{' | '.join(', '.join(group) for group in groups)}[/dim]"
+            )
+        loaded = self.residency.warm_up(self.agents)
+        if self.verbose and loaded:
+            self.console.print(
+                f"[dim]Preloaded Ollama models: {', '.join(loaded)} "
+                f"(keep_alive {self.residency.keep_alive})[/dim]"
+            )
+    
+    def _round_agents(self, round_num: int) -> List[BaseAgent]:
+        """Agents of a round in call order (Ollama agents grouped to avoid model swaps)."""
+        if self.residency is None:
+            return self.agents
+        return self.residency.order(self.agents, round_num)
+    
+    def _debate_converged(
+        self,
+        all_rounds: List[List[AgentResponse]],
+        rounds: int,
+        options: DebateOptions
+    ) -> bool:
+        """Record how the latest round compares with the previous one; True to stop the debate early."""
+        comparison = self.convergence.compare(all_rounds)
+        if comparison is None:
+            return False
+        options.round_comparisons.append(comparison.to_dict())
+        if not (options.early_stop and comparison.converged and len(all_rounds) < rounds):
+            return False
+        
+        options.stop_reason = f"converged after round {comparison.round_num} ({comparison.describe()})"
         if self.verbose:
-            self.console.print("\n[bold magenta]=== Generating Synthesis ===[/bold magenta]\n")
+            self.console.print(
+                f"\n[yellow]Debate converged after round {comparison.round_num} ({comparison.describe()}); "
+                f"skipping the remaining {rounds - len(all_rounds)} round(s)[/yellow]"
+            )
+        return True
+    
+    def _complete_round(self, round_num: int, responses: List[AgentResponse], options: DebateOptions):
+        """Record a finished round in the debate's checkpoint and log."""
+        if options.checkpoint is not None:
+            options.checkpoint.complete_round(round_num)
+        if options.log is not None:
+            options.log.end_round(round_num, [agent.name for agent in self._round_agents(round_num)], responses)
+    
+    def _print_round_header(self, round_num: int, rounds: int):
+        """Print the header of a debate round."""
+        if self.verbose:
+            self.console.print(f"\n[bold green]=== Round {round_num}/{rounds} ===[/bold green]\n")
+    
+    def _save_artifacts(
+        self,
+        result: DebateResult,
+        options: DebateOptions,
+        save_results: bool,
+        save_markdown: bool,
+        results_only: bool
+    ):
+        """
+        Save the requested files of a finished debate and delete its checkpoint.
         
-        synthesis = self._generate_synthesis(topic, all_rounds)
+        Their paths are recorded in result.artifacts right away; with
+        background writes, the JSON results and the Markdown document are
+        rendered and written in the artifact writer thread, and the
+        checkpoint is only deleted once they are on disk.
+        """
+        writes = []
+        if save_results:
+            if options.log is not None:
+                result.artifacts["results"] = options.log.finish(result)
+            else:
+                result.artifacts["results"] = self._artifact_path(options, "debate", "json")
+                writes.append(partial(result.save_to_file, result.artifacts["results"]))
+            if self.verbose:
+                self.console.print(f"\n[dim]JSON results saved to: {result.artifacts['results']}[/dim]")
+        
+        if save_markdown:
+            prefix = "results" if results_only else "article"
+            result.artifacts["markdown"] = self._artifact_path(options, prefix, "md")
+            writes.append(partial(result.save_to_markdown, result.artifacts["markdown"], results_only))
+            if self.verbose:
+                doc_type = "Results document" if results_only else "Markdown article"
+                self.console.print(f"[dim]{doc_type} saved to: {result.artifacts['markdown']}[/dim]")
+        
+        def write_all():
+            for write in writes:
+                write()
+            if options.checkpoint is not None:
+                options.checkpoint.remove()
+        
+        if self.background_writes and writes:
+            get_artifact_writer().submit(write_all)
+        else:
+            write_all()
+    
+    def _finalize_debate(
+        self,
+        topic: str,
+        all_rounds: List[List[AgentResponse]],
+        synthesis: str,
+        options: DebateOptions,
+        save_results: bool,
+        save_markdown: bool,
+        results_only: bool
+    ) -> DebateResult:
+        """Build the DebateResult, save requested artifacts and display the synthesis."""
+        total_tokens = sum(
+            response.tokens_used or 0
+            for round_responses in all_rounds
+            for response in round_responses
+        )
+        # Responses served from the response cache or a checkpoint made no provider call
+        cached_tokens = sum(
+            (response.metadata or {}).get("cached_tokens") or 0
+            for round_responses in all_rounds
+            for response in round_responses
+            if not (response.metadata or {}).get("cached") and not (response.metadata or {}).get("resumed")
+        )
         
         # Create result
         result = DebateResult(
@@ -634,20 +1345,38 @@ class LLMCouncil:
             synthesis=synthesis,
             timestamp=datetime.now().isoformat(),
             total_tokens=total_tokens,
-            participating_agents=[agent.name for agent in self.agents]
+            participating_agents=[agent.name for agent in self.agents],
+            cached_tokens=cached_tokens,
+            cost_usd=round(options.ledger.spent, 6) if options.ledger else 0.0,
+            usage=options.ledger.summary() if options.ledger else None,
+            stop_reason=options.stop_reason,
+            convergence=options.round_comparisons or None
         )
         
         # Save if requested
-        if save_results:
-            json_filename = result.save_to_file()
-            if self.verbose:
-                self.console.print(f"\n[dim]JSON results saved to: {json_filename}[/dim]")
+        if options.transcript is not None:
+            result.artifacts["transcript"] = options.transcript.filename
+        self._save_artifacts(result, options, save_results, save_markdown, results_only)
+        
+        if self.verbose and result.usage and result.usage["calls"]:
+            budget = f" of ${self.budget_usd:.2f} budget" if self.budget_usd else ""
+            self.console.print(
+                f"[dim]Cost: ${result.cost_usd:.4f}{budget} "
+                f"({result.usage['input_tokens']:,} input, {result.usage['output_tokens']:,} output tokens)[/dim]"
+            )
         
-        if save_markdown:
-            md_filename = result.save_to_markdown(results_only=results_only)
-            if self.verbose:
-                doc_type = "Results document" if results_only else "Markdown article"
-                self.console.print(f"[dim]{doc_type} saved to: {md_filename}[/dim]")
+        if self.verbose and cached_tokens:
+            self.console.print(
+                f"[dim]Provider prompt caches served {cached_tokens:,} of "
+                f"{total_tokens:,} tokens[/dim]"
+            )
+        
+        if self.verbose and self.cache is not None:
+            stats = self.cache.stats()
+            self.console.print(
+                f"[dim]Response cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['entries']} entries[/dim]"
+            )
         
         if self.verbose:
             self.console.print("\n[bold green]Debate Complete![/bold green]")
@@ -659,14 +1388,1232 @@ class LLMCouncil:
         self, 
         topic: str, 
         context: Optional[List[AgentResponse]], 
-        round_num: int
+        round_num: int,
+        options: Optional[DebateOptions] = None
     ) -> List[AgentResponse]:
         """Conduct a single debate round with all agents."""
+        options = options or DebateOptions()
+        prompt = self._build_round_prompt(topic, round_num)
+        self._start_round_clock(options)
+        
+        if options.parallel and len(self.agents) > 1:
+            responses = self._conduct_round_parallel(prompt, context, round_num, options)
+            return self._retry_failed_agents(prompt, context, responses, round_num, options)
+        
+        round_context = context
         responses = []
+        for index, agent in enumerate(self._round_agents(round_num)):
+            skipped = self._skip_reason(agent, options)
+            if skipped:
+                response = self._cut_off_response(agent, skipped)
+                self._display_response(response)
+            elif options.stream:
+                response = self._stream_agent(agent, prompt, context, round_num, options)
+            else:
+                if self.verbose:
+                    self.console.print(f"[cyan]{agent.name} thinking...[/cyan]")
+                response = self._call_agent_by_deadline(agent, prompt, context, round_num, index, options)
+                self._display_response(response)
+            
+            response.round_num = round_num
+            responses.append(response)
+            
+            # Update context for next agent in this round
+            if context is None:
+                context = [response]
+            else:
+                context = context + [response]
+        
+        return self._retry_failed_agents(prompt, round_context, responses, round_num, options)
+    
+    def _conduct_round_parallel(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: DebateOptions
+    ) -> List[AgentResponse]:
+        """
+        Dispatch every agent of a round concurrently.
+        
+        All agents answer against the same (previous round) context, so the
+        round takes as long as its slowest agent, or until the round deadline
+        passes or the quorum answered. Responses are returned in agent order
+        regardless of completion order.
+        """
+        agents = self._round_agents(round_num)
+        workers = min(options.max_concurrency or len(agents), len(agents))
+        
+        if self.verbose:
+            self.console.print(
+                f"[cyan]{', '.join(a.name for a in agents)} thinking "
+                f"(parallel, {workers} at a time)...[/cyan]"
+            )
+        
+        # Not a with-block: leaving it would wait for stragglers
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="council-agent")
+        skipped = [self._skip_reason(agent, options) for agent in agents]
+        futures = [
+            None if reason else executor.submit(self._call_agent, agent, prompt, context, round_num, options)
+            for agent, reason in zip(agents, skipped)
+        ]
+        executor.shutdown(wait=False)
+        
+        pending = {future for future in futures if future is not None}
+        quorum = self._quorum_size(len(pending), options)
+        answered = 0
+        while pending and answered < quorum:
+            done, pending = wait(pending, timeout=self._time_left(options), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            answered += sum(not future.result().error for future in done)
+        
+        responses = self._collect_round_calls(agents, futures, skipped, round_num, options)
+        self._record_parallel_responses(responses, round_num, options)
+        return responses
+    
+    async def _aconduct_round(
+        self,
+        topic: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions] = None
+    ) -> List[AgentResponse]:
+        """Async counterpart of _conduct_round."""
+        options = options or DebateOptions()
+        prompt = self._build_round_prompt(topic, round_num)
+        self._start_round_clock(options)
+        
+        if options.parallel and len(self.agents) > 1:
+            semaphore = asyncio.Semaphore(options.max_concurrency or len(self.agents))
+            
+            async def call(agent: BaseAgent) -> AgentResponse:
+                async with semaphore:
+                    return await self._acall_agent(agent, prompt, context, round_num, options)
+            
+            agents = self._round_agents(round_num)
+            if self.verbose:
+                self.console.print(
+                    f"[cyan]{', '.join(a.name for a in agents)} thinking (parallel)...[/cyan]"
+                )
+            skipped = [self._skip_reason(agent, options) for agent in agents]
+            tasks = [
+                None if reason else asyncio.ensure_future(call(agent))
+                for agent, reason in zip(agents, skipped)
+            ]
+            pending = {task for task in tasks if task is not None}
+            quorum = self._quorum_size(len(pending), options)
+            answered = 0
+            while pending and answered < quorum:
+                done, pending = await asyncio.wait(
+                    pending, timeout=self._time_left(options), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                answered += sum(not task.result().error for task in done)
+            
+            responses = self._collect_round_calls(agents, tasks, skipped, round_num, options)
+            self._record_parallel_responses(responses, round_num, options)
+            return await self._aretry_failed_agents(prompt, context, responses, round_num, options)
+        
+        round_context = context
+        responses = []
+        for index, agent in enumerate(self._round_agents(round_num)):
+            skipped = self._skip_reason(agent, options)
+            if skipped:
+                response = self._cut_off_response(agent, skipped)
+                self._display_response(response)
+            elif options.stream:
+                response = await self._astream_agent(agent, prompt, context, round_num, options)
+            else:
+                if self.verbose:
+                    self.console.print(f"[cyan]{agent.name} thinking...[/cyan]")
+                response = await self._acall_agent_by_deadline(agent, prompt, context, round_num, index, options)
+                self._display_response(response)
+            response.round_num = round_num
+            responses.append(response)
+            context = [response] if context is None else context + [response]
+        
+        return await self._aretry_failed_agents(prompt, round_context, responses, round_num, options)
+    
+    def _retry_context(
+        self,
+        context: Optional[List[AgentResponse]],
+        responses: List[AgentResponse],
+        options: DebateOptions
+    ) -> Optional[List[AgentResponse]]:
+        """Context for an end-of-round retry, matching what the round's mode shows agents."""
+        if options.parallel:
+            return context
+        return (context or []) + [response for response in responses if not response.error]
+    
+    def _failed_agents(self, responses: List[AgentResponse]) -> List[int]:
+        """Indexes of agents whose response failed with a retryable error."""
+        return [
+            index for index, response in enumerate(responses)
+            if response.error and (response.metadata or {}).get("retryable")
+        ]
+    
+    def _retry_failed_agents(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        responses: List[AgentResponse],
+        round_num: int,
+        options: DebateOptions
+    ) -> List[AgentResponse]:
+        """Give agents that failed with a transient error one more attempt at the end of the round."""
+        if not options.retry_failed or self._time_left(options) == 0:
+            return responses
         
-        # Build the prompt based on round number
+        responses = list(responses)
+        for index in self._failed_agents(responses):
+            agent = self._round_agents(round_num)[index]
+            if self.verbose:
+                self.console.print(f"[yellow]Retrying {agent.name} (failed earlier this round)...[/yellow]")
+            retry_context = self._retry_context(context, responses, options)
+            if options.stream:
+                response = self._stream_agent(agent, prompt, retry_context, round_num, options)
+            else:
+                response = self._call_agent_by_deadline(agent, prompt, retry_context, round_num, index, options)
+                self._display_response(response)
+            response.round_num = round_num
+            responses[index] = response
+        return responses
+    
+    async def _aretry_failed_agents(
+        self,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        responses: List[AgentResponse],
+        round_num: int,
+        options: DebateOptions
+    ) -> List[AgentResponse]:
+        """Async counterpart of _retry_failed_agents."""
+        if not options.retry_failed or self._time_left(options) == 0:
+            return responses
+        
+        responses = list(responses)
+        for index in self._failed_agents(responses):
+            agent = self._round_agents(round_num)[index]
+            if self.verbose:
+                self.console.print(f"[yellow]Retrying {agent.name} (failed earlier this round)...[/yellow]")
+            retry_context = self._retry_context(context, responses, options)
+            if options.stream:
+                response = await self._astream_agent(agent, prompt, retry_context, round_num, options)
+            else:
+                response = await self._acall_agent_by_deadline(
+                    agent, prompt, retry_context, round_num, index, options
+                )
+                self._display_response(response)
+            response.round_num = round_num
+            responses[index] = response
+        return responses
+    
+    def _start_round_clock(self, options: DebateOptions):
+        """Set the wall-clock deadline of the round that is starting."""
+        options.deadline_at = time.monotonic() + options.round_deadline if options.round_deadline else None
+    
+    def _time_left(self, options: DebateOptions) -> Optional[float]:
+        """Seconds until the round deadline (None without a deadline)."""
+        if options.deadline_at is None:
+            return None
+        return max(0.0, options.deadline_at - time.monotonic())
+    
+    def _quorum_size(self, calls: int, options: DebateOptions) -> int:
+        """Successful answers a parallel round waits for."""
+        return min(options.quorum or calls, calls)
+    
+    def _still_answering(self, agent: BaseAgent, options: DebateOptions) -> Optional[str]:
+        """Why an agent is busy with a call cut off in an earlier round, if it is."""
+        for late in options.late_calls:
+            if late.agent is agent and not late.call.done():
+                return f"still answering round {late.round_num}"
+        return None
+    
+    def _skip_reason(self, agent: BaseAgent, options: DebateOptions) -> Optional[str]:
+        """Why an agent can't be called this round, if it can't."""
+        reason = self._still_answering(agent, options)
+        if reason is None and self._time_left(options) == 0:
+            return "round deadline passed before its turn"
+        return reason
+    
+    def _every_agent_busy(self, round_num: int, options: DebateOptions) -> bool:
+        """True (and the debate's stop reason set) when no agent could answer the next round."""
+        if not all(self._still_answering(agent, options) for agent in self.agents):
+            return False
+        options.stop_reason = f"every agent still answering after round {round_num}"
+        if self.verbose:
+            self.console.print(
+                f"\n[yellow]Every agent is still answering an earlier round; "
+                f"stopping after round {round_num}[/yellow]"
+            )
+        return True
+    
+    def _cut_off_response(self, agent: BaseAgent, reason: str) -> AgentResponse:
+        """Placeholder for an agent that did not answer in time; never retried."""
+        response = agent._error_response(RoundDeadlineExceeded(reason), retryable=False, cut_off=True)
+        response.content = f"No response: {reason}"
+        return response
+    
+    def _cut_off(self, agent: BaseAgent, call, round_num: int, index: int, options: DebateOptions) -> AgentResponse:
+        """Leave a call running past its round and return its placeholder."""
+        reason = "no answer within the round deadline" if self._time_left(options) == 0 else "quorum reached first"
+        if options.late_responses == "drop" and isinstance(call, asyncio.Future):
+            call.cancel()
+        options.late_calls.append(LateCall(agent, round_num, index, call))
+        return self._cut_off_response(agent, reason)
+    
+    def _collect_round_calls(
+        self,
+        agents: List[BaseAgent],
+        calls: List[Any],
+        skipped: List[Optional[str]],
+        round_num: int,
+        options: DebateOptions
+    ) -> List[AgentResponse]:
+        """Responses of a parallel round in agent order, with placeholders for agents cut off."""
+        responses = []
+        for index, (agent, call) in enumerate(zip(agents, calls)):
+            if call is None:
+                responses.append(self._cut_off_response(agent, skipped[index]))
+            elif call.done():
+                responses.append(call.result())
+            else:
+                responses.append(self._cut_off(agent, call, round_num, index, options))
+        return responses
+    
+    def _call_agent_by_deadline(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        index: int,
+        options: DebateOptions
+    ) -> AgentResponse:
+        """Call an agent, giving up on it (but not cancelling it) when the round deadline passes."""
+        if options.deadline_at is None:
+            return self._call_agent(agent, prompt, context, round_num, options)
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="council-agent")
+        future = executor.submit(self._call_agent, agent, prompt, context, round_num, options)
+        executor.shutdown(wait=False)
+        done, _ = wait([future], timeout=self._time_left(options))
+        if done:
+            return future.result()
+        return self._cut_off(agent, future, round_num, index, options)
+    
+    async def _acall_agent_by_deadline(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        index: int,
+        options: DebateOptions
+    ) -> AgentResponse:
+        """Async counterpart of _call_agent_by_deadline."""
+        if options.deadline_at is None:
+            return await self._acall_agent(agent, prompt, context, round_num, options)
+        
+        task = asyncio.ensure_future(self._acall_agent(agent, prompt, context, round_num, options))
+        done, _ = await asyncio.wait({task}, timeout=self._time_left(options))
+        if done:
+            return task.result()
+        return self._cut_off(agent, task, round_num, index, options)
+    
+    def _late_calls_running(self, options: DebateOptions, agent: Optional[BaseAgent] = None) -> List[Any]:
+        """Calls cut off in earlier rounds that are still running (only the agent's when given)."""
+        return [
+            late.call for late in options.late_calls
+            if not late.call.done() and (agent is None or late.agent is agent)
+        ]
+    
+    def _wait_for_late_calls(
+        self,
+        options: DebateOptions,
+        timeout: Optional[float],
+        agent: Optional[BaseAgent] = None
+    ):
+        """
+        Give calls cut off in earlier rounds up to timeout seconds to finish.
+        
+        Called before a round (with the round deadline), so agents that were
+        cut off answer late instead of sitting out every later round, and
+        before the synthesis. A timeout of None waits until they finish.
+        """
+        running = self._late_calls_running(options, agent)
+        if running and timeout != 0:
+            wait(running, timeout=timeout)
+    
+    async def _await_late_calls(
+        self,
+        options: DebateOptions,
+        timeout: Optional[float],
+        agent: Optional[BaseAgent] = None
+    ):
+        """Async counterpart of _wait_for_late_calls."""
+        running = self._late_calls_running(options, agent)
+        if running and timeout != 0:
+            await asyncio.wait(running, timeout=timeout)
+    
+    def _fold_late_responses(
+        self,
+        context: Optional[List[AgentResponse]],
+        all_rounds: List[List[AgentResponse]],
+        options: DebateOptions
+    ) -> Optional[List[AgentResponse]]:
+        """
+        Put answers that arrived after their round's cut-off back into the debate.
+        
+        Under the "next_round" policy each finished late answer replaces its
+        placeholder in its round and is appended to the context of the next
+        round, unless its agent already answered since; under "drop" it is
+        discarded. Calls still running stay pending.
+        
+        Returns:
+            The context for the next round
+        """
+        pending = []
+        late = []
+        for late_call in options.late_calls:
+            if not late_call.call.done():
+                pending.append(late_call)
+                continue
+            if late_call.call.cancelled() or options.late_responses == "drop":
+                continue
+            response = late_call.call.result()
+            if response.error:
+                continue
+            response.round_num = late_call.round_num
+            response.metadata = {**(response.metadata or {}), "late": True}
+            # A new list, so contexts holding the round's placeholder are unchanged
+            round_responses = list(all_rounds[late_call.round_num - 1])
+            round_responses[late_call.index] = response
+            all_rounds[late_call.round_num - 1] = round_responses
+            late.append(response)
+            if options.log is not None:
+                options.log.add_response(late_call.round_num, late_call.agent.name, response, late=True)
+            
+            if self.verbose:
+                self.console.print(f"[dim]{response.agent_name} answered round {late_call.round_num} late[/dim]")
+            self._display_response(response)
+            if options.transcript is not None:
+                options.transcript.add_response(
+                    f"{self._transcript_title(response.agent_name, late_call.round_num)} (late)", response
+                )
+        options.late_calls = pending
+        
+        # An agent that has since answered a newer round is represented by that answer
+        answered = {response.agent_name for response in context or [] if not response.error}
+        late = [response for response in late if response.agent_name not in answered]
+        if not late:
+            return context
+        return (context or []) + late
+    
+    def _abandon_late_calls(self, options: DebateOptions):
+        """Stop waiting for calls still running when the debate ends."""
+        for late_call in options.late_calls:
+            # Cancels pending async calls; running threads finish within HTTP_TIMEOUT
+            late_call.call.cancel()
+        options.late_calls = []
+    
+    def _call_agent(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions] = None
+    ) -> AgentResponse:
+        """Call an agent, hedging to its backups when it has any."""
+        response = self._resumed_response(agent, prompt, context, round_num, options)
+        if response is None and agent.backups:
+            response = self._call_hedged(agent, prompt, context, round_num, options)
+        elif response is None:
+            response = self._call_backend(agent, prompt, context, round_num, options)
+        self._record_response(agent, round_num, response, options)
+        return response
+    
+    def _resumed_response(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions]
+    ) -> Optional[AgentResponse]:
+        """The agent's answer saved in the debate's checkpoint, entered into its conversation, if any."""
+        if options is None or options.checkpoint is None:
+            return None
+        response = options.checkpoint.get(round_num, agent.name)
+        if response is not None:
+            for backend in [agent] + agent.backups:
+                backend.record_turn(prompt, context, round_num, response)
+        return response
+    
+    def _record_response(
+        self,
+        agent: BaseAgent,
+        round_num: int,
+        response: AgentResponse,
+        options: Optional[DebateOptions]
+    ):
+        """Append a finished call's answer to the debate's log and save it to its checkpoint."""
+        if options is None:
+            return
+        if options.log is not None:
+            options.log.add_response(round_num, agent.name, response)
+        if options.checkpoint is not None and not (response.metadata or {}).get("resumed"):
+            options.checkpoint.record(round_num, agent.name, response)
+    
+    def _call_hedged(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions] = None
+    ) -> AgentResponse:
+        """
+        Send a request to an agent's backends in turn and take the first success.
+        
+        Backends whose circuit breaker is open are skipped. The next backend
+        is called as soon as a call fails or, when hedging, when the latest
+        one has not answered within its hedge delay (a high percentile of its
+        past latencies). The losing calls' answers are discarded.
+        """
+        backends = [agent] + agent.backups
+        response = self._cached_hedge_response(backends, prompt, context, round_num)
+        if response is not None:
+            return response
+        
+        queue = self._usable_backends(agent)
+        executor = ThreadPoolExecutor(max_workers=len(queue), thread_name_prefix="council-hedge")
+        backend_of = {}
+        pending = set()
+        winner = None
+        try:
+            while winner is None:
+                timeout = None
+                if len(backend_of) < len(queue):
+                    backend = queue[len(backend_of)]
+                    future = executor.submit(
+                        self._call_backend, backend, prompt, context, round_num, options, hedged=True
+                    )
+                    backend_of[future] = backend
+                    pending.add(future)
+                    if agent.hedge and len(backend_of) < len(queue):
+                        timeout = self._hedge_delay(backend)
+                if not pending:
+                    break
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    response = future.result()
+                    if not response.error and winner is None:
+                        winner = backend_of[future]
+                        winner_response = response
+        finally:
+            # Running threads can't be stopped; their late answers are ignored
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        if winner is not None:
+            # Another backend finishing in the same wait may have failed after it
+            response = winner_response
+        return self._finish_hedge(agent, backends, winner, len(backend_of), prompt, context, round_num, response)
+    
+    def _cached_hedge_response(
+        self,
+        backends: List[BaseAgent],
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Optional[AgentResponse]:
+        """A cached answer from any of a slot's backends, enforcing replay mode if none has one."""
+        if self.cache is None:
+            return None
+        for backend in backends:
+            response = self.cache.get(self._cache_key(backend, prompt, context, round_num))
+            if response is not None:
+                break
+        else:
+            # Raises in replay mode
+            return self._cache_lookup(self._cache_key(backends[0], prompt, context, round_num), backends[0])
+        for backend in backends:
+            backend.record_turn(prompt, context, round_num, response)
+        return response
+    
+    def _usable_backends(self, agent: BaseAgent) -> List[BaseAgent]:
+        """An agent's backends in order, without those whose circuit is open (the primary if all are)."""
+        backends = [agent] + agent.backups
+        return [backend for backend in backends if self.breakers.available(backend.provider)] or [agent]
+    
+    def _hedge_delay(self, backend: BaseAgent) -> float:
+        """Seconds to wait for a backend before calling the next one of its slot."""
+        return self.latency.hedge_delay(backend.provider, getattr(backend, "model", None))
+    
+    def _finish_hedge(
+        self,
+        agent: BaseAgent,
+        backends: List[BaseAgent],
+        winner: Optional[BaseAgent],
+        called: int,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        response: AgentResponse
+    ) -> AgentResponse:
+        """Label a hedged call's final response and keep every backend's conversation in step."""
+        if winner is not None:
+            response.metadata = {
+                **(response.metadata or {}),
+                "backend": f"{winner.provider}:{getattr(winner, 'model', None)}",
+                "hedged": agent.hedge and called > 1,
+                "fallback": winner is not agent
+            }
+            if self.verbose and (called > 1 or winner is not agent):
+                how = f"hedged across {called} backends" if agent.hedge and called > 1 else "fallback"
+                self.console.print(
+                    f"[dim]{agent.name}: answered by {response.metadata['backend']} ({how})[/dim]"
+                )
+        for backend in backends:
+            backend.record_turn(prompt, context, round_num, response)
+        return response
+    
+    def _call_backend(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions] = None,
+        hedged: bool = False
+    ) -> AgentResponse:
+        """
+        Call an agent through the response cache, window check, spend budget, rate limiter and retry policy.
+        
+        Hedged calls skip the cache lookup and the conversation history,
+        which the hedge handles for all of the slot's backends.
+        """
+        cache_key = self._cache_key(agent, prompt, context, round_num)
+        if not hedged:
+            response = self._cache_lookup(cache_key, agent)
+            if response is not None:
+                agent.record_turn(prompt, context, round_num, response)
+                return response
+        
+        refused = self._admit_call(agent, prompt, context, round_num)
+        if refused is not None:
+            return refused
+        
+        try:
+            budgeted = self._reserve_budget(agent, prompt, context, round_num, options)
+            attempt = 0
+            while True:
+                reservation = self._throttle(agent, prompt, context, round_num)
+                started = time.monotonic()
+                response = agent.generate_response(prompt, context, round_num)
+                self._settle(reservation, response)
+                self._record_latency(agent, response, started)
+                if self._record_outcome(agent, response):
+                    break
+                attempt += 1
+                delay = self._retry_delay(agent, response, attempt)
+                if delay is None:
+                    break
+                time.sleep(delay)
+        finally:
+            agent.max_tokens = None
+        
+        self._record_usage(agent, prompt, context, round_num, response, budgeted, options)
+        self._cache_store(cache_key, agent, response)
+        if not hedged:
+            agent.record_turn(prompt, context, round_num, response)
+        return response
+    
+    async def _acall_agent(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions] = None
+    ) -> AgentResponse:
+        """Async counterpart of _call_agent."""
+        response = self._resumed_response(agent, prompt, context, round_num, options)
+        if response is None and agent.backups:
+            response = await self._acall_hedged(agent, prompt, context, round_num, options)
+        elif response is None:
+            response = await self._acall_backend(agent, prompt, context, round_num, options)
+        self._record_response(agent, round_num, response, options)
+        return response
+    
+    async def _acall_hedged(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions] = None
+    ) -> AgentResponse:
+        """Async counterpart of _call_hedged; losing calls are cancelled."""
+        backends = [agent] + agent.backups
+        response = self._cached_hedge_response(backends, prompt, context, round_num)
+        if response is not None:
+            return response
+        
+        queue = self._usable_backends(agent)
+        backend_of = {}
+        pending = set()
+        winner = None
+        try:
+            while winner is None:
+                timeout = None
+                if len(backend_of) < len(queue):
+                    backend = queue[len(backend_of)]
+                    task = asyncio.ensure_future(
+                        self._acall_backend(backend, prompt, context, round_num, options, hedged=True)
+                    )
+                    backend_of[task] = backend
+                    pending.add(task)
+                    if agent.hedge and len(backend_of) < len(queue):
+                        timeout = self._hedge_delay(backend)
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    response = task.result()
+                    if not response.error and winner is None:
+                        winner = backend_of[task]
+                        winner_response = response
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if winner is not None:
+            # Another backend finishing in the same wait may have failed after it
+            response = winner_response
+        return self._finish_hedge(agent, backends, winner, len(backend_of), prompt, context, round_num, response)
+    
+    async def _acall_backend(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions] = None,
+        hedged: bool = False
+    ) -> AgentResponse:
+        """Async counterpart of _call_backend."""
+        cache_key = self._cache_key(agent, prompt, context, round_num)
+        if not hedged:
+            response = self._cache_lookup(cache_key, agent)
+            if response is not None:
+                agent.record_turn(prompt, context, round_num, response)
+                return response
+        
+        refused = self._admit_call(agent, prompt, context, round_num)
+        if refused is not None:
+            return refused
+        
+        budgeted = 0.0
+        try:
+            budgeted = self._reserve_budget(agent, prompt, context, round_num, options)
+            attempt = 0
+            while True:
+                reservation = await self._athrottle(agent, prompt, context, round_num)
+                started = time.monotonic()
+                response = await agent.agenerate_response(prompt, context, round_num)
+                self._settle(reservation, response)
+                self._record_latency(agent, response, started)
+                if self._record_outcome(agent, response):
+                    break
+                attempt += 1
+                delay = self._retry_delay(agent, response, attempt)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Hedge losers and dropped stragglers never settle their reservation
+            if options is not None and options.ledger is not None:
+                options.ledger.release(budgeted)
+            raise
+        finally:
+            agent.max_tokens = None
+        
+        self._record_usage(agent, prompt, context, round_num, response, budgeted, options)
+        self._cache_store(cache_key, agent, response)
+        if not hedged:
+            agent.record_turn(prompt, context, round_num, response)
+        return response
+    
+    def _record_outcome(self, agent: BaseAgent, response: AgentResponse) -> bool:
+        """
+        Update the provider's circuit breaker with a call's result.
+        
+        Only transient errors count as failures; any other answer, including
+        a validation error, shows the provider is up. Returns True when the
+        breaker is now open, so the call is not retried.
+        """
+        if not response.error or not (response.metadata or {}).get("retryable"):
+            self.breakers.record_success(agent.provider)
+            return False
+        if not self.breakers.record_failure(agent.provider):
+            return False
+        if self.verbose:
+            self.console.print(
+                f"[yellow]Circuit open for {agent.provider}: skipping it for "
+                f"{self.breakers.cooldown:.0f}s after repeated failures[/yellow]"
+            )
+        return True
+    
+    def _circuit_open_response(self, agent: BaseAgent) -> AgentResponse:
+        """Fast failure for a call to a provider whose breaker is open."""
+        return agent._error_response(
+            CircuitOpenError(f"{agent.provider} is failing; circuit open, call skipped"),
+            retryable=False,
+            circuit_open=True
+        )
+    
+    def _record_latency(self, agent: BaseAgent, response: AgentResponse, started: float):
+        """Feed the latency of a successful provider call to the hedge statistics."""
+        if not response.error:
+            self.latency.record(agent.provider, getattr(agent, "model", None), time.monotonic() - started)
+    
+    def _retry_delay(self, agent: BaseAgent, response: AgentResponse, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a failed call, or None when done."""
+        if not response.error:
+            return None
+        response.metadata["attempts"] = attempt
+        delay = self.retry_policy.next_delay(attempt, response.metadata)
+        if delay is not None and self.verbose:
+            reason = response.metadata.get("status_code") or response.metadata.get("error_type")
+            self.console.print(
+                f"[yellow]{agent.name} failed ({reason}), retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{self.retry_policy.max_attempts})...[/yellow]"
+            )
+        return delay
+    
+    def _estimate_request_tokens(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> int:
+        """Tokens to reserve for a call: estimated input plus the output cap."""
+        model = getattr(agent, "model", None)
+        if not self.rate_limiter.needs_tokens(agent.provider, model):
+            return 0
+        return self._estimate_input_tokens(agent, prompt, context, round_num) + agent.output_token_limit()
+    
+    def _estimate_input_tokens(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> int:
+        """Input tokens of a call, counted locally from the prompts it would send."""
+        request = agent.request_fingerprint(prompt, context, round_num)
+        history = "".join(message["content"] for message in request.get("history", []))
+        return count_tokens(request["system_prompt"] + history + request["prompt"], request["model"])
+    
+    def _throttle(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Reservation:
+        """Wait for the agent's provider rate limit before calling it."""
+        tokens = self._estimate_request_tokens(agent, prompt, context, round_num)
+        return self.rate_limiter.acquire(agent.provider, getattr(agent, "model", None), tokens)
+    
+    async def _athrottle(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Reservation:
+        """Async counterpart of _throttle."""
+        tokens = self._estimate_request_tokens(agent, prompt, context, round_num)
+        return await self.rate_limiter.aacquire(agent.provider, getattr(agent, "model", None), tokens)
+    
+    def _settle(self, reservation: Reservation, response: Optional[AgentResponse]):
+        """Correct the token reservation with the usage the provider reported."""
+        if response is not None:
+            self.rate_limiter.settle(reservation, response.tokens_used)
+    
+    def _admit_call(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Optional[AgentResponse]:
+        """
+        Size a request to the context window, then check the provider's breaker.
+        
+        Returns the error response to give instead of calling the provider
+        (prompt too large, circuit open), or None when the call goes ahead.
+        A refused call leaves the agent's max_tokens as it was; one that goes
+        ahead may lower it, and the caller resets it once the call is done.
+        """
+        refused = self._size_request(agent, prompt, context, round_num)
+        if refused is None and not self.breakers.allow(agent.provider):
+            agent.max_tokens = None
+            refused = self._circuit_open_response(agent)
+        return refused
+    
+    def _size_request(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Optional[AgentResponse]:
+        """
+        Check a request against the model's context window before sending it.
+        
+        Lowers the agent's max_tokens when input plus the output allowance
+        would overflow the window. Returns an error response, without calling
+        the provider, when the prompt leaves too little room for an answer.
+        """
+        model = getattr(agent, "model", None)
+        window = get_context_window(model)
+        input_tokens = self._estimate_input_tokens(agent, prompt, context, round_num)
+        room = window - input_tokens
+        max_output = agent.output_token_limit()
+        if room >= max_output:
+            return None
+        if room < min(MIN_OUTPUT_TOKENS, max_output):
+            return agent._error_response(ContextWindowExceededError(
+                f"Prompt is ~{input_tokens:,} tokens, leaving no room for a response in "
+                f"{model}'s {window:,}-token context window"
+            ))
+        agent.max_tokens = room
+        return None
+    
+    def _reserve_budget(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: Optional[DebateOptions]
+    ) -> float:
+        """
+        Reserve the worst-case cost of a call against the spend budget.
+        
+        Returns the reserved USD. When the call does not fit, the shrink and
+        skip_rounds policies lower the agent's max_tokens to what the budget
+        still covers; otherwise BudgetExceededError is raised before any
+        request is made.
+        """
+        ledger = options.ledger if options else None
+        model = getattr(agent, "model", None)
+        price = get_model_price(agent.provider, model)
+        if ledger is None or ledger.remaining() is None or not (price.input or price.output):
+            return 0.0
+        
+        input_tokens = self._estimate_input_tokens(agent, prompt, context, round_num)
+        max_output = agent.output_token_limit()
+        cost = Usage(input_tokens, max_output).cost(price)
+        if ledger.reserve(cost):
+            return cost
+        
+        remaining = ledger.remaining() or 0.0
+        if self.budget_policy in ("shrink", "skip_rounds") and price.output:
+            affordable = int((remaining - Usage(input_tokens).cost(price)) * 1_000_000 / price.output)
+            if affordable >= MIN_OUTPUT_TOKENS:
+                agent.max_tokens = min(affordable, max_output)
+                cost = Usage(input_tokens, agent.max_tokens).cost(price)
+                if ledger.reserve(cost):
+                    if self.verbose:
+                        self.console.print(
+                            f"[yellow]Budget: limiting {agent.name} to {agent.max_tokens} output tokens "
+                            f"(${remaining:.4f} left)[/yellow]"
+                        )
+                    return cost
+                agent.max_tokens = None
+        
+        raise BudgetExceededError(
+            f"Budget exceeded: {agent.name} ({model}) needs up to ${cost:.4f}, "
+            f"${max(0.0, remaining):.4f} left"
+        )
+    
+    def _record_usage(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        response: Optional[AgentResponse],
+        budgeted: float,
+        options: Optional[DebateOptions]
+    ):
+        """Record a call's normalized usage and cost, settling its budget reservation."""
+        ledger = options.ledger if options else None
+        if ledger is None or response is None:
+            return
+        if response.error:
+            ledger.release(budgeted)
+            return
+        
+        estimate = None
+        if response.tokens_used is None:
+            estimate = self._estimate_input_tokens(agent, prompt, context, round_num)
+        model = getattr(agent, "model", None)
+        usage = normalize_usage(response, estimate, lambda text: count_tokens(text, model))
+        cost = usage.cost(get_model_price(agent.provider, model))
+        
+        response.metadata = response.metadata or {}
+        response.metadata["cost_usd"] = round(cost, 6)
+        if response.tokens_used is None:
+            # Providers without usage reporting (Hugging Face, some Gemini responses)
+            response.tokens_used = usage.total_tokens
+            response.metadata["usage_estimated"] = True
+        ledger.record(LedgerEntry(agent.name, agent.provider, model, round_num, usage, cost), budgeted)
+    
+    def _round_fits_budget(
+        self,
+        topic: str,
+        context: Optional[List[AgentResponse]],
+        all_rounds: List[List[AgentResponse]],
+        round_num: int,
+        options: DebateOptions
+    ) -> bool:
+        """
+        Whether the budget covers another round plus the synthesis (skip_rounds policy).
+        
+        The projection is worst case: every agent uses its full output
+        allowance and, in sequential rounds, sees the answers given before it.
+        """
+        ledger = options.ledger
+        if self.budget_policy != "skip_rounds" or ledger is None:
+            return True
+        remaining = ledger.remaining()
+        if remaining is None:
+            return True
+        
+        prompt = self._build_round_prompt(topic, round_num)
+        projected = 0.0
+        new_output = 0
+        for agent in self._round_agents(round_num):
+            price = get_model_price(agent.provider, getattr(agent, "model", None))
+            input_tokens = self._estimate_input_tokens(agent, prompt, context, round_num)
+            projected += Usage(input_tokens + new_output, agent.output_token_limit()).cost(price)
+            if not options.parallel:
+                new_output += agent.output_token_limit()
+        
+        synthesizer = self.agents[0]
+        price = get_model_price(synthesizer.provider, getattr(synthesizer, "model", None))
+        synthesis_input = self._estimate_input_tokens(
+            synthesizer, self._build_synthesis_prompt(topic), self._collect_responses(all_rounds), 999
+        ) + sum(agent.output_token_limit() for agent in self.agents)
+        projected += Usage(synthesis_input, synthesizer.output_token_limit()).cost(price)
+        
+        if projected <= remaining:
+            return True
+        if self.verbose:
+            self.console.print(
+                f"[yellow]Budget: skipping round {round_num} and later rounds "
+                f"(needs up to ${projected:.4f} with synthesis, ${remaining:.4f} left)[/yellow]"
+            )
+        return False
+    
+    def _cache_key(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int
+    ) -> Optional[str]:
+        """Cache key for a request, or None when caching is disabled."""
+        if self.cache is None:
+            return None
+        return self.cache.make_key(agent.request_fingerprint(prompt, context, round_num))
+    
+    def _cache_lookup(self, cache_key: Optional[str], agent: BaseAgent) -> Optional[AgentResponse]:
+        """Return a cached response, enforcing replay mode on misses."""
+        if cache_key is None:
+            return None
+        response = self.cache.get(cache_key)
+        if response is None and self.replay:
+            raise CacheMissError(
+                f"Replay mode: no cached response for {agent.name} "
+                f"({getattr(agent, 'model', 'unknown')}). Run the debate once with --cache first."
+            )
+        return response
+    
+    def _cache_store(self, cache_key: Optional[str], agent: BaseAgent, response: AgentResponse):
+        """Store a successful response in the cache."""
+        if cache_key is None or response is None:
+            return
+        if response.metadata and response.metadata.get("error"):
+            return
+        self.cache.put(cache_key, response, provider=agent.provider)
+    
+    def _record_parallel_responses(
+        self,
+        responses: List[AgentResponse],
+        round_num: int,
+        options: DebateOptions
+    ):
+        """Display and transcribe the responses of a parallel round in agent order."""
+        for response in responses:
+            response.round_num = round_num
+            self._display_response(response)
+            if options.transcript is not None:
+                options.transcript.add_response(
+                    self._transcript_title(response.agent_name, round_num), response
+                )
+    
+    def _stream_agent(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: DebateOptions
+    ) -> AgentResponse:
+        """Stream one agent's response, rendering and transcribing deltas live."""
+        self._begin_stream(agent, round_num, options)
+        resumed = self._resumed_response(agent, prompt, context, round_num, options)
+        if resumed is not None:
+            self._record_response(agent, round_num, resumed, options)
+            self._end_stream(resumed, False, options)
+            return resumed
+        backend = self._usable_backends(agent)[0]
+        cache_key = self._cache_key(backend, prompt, context, round_num)
+        response = self._cache_lookup(cache_key, backend)
+        streamed = False
+        attempt = 0
+        if response is None:
+            response = self._admit_call(backend, prompt, context, round_num)
+        try:
+            budgeted = 0.0 if response is not None else self._reserve_budget(backend, prompt, context, round_num, options)
+            while response is None:
+                reservation = self._throttle(backend, prompt, context, round_num)
+                for event in backend.stream_response(prompt, context, round_num):
+                    if event.delta:
+                        streamed = True
+                        self._emit_delta(event.delta, options)
+                    if event.response is not None:
+                        response = event.response
+                self._settle(reservation, response)
+                attempt += 1
+                # Only retry failures that happened before anything was rendered
+                delay = None
+                if response is not None and not self._record_outcome(backend, response) and not streamed:
+                    delay = self._retry_delay(backend, response, attempt)
+                if delay is None:
+                    self._record_usage(backend, prompt, context, round_num, response, budgeted, options)
+                    self._cache_store(cache_key, backend, response)
+                    break
+                time.sleep(delay)
+                response = None
+        finally:
+            backend.max_tokens = None
+        for member in [agent] + agent.backups:
+            member.record_turn(prompt, context, round_num, response)
+        self._record_response(agent, round_num, response, options)
+        self._end_stream(response, streamed, options)
+        return response
+    
+    async def _astream_agent(
+        self,
+        agent: BaseAgent,
+        prompt: str,
+        context: Optional[List[AgentResponse]],
+        round_num: int,
+        options: DebateOptions
+    ) -> AgentResponse:
+        """Async counterpart of _stream_agent."""
+        self._begin_stream(agent, round_num, options)
+        resumed = self._resumed_response(agent, prompt, context, round_num, options)
+        if resumed is not None:
+            self._record_response(agent, round_num, resumed, options)
+            self._end_stream(resumed, False, options)
+            return resumed
+        backend = self._usable_backends(agent)[0]
+        cache_key = self._cache_key(backend, prompt, context, round_num)
+        response = self._cache_lookup(cache_key, backend)
+        streamed = False
+        attempt = 0
+        if response is None:
+            response = self._admit_call(backend, prompt, context, round_num)
+        try:
+            budgeted = 0.0 if response is not None else self._reserve_budget(backend, prompt, context, round_num, options)
+            while response is None:
+                reservation = await self._athrottle(backend, prompt, context, round_num)
+                async for event in backend.astream_response(prompt, context, round_num):
+                    if event.delta:
+                        streamed = True
+                        self._emit_delta(event.delta, options)
+                    if event.response is not None:
+                        response = event.response
+                self._settle(reservation, response)
+                attempt += 1
+                delay = None
+                if response is not None and not self._record_outcome(backend, response) and not streamed:
+                    delay = self._retry_delay(backend, response, attempt)
+                if delay is None:
+                    self._record_usage(backend, prompt, context, round_num, response, budgeted, options)
+                    self._cache_store(cache_key, backend, response)
+                    break
+                await asyncio.sleep(delay)
+                response = None
+        finally:
+            backend.max_tokens = None
+        for member in [agent] + agent.backups:
+            member.record_turn(prompt, context, round_num, response)
+        self._record_response(agent, round_num, response, options)
+        self._end_stream(response, streamed, options)
+        return response
+    
+    def _transcript_title(self, agent_name: str, round_num: int) -> str:
+        """Section title used for a response in the live transcript."""
+        if round_num == 999:
+            return f"Synthesis ({agent_name})"
+        return f"Round {round_num} - {agent_name}"
+    
+    def _begin_stream(self, agent: BaseAgent, round_num: int, options: DebateOptions):
+        """Open a streamed response in the console and the transcript."""
+        if self.verbose:
+            model = getattr(agent, "model", "")
+            self.console.rule(f"[bold]{agent.name}[/bold] ({model})", style="blue")
+        if options.transcript is not None:
+            options.transcript.begin(self._transcript_title(agent.name, round_num))
+    
+    def _emit_delta(self, delta: str, options: DebateOptions):
+        """Render a text delta and append it to the transcript."""
+        if self.verbose:
+            self.console.print(delta, end="", markup=False, highlight=False, soft_wrap=True)
+        if options.transcript is not None:
+            options.transcript.write(delta)
+    
+    def _end_stream(self, response: AgentResponse, streamed: bool, options: DebateOptions):
+        """Close a streamed response once the final AgentResponse is known."""
+        # Errors raised before the first delta still need to reach the reader
+        if not streamed and response.content:
+            self._emit_delta(response.content, options)
+        if options.transcript is not None:
+            options.transcript.write("\n")
+        if self.verbose:
+            self.console.print()
+            footer = f"{response.tokens_used} tokens" if response.tokens_used else "done"
+            self.console.rule(f"[dim]{footer}[/dim]", style="blue")
+    
+    def _build_round_prompt(self, topic: str, round_num: int) -> str:
+        """Build the user prompt for a debate round."""
         if round_num == 1:
-            prompt = f"""Discuss the following topic and provide your initial perspective with proper citations and sources:
+            return f"""Discuss the following topic and provide your initial perspective with proper citations and sources:
 
 TOPIC: {topic}
 
@@ -675,8 +2622,8 @@ Remember to:
 - Cite authoritative sources (research papers, documentation, official resources)
 - Include URLs or proper citations
 - Be precise with technical specifications"""
-        else:
-            prompt = f"""Review the previous responses and provide your critical analysis:
+        
+        return f"""Review the previous responses and provide your critical analysis:
 
 TOPIC: {topic}
 
@@ -687,41 +2634,89 @@ Your tasks for Round {round_num}:
 - BUILD ON strong points with additional sources
 - ADDRESS common misconceptions
 - PROVIDE new insights with proper citations"""
-        
-        for agent in self.agents:
-            if self.verbose:
-                self.console.print(f"[cyan]{agent.name} thinking...[/cyan]")
-                response = agent.generate_response(prompt, context, round_num)
-                self._display_response(response)
-            else:
-                response = agent.generate_response(prompt, context, round_num)
-            
-            responses.append(response)
-            
-            # Update context for next agent in this round
-            if context is None:
-                context = [response]
-            else:
-                context = context + [response]
-        
-        return responses
     
     def _generate_synthesis(
         self, 
         topic: str, 
-        all_rounds: List[List[AgentResponse]]
+        all_rounds: List[List[AgentResponse]],
+        options: Optional[DebateOptions] = None
     ) -> str:
         """Generate a comprehensive academic-style article from all debate rounds."""
-        # Use the first agent to synthesize
+        options = options or DebateOptions()
+        
+        # Use the first agent to synthesize, once a call of it cut off earlier has returned
         synthesizer = self.agents[0]
+        if self._late_calls_running(options, synthesizer):
+            self._wait_for_late_calls(options, None, synthesizer)
+            self._fold_late_responses(None, all_rounds, options)
+        synthesis_prompt = self._build_synthesis_prompt(topic)
+        all_responses = self._collect_responses(all_rounds)
+        
+        if options.stream:
+            synthesis_response = self._stream_agent(
+                synthesizer, synthesis_prompt, all_responses, 999, options
+            )
+            return synthesis_response.content
         
-        # Build comprehensive context
-        all_responses = []
-        for round_num, round_responses in enumerate(all_rounds, 1):
-            for response in round_responses:
-                all_responses.append(response)
+        if self.verbose:
+            self.console.print("[magenta]Generating comprehensive article with verified sources...[/magenta]")
+        
+        synthesis_response = self._call_agent(
+            synthesizer,
+            synthesis_prompt,
+            all_responses,
+            round_num=999,  # Special round number for synthesis
+            options=options
+        )
         
-        synthesis_prompt = f"""Based on the council's multi-round discussion on: "{topic}"
+        return synthesis_response.content
+    
+    async def _agenerate_synthesis(
+        self,
+        topic: str,
+        all_rounds: List[List[AgentResponse]],
+        options: Optional[DebateOptions] = None
+    ) -> str:
+        """Async counterpart of _generate_synthesis."""
+        options = options or DebateOptions()
+        synthesizer = self.agents[0]
+        if self._late_calls_running(options, synthesizer):
+            await self._await_late_calls(options, None, synthesizer)
+            self._fold_late_responses(None, all_rounds, options)
+        synthesis_prompt = self._build_synthesis_prompt(topic)
+        all_responses = self._collect_responses(all_rounds)
+        
+        if options.stream:
+            synthesis_response = await self._astream_agent(
+                synthesizer, synthesis_prompt, all_responses, 999, options
+            )
+            return synthesis_response.content
+        
+        if self.verbose:
+            self.console.print("[magenta]Generating comprehensive article with verified sources...[/magenta]")
+        
+        synthesis_response = await self._acall_agent(
+            synthesizer,
+            synthesis_prompt,
+            all_responses,
+            round_num=999,
+            options=options
+        )
+        
+        return synthesis_response.content
+    
+    def _collect_responses(self, all_rounds: List[List[AgentResponse]]) -> List[AgentResponse]:
+        """Flatten all debate rounds into a single context list, leaving out failed calls."""
+        return [
+            response
+            for round_responses in all_rounds
+            for response in round_responses
+            if not response.error
+        ]
+    
+    def _build_synthesis_prompt(self, topic: str) -> str:
+        """Build the prompt asking the synthesizer for the final article."""
+        return f"""Based on the council's multi-round discussion on: "{topic}"
 
 You must now write a COMPREHENSIVE ACADEMIC-STYLE ARTICLE that:
 
@@ -791,22 +2786,6 @@ You must now write a COMPREHENSIVE ACADEMIC-STYLE ARTICLE that:
 - Be thorough, objective, and balanced
 
 Generate the complete article now:"""
-
-        if self.verbose:
-            self.console.print("[magenta]Generating comprehensive article with verified sources...[/magenta]")
-            synthesis_response = synthesizer.generate_response(
-                synthesis_prompt, 
-                all_responses,
-                round_num=999  # Special round number for synthesis
-            )
-        else:
-            synthesis_response = synthesizer.generate_response(
-                synthesis_prompt, 
-                all_responses,
-                round_num=999
-            )
-        
-        return synthesis_response.content
     
     def _display_response(self, response: AgentResponse):
         """Display an agent response in the console."""
@@ -820,7 +2799,7 @@ Generate the complete article now:"""
         self.console.print(Panel(
             Markdown(response.content),
             title=title,
-            border_style="blue",
+            border_style="red" if response.error else "blue",
             padding=(1, 2)
         ))
     
@@ -839,7 +2818,8 @@ Generate the complete article now:"""
     
     def quick_discuss(self, topic: str) -> str:
         """Quick single-round discussion (no multi-round debate)."""
-        responses = self._conduct_round(topic, None, 1)
-        synthesis = self._generate_synthesis(topic, [responses])
+        options = self._resolve_options(topic)
+        responses = self._conduct_round(topic, None, 1, options)
+        synthesis = self._generate_synthesis(topic, [responses], options)
         return synthesis
 
@@ -0,0 +1,255 @@
+"""Append-only JSONL debate logs, written one response at a time."""
+import io
+import json
+import os
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from agents import AgentResponse
+from artifacts import artifact_stem
+
+
+# How DebateResults are saved: one indented JSON document at the end of the
+# debate, or a JSONL log appended to as responses land (optionally zstd-compressed)
+RESULTS_FORMATS = ("json", "jsonl", "jsonl.zst")
+
+# Bumped when the record layout changes
+DEBATE_LOG_VERSION = 1
+
+# Round number of the synthesis call (see LLMCouncil._generate_synthesis)
+SYNTHESIS_ROUND = 999
+
+# Raised when a compressed log ends mid-frame (the debate crashed)
+_TRUNCATED_ERRORS = (zstandard.ZstdError,) if zstandard is not None else ()
+
+
+def _dumps(record: Dict) -> bytes:
+    """One record as a line of compact JSON ("type" first, see iter_records)."""
+    if orjson is not None:
+        return orjson.dumps(record, default=str) + b"\n"
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+def _loads(line: bytes) -> Dict:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise ImportError(
+            "zstd-compressed debate logs need the zstandard package. "
+            "Install with: pip install zstandard"
+        )
+
+
+class DebateLog:
+    """
+    Writes a debate to a JSONL file as it happens.
+    
+    The first record describes the debate; every agent response is appended
+    as its call returns, each finished round as the order of its agents, and
+    the totals of the DebateResult last. Nothing is rewritten, so saving
+    costs one line per response instead of re-serializing the whole debate,
+    and a debate that crashes still leaves a readable log. Files ending in
+    ``.zst`` are zstd-compressed, flushed block by block. Safe to share
+    between threads.
+    """
+    
+    def __init__(self, path: str, topic: str, agents: List[str]):
+        """
+        Create the log and write its header record.
+        
+        Args:
+            path: File to write (.jsonl, or .jsonl.zst for zstd compression)
+            topic: Topic of the debate
+            agents: Names of the participating agents
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._latest: Dict[Tuple[int, str], AgentResponse] = {}
+        self._ended: Set[int] = set()
+        self._file = open(path, "wb")
+        self._writer = self._file
+        if path.endswith(".zst"):
+            _require_zstandard()
+            self._writer = zstandard.ZstdCompressor().stream_writer(self._file)
+        self._write({
+            "type": "debate",
+            "version": DEBATE_LOG_VERSION,
+            "topic": topic,
+            "timestamp": datetime.now().isoformat(),
+            "participating_agents": agents
+        })
+    
+    @classmethod
+    def create(cls, topic: str, agents: List[str], results_format: str = "jsonl", directory: str = "") -> "DebateLog":
+        """New log in ``directory`` named like save_to_file's debate_<artifact_stem>.json."""
+        return cls(os.path.join(directory, f"debate_{artifact_stem(topic)}.{results_format}"), topic, agents)
+    
+    def _write(self, record: Dict):
+        with self._lock:
+            if self._file.closed:
+                return
+            self._writer.write(_dumps(record))
+            if self._writer is not self._file:
+                self._writer.flush(zstandard.FLUSH_BLOCK)
+            self._file.flush()
+    
+    def add_response(self, round_num: int, agent_name: str, response: AgentResponse, late: bool = False):
+        """
+        Append a response of an agent.
+        
+        Calls that return after their round ended are not logged; the
+        council logs the ones it folds back into the debate with late=True.
+        """
+        with self._lock:
+            if round_num in self._ended and not late:
+                return
+            self._latest[(round_num, agent_name)] = response
+        self._write({"type": "response", "round": round_num, "agent": agent_name, **asdict(response)})
+    
+    def end_round(self, round_num: int, agent_names: List[str], responses: List[AgentResponse]):
+        """Record a finished round: kept responses not logged last (placeholders), then its agent order."""
+        for agent_name, response in zip(agent_names, responses):
+            if self._latest.get((round_num, agent_name)) is not response:
+                self.add_response(round_num, agent_name, response)
+        with self._lock:
+            self._ended.add(round_num)
+        self._write({"type": "round", "round": round_num, "agents": agent_names})
+    
+    def finish(self, result) -> str:
+        """
+        Append the totals of the finished debate and close the log.
+        
+        Args:
+            result: The debate's DebateResult
+        
+        Returns:
+            Path of the log
+        """
+        totals = result.to_dict()
+        for key in ("topic", "participating_agents", "rounds", "synthesis"):
+            totals.pop(key)
+        self._write({"type": "result", **totals})
+        self.close()
+        return self.path
+    
+    def close(self):
+        """Close the log (a log closed before finish() lacks the totals record)."""
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._writer is not self._file:
+                self._writer.flush(zstandard.FLUSH_FRAME)
+            self._file.close()
+
+
+def _open_lines(path: str) -> io.BufferedReader:
+    raw = open(path, "rb")
+    if not path.endswith(".zst"):
+        return raw
+    _require_zstandard()
+    return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True))
+
+
+def iter_records(path: str, types: Optional[Iterable[str]] = None) -> Iterator[Dict]:
+    """
+    Stream the records of a debate log.
+    
+    Args:
+        path: .jsonl or .jsonl.zst log
+        types: Only parse records of these types ("debate", "response",
+              "round", "result"); other lines are skipped unparsed, which
+              makes reading the header and totals of a large log cheap
+    
+    A log cut short by a crash ends at its last complete record.
+    """
+    prefixes = tuple(f'{{"type":"{kind}"'.encode() for kind in types) if types is not None else None
+    with _open_lines(path) as f:
+        try:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if prefixes is None or line.startswith(prefixes):
+                    yield _loads(line)
+        except _TRUNCATED_ERRORS:
+            return
+
+
+def read_summary(path: str) -> Dict:
+    """Header and totals of a debate log (no responses), e.g. to index an archive."""
+    summary = {}
+    for record in iter_records(path, types=("debate", "result")):
+        summary.update({key: value for key, value in record.items() if key != "type"})
+    return summary
+
+
+def _response(record: Dict) -> AgentResponse:
+    return AgentResponse(**{key: value for key, value in record.items() if key not in ("type", "round", "agent")})
+
+
+def load_debate(path: str):
+    """
+    Rebuild the DebateResult saved in a debate log.
+    
+    Records are streamed, so only the debate itself is held in memory. The
+    latest response of an agent in a round wins (retries and late answers
+    replace earlier ones); a round the log has no end for (the debate
+    crashed during it) keeps its responses in the order they were logged.
+    """
+    # council imports this module to write logs
+    from council import DebateResult
+    
+    header: Dict = {}
+    totals: Dict = {}
+    responses: Dict[Tuple[int, str], AgentResponse] = {}
+    round_agents: Dict[int, List[str]] = {}
+    for record in iter_records(path):
+        kind = record["type"]
+        if kind == "response":
+            key = (record["round"], record["agent"])
+            responses[key] = _response(record)
+            round_agents.setdefault(record["round"], [])
+            if key[1] not in round_agents[key[0]]:
+                round_agents[key[0]].append(key[1])
+        elif kind == "round":
+            round_agents[record["round"]] = record["agents"]
+        elif kind == "debate":
+            header = record
+        elif kind == "result":
+            totals = record
+    
+    synthesis = [responses[(SYNTHESIS_ROUND, name)] for name in round_agents.pop(SYNTHESIS_ROUND, [])]
+    rounds = [
+        [responses[(round_num, name)] for name in round_agents[round_num] if (round_num, name) in responses]
+        for round_num in sorted(round_agents)
+    ]
+    return DebateResult(
+        topic=header.get("topic", ""),
+        rounds=rounds,
+        synthesis=synthesis[-1].content if synthesis else "",
+        timestamp=totals.get("timestamp", header.get("timestamp", "")),
+        total_tokens=totals.get(
+            "total_tokens", sum(response.tokens_used or 0 for responses in rounds for response in responses)
+        ),
+        participating_agents=header.get("participating_agents", []),
+        cached_tokens=totals.get("cached_tokens", 0),
+        cost_usd=totals.get("cost_usd", 0.0),
+        usage=totals.get("usage"),
+        stop_reason=totals.get("stop_reason"),
+        convergence=totals.get("convergence")
+    )
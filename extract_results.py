@@ -13,12 +13,16 @@ import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
-import re
+
+from markdown_sections import SectionIndex
 
 def extract_results_from_markdown(markdown_content):
     """Extract results-focused content from a full article."""
     
-    lines = markdown_content.split('\n')
+    # Index the sections (## and deeper headers) once; the whole document is
+    # indexed so code fences the header block cuts through are still tracked
+    index = SectionIndex(markdown_content, bold_headers=False, min_level=2)
+    lines = index.lines
     
     # Extract header information
     header_lines = []
@@ -36,62 +40,12 @@ def extract_results_from_markdown(markdown_content):
             header_lines.append(lines[i])
         i += 1
     
-    # Sections to extract (results-focused)
-    sections_to_extract = {
-        'EXECUTIVE SUMMARY': [],
-        'KEY FINDINGS': [],
-        'INTRODUCTION': [],
-        'ANALYSIS': [],
-        'SOURCE VALIDATION': [],
-        'VERIFIED SOURCES': [],
-        'REFERENCES': [],
-        'CONSENSUS': [],
-        'DISAGREEMENTS': [],
-        'MISCONCEPTIONS': [],
-        'COMMON MISCONCEPTIONS': [],
-        'TECHNICAL': [],
-        'BEST PRACTICES': [],
-        'RECOMMENDATIONS': [],
-        'IMPLEMENTATION': [],
-        'PRACTICAL': [],
-        'LIMITATIONS': [],
-        'GAPS': [],
-        'FUTURE': [],
-        'OUTLOOK': [],
-        'CONCLUSION': [],
-        'NEXT STEPS': []
-    }
-    
     # Sections to skip (discussion-focused)
     sections_to_skip = [
         'ROUND', 'DEBATE', 'DISCUSSION', 'AGENT RESPONSES',
         'CONVERSATION', 'DIALOGUE', 'EXCHANGE'
     ]
     
-    current_section = None
-    current_content = []
-    extracted_sections = {}
-    
-    for line in lines[i:]:
-        # Detect section headers (## or ###)
-        if line.strip().startswith('##'):
-            # Save previous section
-            if current_section and current_content:
-                # Check if not a skip section
-                if not any(skip_word in current_section.upper() for skip_word in sections_to_skip):
-                    extracted_sections[current_section] = '\n'.join(current_content)
-            
-            # Start new section
-            current_section = line.strip('#').strip()
-            current_content = [line]
-        elif current_section:
-            current_content.append(line)
-    
-    # Save last section
-    if current_section and current_content:
-        if not any(skip_word in current_section.upper() for skip_word in sections_to_skip):
-            extracted_sections[current_section] = '\n'.join(current_content)
-    
     # Build results article
     results = []
     
@@ -137,24 +91,26 @@ def extract_results_from_markdown(markdown_content):
     
     added_sections = set()
     
+    # Sections after the header block by header line as written: a repeated
+    # header keeps its first place and its last content, and variants such
+    # as "Challenges" and "Challenges:" are all kept
+    extracted_sections = {}
+    for section in index.sections:
+        if section.line >= i and section.tags.isdisjoint(sections_to_skip):
+            extracted_sections[lines[section.line].strip('#').strip()] = section
+    
     for section_keyword, emoji in priority_sections:
-        for section_name, content in extracted_sections.items():
-            if section_keyword in section_name.upper() and section_name not in added_sections:
-                # Add section with emoji
-                section_lines = content.split('\n')
-                if section_lines and section_lines[0].startswith('##'):
-                    # Replace header with emoji version
-                    results.append(f"## {emoji} {section_lines[0].strip('#').strip()}")
-                    results.extend(section_lines[1:])
-                else:
-                    results.append(f"## {emoji} {section_name}")
-                    results.append('')
-                    results.extend(section_lines)
-                
-                results.append('')
-                results.append('---')
-                results.append('')
-                added_sections.add(section_name)
+        for title, section in extracted_sections.items():
+            if section_keyword not in section.tags or title in added_sections:
+                continue
+            # Add section with emoji
+            results.append(f"## {emoji} {title}")
+            results.extend(section.lines)
+            
+            results.append('')
+            results.append('---')
+            results.append('')
+            added_sections.add(title)
     
     # Add metadata footer
     results.append('')
@@ -17,34 +17,28 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 
+from markdown_sections import SectionIndex
+
 def load_debate(json_file):
-    """Load debate data from JSON file."""
+    """Load debate data from a JSON file or a JSONL debate log (.jsonl, .jsonl.zst)."""
+    if '.jsonl' in Path(json_file).name:
+        from debate_log import load_debate as load_debate_log
+        return load_debate_log(json_file).to_dict()
     with open(json_file, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 def extract_key_points(synthesis):
     """Extract key points from synthesis text."""
-    # Simple extraction based on common patterns
-    lines = synthesis.split('\n')
+    key_point_sections = SectionIndex(synthesis).tagged(
+        'EXECUTIVE SUMMARY', 'KEY FINDINGS', 'CONCLUSIONS',
+        'RECOMMENDATIONS', 'MAIN POINTS'
+    )
     key_points = []
-    
-    in_section = False
-    current_section = None
-    
-    for line in lines:
-        line = line.strip()
-        
-        # Detect section headers
-        if any(keyword in line.upper() for keyword in [
-            'EXECUTIVE SUMMARY', 'KEY FINDINGS', 'CONCLUSIONS',
-            'RECOMMENDATIONS', 'MAIN POINTS'
-        ]):
-            in_section = True
-            current_section = line
-        elif line.startswith('#'):
-            in_section = False
-        elif in_section and line and not line.startswith('-'):
-            key_points.append(line)
+    for section in key_point_sections:
+        for line in section.lines:
+            line = line.strip()
+            if line and not line.startswith('-'):
+                key_points.append(line)
     
     return key_points
 
@@ -1,17 +1,53 @@
 """Main entry point for LLM Council."""
 import argparse
-from typing import List
+from typing import List, Optional
 
-from agents import (
-    ClaudeAgent, ChatGPTAgent, GeminiAgent, MistralAgent,
-    OllamaAgent, GroqAgent, HuggingFaceAgent, DeepSeekAgent,
-    OpenRouterAgent, CometAgent, BaseAgent
-)
-from council import LLMCouncil
+from agents.registry import PROVIDERS, create_agent, order_specs, parse_spec, split_slot
+from agents.usage import BUDGET_POLICIES, BudgetExceededError, UsageLedger
+from checkpoint import DebateCheckpoint
+from council import LATE_RESPONSE_POLICIES, LLMCouncil
 from config import Config
+from debate_log import RESULTS_FORMATS
+from response_cache import ResponseCache, CacheMissError
 
 
-def create_council(models: List[str] = None) -> LLMCouncil:
+def resolve_spec(model_spec: str, available_models: List[str]) -> Optional[str]:
+    """Return the spec to create an agent from, or None (with a warning) if unavailable."""
+    provider, specific_model = parse_spec(model_spec)
+    if specific_model and provider in PROVIDERS and PROVIDERS[provider].multi_model:
+        # Specific model: "ollama:llama3.1:8b" or "comet:gpt-5.2" or "comet:advanced"
+        return model_spec
+    if provider in available_models:
+        # Simple provider name: "gemini", "claude", "comet", etc.
+        return provider
+    if specific_model:
+        print(f"Warning: Provider '{provider}' not available or not configured")
+    else:
+        print(f"Warning: Model '{model_spec}' not available")
+    return None
+
+
+def create_council(
+    models: List[str] = None,
+    parallel: bool = None,
+    max_concurrency: int = None,
+    stream: bool = False,
+    cache: bool = False,
+    replay: bool = False,
+    retry_failed: bool = None,
+    multi_turn: bool = None,
+    budget_usd: float = None,
+    budget_policy: str = None,
+    ledger: UsageLedger = None,
+    round_deadline: float = None,
+    quorum: int = None,
+    late_responses: str = None,
+    early_stop: bool = None,
+    results_format: str = None,
+    output_dir: str = None,
+    background_writes: bool = None,
+    verbose: bool = True
+) -> LLMCouncil:
     """
     Create an LLM Council with specified models.
     
@@ -22,6 +58,33 @@ def create_council(models: List[str] = None) -> LLMCouncil:
                 - "ollama" - uses default Ollama model
                 - "ollama:llama3.1:8b" - uses specific Ollama model
                 - "gemini" - uses default Gemini model
+                - "groq|openrouter:meta-llama/llama-3-70b-instruct" - one agent
+                  whose slow calls are hedged to the equivalent backends
+                - "groq->openrouter:meta-llama/llama-3-70b-instruct->ollama:llama3.1:8b" -
+                  a fallback chain, used when a backend fails or its circuit is open
+        parallel: Run each round's agents concurrently (default: Config.PARALLEL_ROUNDS)
+        max_concurrency: Maximum number of concurrent agent calls in parallel mode
+        stream: Stream responses token by token to the console and a transcript file
+        cache: Serve identical agent calls from the on-disk response cache
+        replay: Serve the whole debate from the cache without calling providers
+        retry_failed: Retry agents that failed at the end of each round
+                     (default: Config.RETRY_FAILED_AGENTS)
+        multi_turn: Keep per-agent conversations across rounds and send only
+                   new responses (default: Config.MULTI_TURN)
+        budget_usd: Spend cap per debate in USD (default: Config.BUDGET_USD)
+        budget_policy: abort, skip_rounds or shrink (default: Config.BUDGET_POLICY)
+        ledger: Shared ledger (e.g. for a batch of debates) that also records
+               usage and enforces its own budget
+        round_deadline: Seconds a round may take before stragglers are cut off
+                       (default: Config.ROUND_DEADLINE)
+        quorum: Successful answers a parallel round waits for (default: Config.ROUND_QUORUM)
+        late_responses: next_round or drop (default: Config.LATE_RESPONSES)
+        early_stop: End debates once a round adds nothing new (default: Config.EARLY_STOP)
+        results_format: json, jsonl or jsonl.zst (default: Config.RESULTS_FORMAT)
+        output_dir: Directory debate files are saved to (default: current directory)
+        background_writes: Save finished debates' files in a background thread
+                          (default: Config.BACKGROUND_WRITES)
+        verbose: Print the debate's progress (off for debates run concurrently)
         
     Returns:
         Configured LLMCouncil instance
@@ -31,40 +94,17 @@ def create_council(models: List[str] = None) -> LLMCouncil:
     available_models = Config.get_available_models()
     
     # Parse model specifications (support provider:model syntax)
-    parsed_models = []
-    ollama_models = []  # Track specific ollama models
-    comet_models = []  # Track specific comet models or categories
-    openrouter_models = []  # Track specific openrouter models
-    
+    backup_specs = {}
+    hedged = {}
     if models:
-        for model_spec in models:
-            if ":" in model_spec:
-                # Specific model: "ollama:llama3.1:8b" or "comet:gpt-5.2" or "comet:advanced"
-                parts = model_spec.split(":", 1)
-                provider = parts[0]
-                specific_model = parts[1] if len(parts) > 1 else None
-                
-                if provider == "ollama" and specific_model:
-                    ollama_models.append(specific_model)
-                    parsed_models.append(f"ollama:{specific_model}")
-                elif provider == "comet" and specific_model:
-                    comet_models.append(specific_model)
-                    parsed_models.append(f"comet:{specific_model}")
-                elif provider == "openrouter" and specific_model:
-                    openrouter_models.append(specific_model)
-                    parsed_models.append(f"openrouter:{specific_model}")
-                elif provider in available_models:
-                    parsed_models.append(provider)
-                else:
-                    print(f"Warning: Provider '{provider}' not available or not configured")
-            else:
-                # Simple provider name: "gemini", "claude", "comet", etc.
-                if model_spec in available_models:
-                    parsed_models.append(model_spec)
-                else:
-                    print(f"Warning: Model '{model_spec}' not available")
-        
-        models_to_use = parsed_models
+        models_to_use = []
+        for slot in models:
+            slot_specs, hedge = split_slot(slot)
+            specs = [spec for spec in (resolve_spec(spec, available_models) for spec in slot_specs) if spec]
+            if specs:
+                models_to_use.append(specs[0])
+                backup_specs[specs[0]] = specs[1:]
+                hedged[specs[0]] = hedge
     else:
         # Use all available models
         models_to_use = available_models
@@ -75,220 +115,55 @@ def create_council(models: List[str] = None) -> LLMCouncil:
             f"Requested: {models}"
         )
     
+    # Provider SDKs are imported here, only for the providers in use
     agents = []
-    
-    # Create agents based on available API keys
-    # Paid models
-    if "claude" in models_to_use:
-        if ClaudeAgent is None:
-            print("Warning: Claude requested but anthropic package not installed.")
-            print("Install with: pip install anthropic")
-        else:
-            try:
-                agents.append(ClaudeAgent(
-                    name="Claude",
-                    role="Critical Analyst - Questions assumptions and explores edge cases"
-                ))
-            except Exception as e:
-                print(f"Warning: Could not initialize Claude agent: {e}")
-    
-    if "chatgpt" in models_to_use:
-        if ChatGPTAgent is None:
-            print("Warning: ChatGPT requested but openai package not installed.")
-            print("Install with: pip install openai")
-        else:
-            try:
-                agents.append(ChatGPTAgent(
-                    name="ChatGPT",
-                    role="Pragmatic Problem Solver - Focuses on practical solutions"
-                ))
-            except Exception as e:
-                print(f"Warning: Could not initialize ChatGPT agent: {e}")
-    
-    if "gemini" in models_to_use:
-        if GeminiAgent is None:
-            print("Warning: Gemini requested but google-generativeai package not installed.")
-            print("Install with: pip install google-generativeai")
-        else:
-            try:
-                agents.append(GeminiAgent(
-                    name="Gemini",
-                    role="Research Synthesizer - Integrates diverse perspectives"
-                ))
-            except Exception as e:
-                print(f"Warning: Could not initialize Gemini agent: {e}")
-    
-    if "mistral" in models_to_use:
-        if MistralAgent is None:
-            print("Warning: Mistral requested but mistralai package not installed.")
-            print("Install with: pip install mistralai")
-        else:
-            try:
-                agents.append(MistralAgent(
-                    name="Mistral",
-                    role="Devil's Advocate - Challenges consensus and explores alternatives"
-                ))
-            except Exception as e:
-                print(f"Warning: Could not initialize Mistral agent: {e}")
-    
-    # Free/Open source models
-    # Handle multiple Ollama agents with different models
-    ollama_specs = [m for m in models_to_use if m.startswith("ollama")]
-    
-    if ollama_specs:
-        if OllamaAgent is None:
-            print("Warning: Ollama requested but ollama package not installed.")
-            print("Install with: pip install ollama")
-        else:
-            # If no specific models, use default once
-            if not any(":" in spec for spec in ollama_specs):
-                try:
-                    agents.append(OllamaAgent(
-                        name="Llama",
-                        role="Local Reasoning Expert - Free local inference"
-                    ))
-                except Exception as e:
-                    print(f"Warning: Could not initialize Ollama agent: {e}")
-            else:
-                # Create agent for each specific Ollama model
-                for spec in ollama_specs:
-                    if ":" in spec:
-                        model_name = spec.split(":", 1)[1]
-                        # Derive friendly name from model
-                        friendly_name = model_name.split(":")[0].title()
-                        try:
-                            agents.append(OllamaAgent(
-                                name=friendly_name,
-                                role=f"Local Expert ({model_name})",
-                                model=model_name
-                            ))
-                        except Exception as e:
-                            print(f"Warning: Could not initialize Ollama agent with {model_name}: {e}")
-    
-    if "groq" in models_to_use:
-        if GroqAgent is None:
-            print("Warning: Groq requested but groq package not installed.")
-            print("Install with: pip install groq")
-        else:
-            try:
-                agents.append(GroqAgent(
-                    name="Groq",
-                    role="Fast Inference Specialist - Ultra-fast free API"
-                ))
-            except Exception as e:
-                print(f"Warning: Could not initialize Groq agent: {e}")
-    
-    if "huggingface" in models_to_use:
-        if HuggingFaceAgent is None:
-            print("Warning: HuggingFace requested but huggingface_hub package not installed.")
-            print("Install with: pip install huggingface-hub")
-        else:
+    for spec in order_specs(models_to_use):
+        agent = None
+        for candidate in [spec] + backup_specs.get(spec, []):
             try:
-                agents.append(HuggingFaceAgent(
-                    name="HuggingFace",
-                    role="Open Source Specialist - Community-driven models"
-                ))
+                backend = create_agent(candidate)
+            except ImportError as e:
+                print(f"Warning: {e}")
+                continue
             except Exception as e:
-                print(f"Warning: Could not initialize HuggingFace agent: {e}")
-    
-    if "deepseek" in models_to_use:
-        if DeepSeekAgent is None:
-            print("Warning: DeepSeek requested but openai package not installed.")
-            print("Install with: pip install openai")
-        else:
-            try:
-                agents.append(DeepSeekAgent(
-                    name="DeepSeek",
-                    role="Technical Innovator - Cutting-edge Chinese LLM"
-                ))
-            except Exception as e:
-                print(f"Warning: Could not initialize DeepSeek agent: {e}")
-    
-    # Advanced Providers
-    # Handle OpenRouter agents
-    openrouter_specs = [m for m in models_to_use if m.startswith("openrouter")]
-    
-    if openrouter_specs:
-        if OpenRouterAgent is None:
-            print("Warning: OpenRouter requested but openai package not installed.")
-            print("Install with: pip install openai")
-        else:
-            # If no specific models, use default once
-            if not any(":" in spec for spec in openrouter_specs):
-                try:
-                    agents.append(OpenRouterAgent(
-                        name="OpenRouter",
-                        role="Versatile AI - Access to 100+ models"
-                    ))
-                except Exception as e:
-                    print(f"Warning: Could not initialize OpenRouter agent: {e}")
+                print(f"Warning: Could not initialize {candidate} agent: {e}")
+                continue
+            if agent is None:
+                agent = backend
             else:
-                # Create agent for each specific OpenRouter model
-                for spec in openrouter_specs:
-                    if ":" in spec:
-                        model_name = spec.split(":", 1)[1]
-                        friendly_name = f"OpenRouter-{model_name.split('/')[-1]}"
-                        try:
-                            agents.append(OpenRouterAgent(
-                                name=friendly_name,
-                                role=f"OpenRouter Expert ({model_name})",
-                                model=model_name
-                            ))
-                        except Exception as e:
-                            print(f"Warning: Could not initialize OpenRouter agent with {model_name}: {e}")
-    
-    # Handle Comet agents (with category support)
-    comet_specs = [m for m in models_to_use if m.startswith("comet")]
-    
-    if comet_specs:
-        if CometAgent is None:
-            print("Warning: Comet requested but openai package not installed.")
-            print("Install with: pip install openai")
-        else:
-            # If no specific models, use default once
-            if not any(":" in spec for spec in comet_specs):
-                try:
-                    agents.append(CometAgent(
-                        name="Comet",
-                        role="Comet AI Analysis - Versatile and powerful models"
-                    ))
-                except Exception as e:
-                    print(f"Warning: Could not initialize Comet agent: {e}")
-            else:
-                # Create agent for each specific Comet model or category
-                for spec in comet_specs:
-                    if ":" in spec:
-                        model_or_category = spec.split(":", 1)[1]
-                        
-                        # Check if it's a category
-                        categories = ['advanced', 'opensource', 'free', 'fast']
-                        if model_or_category.lower() in categories:
-                            # Use category
-                            try:
-                                agents.append(CometAgent(
-                                    name=f"Comet-{model_or_category.title()}",
-                                    category=model_or_category.lower(),
-                                    role=f"Comet {model_or_category.title()} Analysis"
-                                ))
-                            except Exception as e:
-                                print(f"Warning: Could not initialize Comet with category {model_or_category}: {e}")
-                        else:
-                            # Use specific model
-                            try:
-                                agents.append(CometAgent(
-                                    name=f"Comet-{model_or_category}",
-                                    model=model_or_category,
-                                    role=f"Comet Analysis ({model_or_category})"
-                                ))
-                            except Exception as e:
-                                print(f"Warning: Could not initialize Comet with model {model_or_category}: {e}")
+                # Same name and role, so every backend gets the same prompts
+                backend.name, backend.role = agent.name, agent.role
+                agent.backups.append(backend)
+        if agent is not None:
+            agent.hedge = hedged.get(spec, True)
+            agents.append(agent)
     
     if not agents:
         raise ValueError(
             "No agents could be initialized. Please check your configuration and installed packages."
         )
     
-    return LLMCouncil(agents, verbose=True)
+    return LLMCouncil(
+        agents,
+        verbose=verbose,
+        parallel=parallel,
+        max_concurrency=max_concurrency,
+        stream=stream,
+        cache=ResponseCache() if cache or replay else None,
+        replay=replay,
+        retry_failed=retry_failed,
+        multi_turn=multi_turn,
+        budget_usd=budget_usd,
+        budget_policy=budget_policy,
+        ledger=ledger,
+        round_deadline=round_deadline,
+        quorum=quorum,
+        late_responses=late_responses,
+        early_stop=early_stop,
+        results_format=results_format,
+        output_dir=output_dir,
+        background_writes=background_writes
+    )
 
 
 def main():
@@ -304,8 +179,8 @@ def main():
     parser.add_argument(
         "--rounds",
         type=int,
-        default=3,
-        help="Number of debate rounds (default: 3)"
+        default=None,
+        help="Number of debate rounds (default: 3, or the resumed debate's)"
     )
     parser.add_argument(
         "--models",
@@ -314,7 +189,10 @@ def main():
             "Models to include in the council (default: all available). "
             "Supports specific model syntax for providers. "
             "Examples: claude, gemini, ollama:llama3.1:8b, ollama:mistral:7b, "
-            "comet:advanced, comet:free, comet:gpt-5.2, openrouter:anthropic/claude-3.5-sonnet"
+            "comet:advanced, comet:free, comet:gpt-5.2, openrouter:anthropic/claude-3.5-sonnet. "
+            "Join equivalent backends with | to hedge slow calls "
+            "(\"groq|openrouter:meta-llama/llama-3-70b-instruct\") or with -> for a fallback chain "
+            "(\"groq->openrouter:meta-llama/llama-3-70b-instruct->ollama:llama3.1:8b\")"
         )
     )
     parser.add_argument(
@@ -332,9 +210,106 @@ def main():
         action="store_true",
         help="Quick mode: single round discussion"
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        default=None,
+        help="Call all agents of a round concurrently (each sees the previous round only)"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Maximum number of concurrent agent calls in parallel mode (default: all agents)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses live as they are generated (also written to transcript_*.md)"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Cache agent responses on disk and reuse them for identical calls ({Config.CACHE_PATH})"
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Replay a previously cached debate without calling any provider"
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        default=None,
+        help="Give agents that failed with a transient error another attempt at the end of each round"
+    )
+    parser.add_argument(
+        "--multi-turn",
+        action="store_true",
+        default=None,
+        help="Keep each agent's conversation across rounds and send it only new responses"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="Maximum spend for the debate in USD (default: BUDGET_USD, 0 = unlimited)"
+    )
+    parser.add_argument(
+        "--budget-policy",
+        choices=BUDGET_POLICIES,
+        default=None,
+        help="When a call would exceed the budget: abort, skip_rounds or shrink (default: BUDGET_POLICY)"
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Seconds a round may take; agents that haven't answered are cut off (default: ROUND_DEADLINE)"
+    )
+    parser.add_argument(
+        "--quorum",
+        type=int,
+        default=None,
+        help="In parallel rounds, move on once this many agents answered (default: ROUND_QUORUM, 0 = all)"
+    )
+    parser.add_argument(
+        "--late-responses",
+        choices=LATE_RESPONSE_POLICIES,
+        default=None,
+        help="Answers arriving after a cut-off: fold into the next round or drop (default: LATE_RESPONSES)"
+    )
+    parser.add_argument(
+        "--early-stop",
+        action="store_true",
+        default=None,
+        help="End the debate once a round mostly repeats the previous one (see CONVERGENCE_THRESHOLD)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=RESULTS_FORMATS,
+        default=None,
+        help="Save results as one JSON document, or as a JSONL log written as responses land "
+             "(jsonl.zst: zstd-compressed) (default: RESULTS_FORMAT)"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="CHECKPOINT",
+        help=f"Continue an interrupted debate from its checkpoint in {Config.CHECKPOINT_DIR}/ "
+             "without calling providers again for the responses it already has"
+    )
     
     args = parser.parse_args()
     
+    if args.resume:
+        try:
+            checkpoint = DebateCheckpoint.load(args.resume)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        args.topic = args.topic or checkpoint.topic
+        args.rounds = args.rounds or checkpoint.rounds
+    
     # Interactive mode if no topic provided
     if not args.topic:
         print("\n🏛️  Welcome to LLM Council\n")
@@ -349,22 +324,42 @@ def main():
     
     # Create council
     try:
-        council = create_council(args.models)
+        council = create_council(
+            args.models,
+            parallel=args.parallel,
+            max_concurrency=args.max_concurrency,
+            stream=args.stream,
+            cache=args.cache,
+            replay=args.replay,
+            retry_failed=args.retry_failed,
+            multi_turn=args.multi_turn,
+            budget_usd=args.budget,
+            budget_policy=args.budget_policy,
+            round_deadline=args.deadline,
+            quorum=args.quorum,
+            late_responses=args.late_responses,
+            early_stop=args.early_stop,
+            results_format=args.format
+        )
     except ValueError as e:
         print(f"Error: {e}")
         return
     
     # Run debate
-    if args.quick:
-        synthesis = council.quick_discuss(topic)
-        print("\n" + synthesis)
-    else:
-        result = council.debate(
-            topic=topic,
-            rounds=args.rounds,
-            save_results=not args.no_save,
-            save_markdown=not args.no_markdown and not args.no_save
-        )
+    try:
+        if args.quick:
+            synthesis = council.quick_discuss(topic)
+            print("\n" + synthesis)
+        else:
+            result = council.debate(
+                topic=topic,
+                rounds=args.rounds or 3,
+                save_results=not args.no_save,
+                save_markdown=not args.no_markdown and not args.no_save,
+                resume=args.resume
+            )
+    except (CacheMissError, BudgetExceededError, ValueError) as e:
+        print(f"Error: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+"""Single-pass section index of Markdown documents (syntheses and articles)."""
+import re
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+
+# Keywords sections are tagged with, matched as upper-case substrings of
+# their titles (and of the whole document, see SectionIndex.mentions)
+SECTION_KEYWORDS = (
+    "EXECUTIVE SUMMARY", "SUMMARY", "KEY FINDINGS", "MAIN POINTS", "INTRODUCTION",
+    "DETAILED ANALYSIS", "ANALYSIS", "SOURCE VALIDATION", "VERIFIED SOURCES", "REFERENCES",
+    "CONSENSUS", "DISAGREEMENTS", "COMMON MISCONCEPTIONS", "MISCONCEPTIONS", "TECHNICAL",
+    "DEEP DIVE", "BEST PRACTICES", "RECOMMENDATIONS", "IMPLEMENTATION", "PRACTICAL",
+    "LIMITATIONS", "GAPS", "FUTURE", "OUTLOOK", "CONCLUSIONS", "CONCLUSION", "NEXT STEPS",
+    "PATTERN", "ARCHITECTURE", "DESIGN", "SECURITY", "QUALITY", "PERFORMANCE",
+    "ROUND", "DEBATE", "DISCUSSION", "AGENT RESPONSES", "CONVERSATION", "DIALOGUE", "EXCHANGE",
+)
+
+# Level of "**Title**" lines, below any "#" header
+BOLD_HEADER_LEVEL = 7
+
+_FENCES = ("```", "~~~")
+
+# Line DebateResult._build_markdown_article puts after a response it cut short
+RESPONSE_TRUNCATED = "*[Response truncated - see full content in JSON file]*"
+
+# Starts of the lines that can open a section, open or close a code fence,
+# or end a response cut short, from the newline before them (a literal
+# first character keeps the regex engine's search fast); all other lines
+# are body text never looked at in Python
+_CANDIDATE_MARKERS = ("#", "**", RESPONSE_TRUNCATED) + _FENCES
+_CANDIDATE_LINE = re.compile(r"\n[^\S\n]*(?=#|\*\*|```|~~~|" + re.escape(RESPONSE_TRUNCATED) + ")")
+
+
+def _candidate_lines(text: str, first_line: str) -> Iterator[int]:
+    """Numbers of the lines of a text that can open a section or a code fence."""
+    if first_line.lstrip().startswith(_CANDIDATE_MARKERS):
+        yield 0
+    number = position = 0
+    for match in _CANDIDATE_LINE.finditer(text):
+        number += text.count("\n", position, match.start() + 1)
+        position = match.start() + 1
+        yield number
+
+
+def open_fence(text: str) -> Optional[str]:
+    """The marker of the code fence left open at the end of a text, or None."""
+    fence = None
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith(_FENCES):
+            fence = None if fence else stripped[:3]
+    return fence
+
+
+def _closes_open_fence(stripped: str) -> bool:
+    """
+    Whether a line ends a code fence left open, e.g. by a response cut short.
+    
+    Old articles cut responses inside code blocks without closing them, so
+    the truncation note and the next "##" header end the fence. "#" lines
+    don't: inside code they are usually shell or Python comments.
+    """
+    return stripped.startswith(RESPONSE_TRUNCATED) or (stripped.startswith("##") and not stripped.startswith("###"))
+
+
+def keyword_tags(text: str) -> FrozenSet[str]:
+    """SECTION_KEYWORDS occurring in a text (case-insensitive)."""
+    upper = text.upper()
+    return frozenset(keyword for keyword in SECTION_KEYWORDS if keyword in upper)
+
+
+def normalize_title(title: str) -> str:
+    """Upper-case title without emphasis markers, trailing colon or repeated whitespace."""
+    return " ".join(title.strip("*_ \t").rstrip(":").split()).upper()
+
+
+@lru_cache(maxsize=4096)
+def _title_key(title: str) -> Tuple[str, FrozenSet[str]]:
+    """Normalized name and tags of a title (syntheses repeat their titles a lot)."""
+    return normalize_title(title), keyword_tags(title)
+
+
+@dataclass
+class Section:
+    """A header and the lines up to the next header."""
+    title: str  # Header text without the leading '#'s
+    name: str  # normalize_title(title)
+    level: int  # Number of '#'s (BOLD_HEADER_LEVEL for "**Title**" lines)
+    line: int  # Line number of the header
+    tags: FrozenSet[str]  # SECTION_KEYWORDS in the title
+    lines: List[str] = field(default_factory=list)
+    children: List["Section"] = field(default_factory=list)
+    
+    @property
+    def content(self) -> str:
+        """The section's own text, without the header and without subsections."""
+        return "\n".join(self.lines)
+
+
+class SectionIndex:
+    """
+    The sections of a Markdown document, found in one pass over its text.
+    
+    Headers are "#" lines and, with ``bold_headers``, lines that are entirely
+    "**bold**"; lines inside fenced code blocks are never headers. A fence
+    still open at a "##" header or a truncated response's note ends there
+    (see _closes_open_fence), so a response cut inside a code block doesn't
+    hide the rest of the document. Sections
+    are kept in document order, as a tree by header level, by normalized
+    name and by keyword tag, so lookups while rendering a document don't
+    rescan its text. Section bodies are slices of ``lines``.
+    """
+    
+    def __init__(self, text: str, bold_headers: bool = True, min_level: int = 1):
+        """
+        Index a document.
+        
+        Args:
+            text: Markdown text
+            bold_headers: Whether whole-line "**bold**" text starts a section
+            min_level: Fewest '#'s of a header (2 leaves "# Title" lines as text)
+        """
+        self.text = text
+        self.lines = text.split("\n")
+        self.sections: List[Section] = []
+        self.roots: List[Section] = []
+        # By normalized name; a repeated name maps to its last section
+        self.named: Dict[str, Section] = {}
+        self._first_lines: Dict[str, Optional[int]] = {}
+        self._upper: Optional[str] = None
+        
+        parents: List[Section] = []
+        in_fence = False
+        for number in _candidate_lines(text, self.lines[0]):
+            stripped = self.lines[number].strip()
+            if in_fence and _closes_open_fence(stripped):
+                in_fence = False
+            elif stripped.startswith(_FENCES):
+                in_fence = not in_fence
+            if in_fence:
+                continue
+            section = self._header(stripped, number, bold_headers, min_level)
+            if section is None:
+                continue
+            
+            while parents and parents[-1].level >= section.level:
+                parents.pop()
+            (parents[-1].children if parents else self.roots).append(section)
+            parents.append(section)
+            self.sections.append(section)
+            self.named[section.name] = section
+        
+        ends = [section.line for section in self.sections[1:]] + [len(self.lines)]
+        for section, end in zip(self.sections, ends):
+            section.lines = self.lines[section.line + 1:end]
+        # Lines before the first header
+        self.preamble = self.lines[:self.sections[0].line] if self.sections else list(self.lines)
+    
+    def _header(self, stripped: str, number: int, bold_headers: bool, min_level: int) -> Optional[Section]:
+        if stripped.startswith("#" * min_level):
+            title = stripped.lstrip("#")
+            level = len(stripped) - len(title)
+            title = title.strip()
+        elif bold_headers and len(stripped) > 4 and stripped.startswith("**") and stripped.endswith("**"):
+            title = stripped
+            level = BOLD_HEADER_LEVEL
+        else:
+            return None
+        name, tags = _title_key(title)
+        return Section(title, name, level, number, tags)
+    
+    def get(self, *names: str) -> Optional[Section]:
+        """The section of the first of these normalized names the document has."""
+        for name in names:
+            if name in self.named:
+                return self.named[name]
+        return None
+    
+    def content(self, *names: str) -> str:
+        """Text of the first of these sections the document has ("" if none)."""
+        section = self.get(*names)
+        return section.content if section is not None else ""
+    
+    def tagged(self, *tags: str, unique: bool = False) -> List[Section]:
+        """
+        Sections whose titles contain any of these keywords, in document order.
+        
+        Args:
+            unique: Only the section each name maps to in ``named``
+        """
+        sections = self.named.values() if unique else self.sections
+        return [section for section in sections if not section.tags.isdisjoint(tags)]
+    
+    def _first_line(self, keyword: str) -> Optional[int]:
+        """First line of the document containing a keyword, searched once and cached."""
+        if keyword not in self._first_lines:
+            if self._upper is None:
+                self._upper = self.text.upper()
+            position = self._upper.find(keyword)
+            # Upper-casing never adds newlines, so counting them gives the line
+            self._first_lines[keyword] = self._upper.count("\n", 0, position) if position != -1 else None
+        return self._first_lines[keyword]
+    
+    def mentions(self, *keywords: str) -> bool:
+        """Whether any of these keywords occurs anywhere in the document (case-insensitive)."""
+        return any(self._first_line(keyword) is not None for keyword in keywords)
+    
+    def first_line(self, *keywords: str) -> Optional[int]:
+        """Number of the first line containing any of these keywords (case-insensitive)."""
+        numbers = [number for number in map(self._first_line, keywords) if number is not None]
+        return min(numbers) if numbers else None
@@ -0,0 +1,142 @@
+"""Persistent, content-addressed cache of agent responses."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from typing import Dict, Optional
+
+from agents import AgentResponse
+from config import Config
+
+
+class CacheMissError(LookupError):
+    """Raised in replay mode when a call is not in the cache."""
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of successful agent responses.
+    
+    Entries are keyed on a hash of everything that determines a completion
+    (provider, model, temperature, max_tokens, system prompt and user prompt),
+    so byte-identical requests are served locally instead of re-paying the
+    provider. Entries older than ``max_age_days`` are evicted, and the least
+    recently used entries go once the cache holds more than ``max_entries``.
+    Safe to share between threads.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_age_days: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Open (or create) a response cache.
+        
+        Args:
+            path: SQLite file (default: Config.CACHE_PATH)
+            max_age_days: Evict entries older than this (default: Config.CACHE_MAX_AGE_DAYS, 0 = never)
+            max_entries: Keep at most this many entries (default: Config.CACHE_MAX_ENTRIES, 0 = unlimited)
+        """
+        self.path = path or Config.CACHE_PATH
+        self.max_age_days = Config.CACHE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        self.max_entries = Config.CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                provider TEXT,
+                model TEXT,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                payload TEXT NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON responses(last_used)")
+        self._conn.commit()
+        self.evict()
+    
+    @staticmethod
+    def make_key(request: Dict) -> str:
+        """Hash a request description (see BaseAgent.request_fingerprint)."""
+        encoded = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[AgentResponse]:
+        """Return the cached response for a key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        
+        response = AgentResponse(**json.loads(row[0]))
+        response.metadata = {**(response.metadata or {}), "cached": True}
+        return response
+    
+    def put(self, key: str, response: AgentResponse, provider: Optional[str] = None):
+        """Store a successful response."""
+        payload = json.dumps(asdict(response), ensure_ascii=False, default=str)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, model, created_at, last_used, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, response.model, now, now, payload)
+            )
+            self._conn.commit()
+            self._writes += 1
+            evict_now = self._writes % 100 == 0
+        
+        if evict_now:
+            self.evict()
+    
+    def evict(self) -> int:
+        """Apply the age and size limits. Returns the number of evicted entries."""
+        removed = 0
+        with self._lock:
+            if self.max_age_days:
+                cutoff = time.time() - self.max_age_days * 86400
+                removed += self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (cutoff,)
+                ).rowcount
+            if self.max_entries:
+                removed += self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+            self._conn.commit()
+        return removed
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this process and the number of stored entries."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
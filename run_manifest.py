@@ -0,0 +1,134 @@
+"""Manifest of tech-watch runs: what each topic was debated with, and where its results are."""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from artifacts import atomic_write
+
+# Bumped when the file layout changes; older manifests are refused
+MANIFEST_VERSION = 1
+
+# What a later run does with a topic whose results are still fresh: skip
+# it, or write a new synthesis of its saved rounds
+REUSE_POLICIES = ("skip", "resynthesize")
+
+
+def topic_hash(topic_config: Dict) -> str:
+    """Hash of what a topic's debate depends on: its question (whitespace aside), models and rounds."""
+    key = {
+        "question": " ".join(topic_config["question"].split()),
+        "models": topic_config["models"],
+        "rounds": topic_config["rounds"]
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class RunManifest:
+    """
+    The latest debate of each tech-watch topic, kept across runs in a JSON file.
+    
+    Each topic's entry holds the hash of its configuration, when its debate
+    finished, its run_research record and the files its results were saved
+    to. A resynthesis keeps the debate's completion time (its rounds are
+    no newer) and adds when it was written as "resynthesized". A later run reuses the entry instead of debating again while the
+    topic's hash is unchanged, the files still exist and the results are
+    younger than the freshness TTL. The file is rewritten atomically after
+    every update, so topics finished before a crash are not debated again.
+    Safe to share between threads.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Start an empty manifest (see load()).
+        
+        Args:
+            path: JSON file the manifest is saved to
+        """
+        self.path = str(path)
+        self.topics: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def load(cls, path: str) -> "RunManifest":
+        """
+        Load a manifest; a missing file gives an empty one.
+        
+        Raises:
+            ValueError: If the file is not a manifest this version can read
+        """
+        manifest = cls(path)
+        try:
+            with open(manifest.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot read run manifest {path}: {e}") from e
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Not a version {MANIFEST_VERSION} run manifest: {path}")
+        manifest.topics = data.get("topics", {})
+        return manifest
+    
+    def fresh(self, topic_config: Dict, ttl_days: float, now: Optional[datetime] = None) -> Optional[Dict]:
+        """
+        The entry of a topic whose saved results can be reused, or None.
+        
+        Args:
+            topic_config: The topic as configured for this run
+            ttl_days: How long results stay fresh (0 = never reused)
+            now: Reference time (default: now)
+        """
+        if ttl_days <= 0:
+            return None
+        with self._lock:
+            entry = self.topics.get(topic_config["name"])
+        if entry is None or entry.get("hash") != topic_hash(topic_config):
+            return None
+        completed = datetime.fromisoformat(entry["completed"])
+        if (now or datetime.now()) - completed >= timedelta(days=ttl_days):
+            return None
+        artifacts = entry.get("artifacts") or {}
+        if "results" not in artifacts or not all(os.path.exists(path) for path in artifacts.values()):
+            return None
+        return entry
+    
+    def record(self, topic_config: Dict, record: Dict):
+        """
+        Save the debate a topic just finished (only successful debates are worth reusing).
+        
+        Args:
+            topic_config: The topic as configured for this run
+            record: run_research's record, its "artifacts" included. A
+                   record with "resynthesized_from" (the reused debate's
+                   completion time) stays as fresh as that debate.
+        """
+        if record.get("status") != "success":
+            return
+        now = datetime.now().isoformat()
+        entry = {
+            "hash": topic_hash(topic_config),
+            "category": topic_config["category"],
+            "completed": record.get("resynthesized_from") or now,
+            "record": {key: value for key, value in record.items() if key != "artifacts"},
+            "artifacts": dict(record.get("artifacts", {}))
+        }
+        if record.get("resynthesized_from"):
+            entry["resynthesized"] = now
+        with self._lock:
+            self.topics[topic_config["name"]] = entry
+            self._save()
+    
+    def _save(self):
+        """Write the manifest file (called with the lock held)."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "updated": datetime.now().isoformat(),
+            "topics": self.topics
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        atomic_write(self.path, json.dumps(data, indent=2, ensure_ascii=False))
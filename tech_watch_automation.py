@@ -2,26 +2,38 @@
 Tech Watch Automation - Python Script
 
 This script automates technology monitoring by running scheduled
-debates on various technology topics and organizing the results.
+debates on various technology topics and saving the results by category.
 
 Usage:
     python tech_watch_automation.py
+    python tech_watch_automation.py --concurrency 4
+    python tech_watch_automation.py --ttl-days 45
 
 Customize:
     - Modify RESEARCH_TOPICS to add your topics
     - Adjust models and rounds per topic
     - Set output directory structure
+    - Run topics concurrently (TECH_WATCH_CONCURRENCY, TECH_WATCH_PROVIDER_LIMITS)
+    - Reuse unchanged topics' recent results (TECH_WATCH_TTL_DAYS, TECH_WATCH_REUSE)
 """
 
 import os
 import sys
 import json
+import argparse
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from main import create_council
+from agents.usage import UsageLedger
+from artifacts import get_artifact_writer
+from batch import BatchJob, BatchScheduler, slot_providers
+from config import Config
+from council import DebateResult
+from run_manifest import REUSE_POLICIES, RunManifest
 
 # ===== Configuration =====
 
@@ -30,6 +42,13 @@ OUTPUT_BASE = Path("tech-watch")
 CURRENT_MONTH = datetime.now().strftime("%Y-%m")
 OUTPUT_DIR = OUTPUT_BASE / CURRENT_MONTH
 
+# Latest debate of each topic across runs (see run_manifest.RunManifest)
+MANIFEST_PATH = OUTPUT_BASE / "manifest.json"
+
+# Spend cap for the whole run in USD (0 = unlimited); each debate is also
+# capped by BUDGET_USD
+BATCH_LEDGER = UsageLedger(Config.BATCH_BUDGET_USD)
+
 # Research topics configuration
 RESEARCH_TOPICS = [
     {
@@ -129,83 +148,224 @@ def setup_directories():
     print(f"[OK] Output directory: {OUTPUT_DIR}")
     print()
 
-def run_research(topic_config):
-    """Run research debate for a single topic."""
-    print("=" * 70)
-    print(f"RESEARCHING: {topic_config['name']}")
-    print("=" * 70)
-    print()
+def run_research(topic_config, verbose=True, reuse=None):
+    """
+    Run research debate for a single topic.
+    
+    With verbose=False nothing is printed, so topics can run concurrently;
+    the returned record is the same either way. ``reuse`` is the manifest
+    entry of the topic's previous debate to write a new synthesis of
+    instead of debating again.
+    """
+    if verbose:
+        print("=" * 70)
+        print(f"RESEARCHING: {topic_config['name']}")
+        print("=" * 70)
+        print()
+    
+    remaining = BATCH_LEDGER.remaining()
+    if remaining is not None and remaining <= 0:
+        if verbose:
+            print("[SKIPPED] Batch budget exhausted")
+            print()
+        return {
+            "status": "error",
+            "topic": topic_config["name"],
+            "category": topic_config["category"],
+            "error": "Batch budget exhausted",
+            "timestamp": datetime.now().isoformat()
+        }
     
     try:
         # Create council with specified models
-        council = create_council(topic_config["models"])
+        # Results are saved straight into the topic's category folder
+        council = create_council(
+            topic_config["models"],
+            ledger=BATCH_LEDGER,
+            output_dir=str(OUTPUT_DIR / topic_config["category"]),
+            verbose=verbose
+        )
         
-        print(f"Models: {', '.join(topic_config['models'])}")
-        print(f"Rounds: {topic_config['rounds']}")
-        print()
+        if verbose:
+            print(f"Models: {', '.join(topic_config['models'])}")
+            print(f"Rounds: {topic_config['rounds']}")
+            print()
         
-        # Run debate
-        result = council.debate(
-            topic=topic_config["question"].strip(),
-            rounds=topic_config["rounds"],
-            save_results=True,
-            save_markdown=True
-        )
+        previous = None
+        if reuse is not None:
+            try:
+                previous = DebateResult.load(reuse["artifacts"]["results"])
+            except (OSError, ValueError, KeyError) as e:
+                if verbose:
+                    print(f"[WARNING] Cannot load previous results, debating again: {e}")
+                    print()
         
-        print()
-        print("[SUCCESS] Research completed!")
-        print(f"  - Tokens: {result.total_tokens:,}")
-        print(f"  - Cost: $0.00 (FREE!)")
-        print()
+        if previous is not None:
+            # Only the synthesis is written again
+            result = council.resynthesize(previous, save_results=True, save_markdown=True)
+        else:
+            # Run debate
+            result = council.debate(
+                topic=topic_config["question"].strip(),
+                rounds=topic_config["rounds"],
+                save_results=True,
+                save_markdown=True
+            )
         
-        return {
+        if verbose:
+            print()
+            print("[SUCCESS] Research completed!")
+            print(f"  - Tokens: {result.total_tokens:,}")
+            print(f"  - Cost: ${result.cost_usd:.4f}")
+            if result.stop_reason:
+                print(f"  - Stopped early: {result.stop_reason}")
+            print()
+        
+        record = {
             "status": "success",
             "topic": topic_config["name"],
             "category": topic_config["category"],
             "tokens": result.total_tokens,
+            "cost_usd": result.cost_usd,
+            "rounds": len(result.rounds),
+            "stop_reason": result.stop_reason,
+            "artifacts": result.artifacts,
             "timestamp": datetime.now().isoformat()
         }
+        if previous is not None:
+            record["resynthesized_from"] = reuse["completed"]
+        return record
         
     except Exception as e:
-        print(f"[ERROR] Research failed: {e}")
-        print()
+        if verbose:
+            print(f"[ERROR] Research failed: {e}")
+            print()
         return {
             "status": "error",
             "topic": topic_config["name"],
+            "category": topic_config["category"],
             "error": str(e),
             "timestamp": datetime.now().isoformat()
         }
 
-def organize_results():
-    """Organize generated files into category folders."""
-    print("Organizing results...")
+def reused_record(topic_config, entry):
+    """Record of a topic whose fresh results from an earlier run are kept as they are."""
+    previous = entry["record"]
+    return {
+        "status": "reused",
+        "topic": topic_config["name"],
+        "category": topic_config["category"],
+        "rounds": previous.get("rounds"),
+        "stop_reason": previous.get("stop_reason"),
+        "artifacts": entry["artifacts"],
+        "reused_from": entry["completed"],
+        "timestamp": datetime.now().isoformat()
+    }
+
+def run_topics(topics, concurrency=None, manifest=None, ttl_days=None, reuse=None):
+    """
+    Run the research debates of a batch of topics, concurrently when allowed.
     
-    # Get all generated files from current directory
-    json_files = list(Path(".").glob("debate_*.json"))
-    md_files = list(Path(".").glob("article_*.md"))
+    Up to ``concurrency`` topics (default: TECH_WATCH_CONCURRENCY) run at
+    once, within the per-provider caps of TECH_WATCH_PROVIDER_LIMITS.
+    Concurrent debates run quietly and a line is printed as each topic
+    starts and finishes instead.
     
-    moved_count = 0
+    With a ``manifest``, a topic whose question, models and rounds are
+    unchanged since its last debate, less than ``ttl_days`` ago (default:
+    TECH_WATCH_TTL_DAYS), is not debated again: ``reuse`` (default:
+    TECH_WATCH_REUSE) "skip" keeps its results, "resynthesize" only writes
+    a new synthesis of its saved rounds. Finished debates are recorded in
+    the manifest as they complete.
     
-    for file in json_files + md_files:
-        # Try to match with a topic category
-        for topic in RESEARCH_TOPICS:
-            # Move to category folder
-            dest = OUTPUT_DIR / topic["category"] / file.name
-            file.rename(dest)
-            moved_count += 1
-            print(f"  Moved: {file.name} -> {topic['category']}/")
-            break
+    Returns:
+        run_research's records (reused_record's for skipped topics), in topic order
+    """
+    ttl_days = Config.TECH_WATCH_TTL_DAYS if ttl_days is None else ttl_days
+    reuse = reuse or Config.TECH_WATCH_REUSE
+    if reuse not in REUSE_POLICIES:
+        raise ValueError(f"Unknown reuse policy '{reuse}'. Use one of: {', '.join(REUSE_POLICIES)}")
     
-    print(f"[OK] Moved {moved_count} files")
-    print()
+    records = [None] * len(topics)
+    entries = [manifest.fresh(topic, ttl_days) if manifest is not None else None for topic in topics]
+    pending = []
+    for index, (topic, entry) in enumerate(zip(topics, entries)):
+        if entry is not None and reuse == "skip":
+            records[index] = reused_record(topic, entry)
+        else:
+            pending.append(index)
+    
+    reused = [topics[index]["name"] for index, entry in enumerate(entries) if entry is not None]
+    if reused:
+        action = "Keeping" if reuse == "skip" else "Synthesizing again"
+        print(f"{action} results younger than {ttl_days:g} days: {', '.join(reused)}")
+        print()
+    
+    scheduler = BatchScheduler(concurrency)
+    concurrent = scheduler.concurrency > 1 and len(pending) > 1
+    
+    def research(topic, entry):
+        record = run_research(topic, verbose=not concurrent, reuse=entry)
+        if manifest is not None:
+            manifest.record(topic, record)
+        return record
+    
+    jobs = [
+        BatchJob(topics[index]["name"], slot_providers(topics[index]["models"]), partial(research, topics[index], entries[index]))
+        for index in pending
+    ]
+    
+    def report_start(job, progress):
+        if not concurrent:
+            print(f"\n[{progress.started}/{progress.total}] ", end="")
+            return
+        print(
+            f"[{progress.started}/{progress.total}] Started {job.name} "
+            f"(running: {len(progress.running)}, queued: {progress.queued})"
+        )
+    
+    def report_finish(job, record, seconds, progress):
+        if not concurrent:
+            return
+        elapsed = f"{int(seconds) // 60}m{int(seconds) % 60:02d}s"
+        if record["status"] == "success":
+            outcome = f"done in {elapsed}, {record['tokens']:,} tokens, ${record['cost_usd']:.4f}"
+        else:
+            outcome = f"failed after {elapsed}: {record['error']}"
+        print(f"[{progress.finished}/{progress.total} finished] {job.name} {outcome}")
+        if progress.running:
+            print(f"    Running: {', '.join(progress.running)}")
+    
+    if concurrent:
+        print(f"Running up to {scheduler.concurrency} topics at once")
+        if scheduler.provider_limits:
+            limits = ", ".join(f"{provider}={count}" for provider, count in scheduler.provider_limits.items())
+            print(f"Provider limits: {limits}")
+        print()
+    
+    for index, record in zip(pending, scheduler.run(jobs, on_start=report_start, on_finish=report_finish)):
+        records[index] = record
+    return records
+
+def artifact_paths(results):
+    """Files the topics' results are in (reused ones included), by category."""
+    by_category = {}
+    for result in results:
+        paths = by_category.setdefault(result.get("category", "uncategorized"), [])
+        paths.extend(result.get("artifacts", {}).values())
+    return by_category
 
 def generate_summary(results):
     """Generate summary report."""
     summary_file = OUTPUT_DIR / f"summary_{CURRENT_MONTH}.md"
     
     success_count = sum(1 for r in results if r["status"] == "success")
-    error_count = len(results) - success_count
+    reused_count = sum(1 for r in results if r["status"] == "reused")
+    error_count = len(results) - success_count - reused_count
     total_tokens = sum(r.get("tokens", 0) for r in results if r["status"] == "success")
+    # Includes spend of debates that failed part-way
+    total_cost = BATCH_LEDGER.spent
+    budget = f" of ${BATCH_LEDGER.budget_usd:.2f} budget" if BATCH_LEDGER.budget_usd else ""
     
     summary_content = f"""# Tech Watch Summary - {CURRENT_MONTH}
 
@@ -215,9 +375,10 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
 - **Topics Researched**: {len(results)}
 - **Successful**: {success_count}
+- **Reused**: {reused_count}
 - **Failed**: {error_count}
 - **Total Tokens**: {total_tokens:,}
-- **Total Cost**: $0.00 (100% FREE)
+- **Total Cost**: ${total_cost:.4f}{budget}
 
 ## Topics
 
@@ -234,10 +395,18 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
     for category, topics in sorted(by_category.items()):
         summary_content += f"\n### {category.title()}\n\n"
         for topic in topics:
-            status_icon = "✅" if topic["status"] == "success" else "❌"
+            status_icon = {"success": "✅", "reused": "♻️"}.get(topic["status"], "❌")
             summary_content += f"- {status_icon} **{topic['topic']}**\n"
             if topic["status"] == "success":
                 summary_content += f"  - Tokens: {topic.get('tokens', 0):,}\n"
+                summary_content += f"  - Cost: ${topic.get('cost_usd', 0):.4f}\n"
+                if topic.get("resynthesized_from"):
+                    summary_content += f"  - Synthesis of the debate from: {topic['resynthesized_from'][:10]}\n"
+                if topic.get("stop_reason"):
+                    summary_content += f"  - Stopped early: {topic['stop_reason']}\n"
+            elif topic["status"] == "reused":
+                summary_content += f"  - Reused results from: {topic['reused_from'][:10]}\n"
+                summary_content += f"  - Results: {topic['artifacts']['results']}\n"
             else:
                 summary_content += f"  - Error: {topic.get('error', 'Unknown')}\n"
     
@@ -249,15 +418,15 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 {OUTPUT_DIR}/
 """
     
-    for category in sorted(by_category.keys()):
+    for category, paths in sorted(artifact_paths(results).items()):
         summary_content += f"├── {category}/\n"
-        category_dir = OUTPUT_DIR / category
-        if category_dir.exists():
-            files = list(category_dir.glob("*"))
-            for i, file in enumerate(sorted(files)):
-                prefix = "└──" if i == len(files) - 1 else "├──"
-                summary_content += f"│   {prefix} {file.name}\n"
+        # Reused results may be in an earlier month's folder
+        files = sorted(os.path.relpath(path, OUTPUT_DIR / category) for path in paths)
+        for i, file in enumerate(files):
+            prefix = "└──" if i == len(files) - 1 else "├──"
+            summary_content += f"│   {prefix} {file}\n"
     
+    models = ", ".join(sorted({model for topic in RESEARCH_TOPICS for model in topic["models"]}))
     summary_content += f"""```
 
 ## Next Steps
@@ -270,7 +439,7 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 ---
 
 **Generated by LLM Council** 🚀
-Cost: $0.00 | Models: DeepSeek-Coder, Llama 3.1, Mistral, Gemini
+Cost: ${total_cost:.4f} | Models: {models}
 """
     
     summary_file.write_text(summary_content, encoding="utf-8")
@@ -279,6 +448,32 @@ Cost: $0.00 | Models: DeepSeek-Coder, Llama 3.1, Mistral, Gemini
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="LLM Council - Tech Watch Automation")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Topics to debate at once (default: TECH_WATCH_CONCURRENCY)"
+    )
+    parser.add_argument(
+        "--ttl-days",
+        type=float,
+        default=None,
+        help="Reuse unchanged topics debated less than this many days ago, 0 = never (default: TECH_WATCH_TTL_DAYS)"
+    )
+    parser.add_argument(
+        "--reuse",
+        choices=REUSE_POLICIES,
+        default=None,
+        help="What to do with fresh topics: keep their results or only synthesize again (default: TECH_WATCH_REUSE)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Debate every topic again, fresh or not"
+    )
+    args = parser.parse_args()
+    
     os.environ["PYTHONIOENCODING"] = "utf-8"
     
     print()
@@ -292,43 +487,47 @@ def main():
     
     # Setup
     setup_directories()
+    try:
+        manifest = RunManifest.load(MANIFEST_PATH)
+    except ValueError as e:
+        print(f"[WARNING] {e}; starting a new manifest")
+        print()
+        manifest = RunManifest(MANIFEST_PATH)
     
     # Run research for each topic
-    results = []
-    for i, topic in enumerate(RESEARCH_TOPICS, 1):
-        print(f"\n[{i}/{len(RESEARCH_TOPICS)}] ", end="")
-        result = run_research(topic)
-        results.append(result)
-        
-        # Small delay between topics
-        if i < len(RESEARCH_TOPICS):
-            import time
-            print("Waiting 5 seconds before next topic...\n")
-            time.sleep(5)
+    ttl_days = 0 if args.force else args.ttl_days
+    results = run_topics(RESEARCH_TOPICS, args.concurrency, manifest, ttl_days, args.reuse)
     
-    # Organize results
-    organize_results()
+    # Files of the last debates may still be written (BACKGROUND_WRITES)
+    try:
+        get_artifact_writer().wait()
+    except Exception as e:
+        print(f"[WARNING] Saving results failed: {e}")
+        print()
     
     # Generate summary
     generate_summary(results)
     
     # Final summary
     success_count = sum(1 for r in results if r["status"] == "success")
-    error_count = len(results) - success_count
+    reused_count = sum(1 for r in results if r["status"] == "reused")
+    error_count = len(results) - success_count - reused_count
     
     print("=" * 70)
     print("  TECH WATCH COMPLETE!")
     print("=" * 70)
     print()
     print(f"[OK] Successful: {success_count}")
+    print(f"[OK] Reused: {reused_count}")
     print(f"[X] Failed: {error_count}")
     print()
     print(f"Results: {OUTPUT_DIR}")
     print()
     
     # List files
-    json_count = len(list(OUTPUT_DIR.rglob("*.json")))
-    md_count = len(list(OUTPUT_DIR.rglob("*.md")))
+    paths = [path for category_paths in artifact_paths(results).values() for path in category_paths]
+    json_count = sum(1 for path in paths if ".json" in os.path.basename(path))
+    md_count = sum(1 for path in paths if path.endswith(".md"))
     
     print("Generated files:")
     print(f"  - JSON: {json_count}")